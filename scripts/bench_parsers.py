@@ -0,0 +1,250 @@
+"""Benchmark datetime parsing strategies in `logic.parsers`.
+
+Generates synthetic string columns (ISO, US, EU, mixed and dirty layouts),
+times each parsing strategy on them and writes the results as JSON, so runs
+from different commits can be compared. Everything is generated locally;
+no network access or data files are needed.
+
+Columns are generated once in the parent and written to Arrow IPC files.
+Each case runs in a fresh process that only imports the parsers and reads
+its column, so the reported peak memory (max RSS growth while parsing) is
+not hidden by the allocations made while generating the input.
+
+Usage:
+    python scripts/bench_parsers.py --rows 1e4 1e5 1e6 --output bench.json
+    python scripts/bench_parsers.py --kinds iso dirty --strategies vectorized
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import datetime
+import json
+import multiprocessing
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import resource
+except Exception:  # pragma: no cover - not available on Windows
+    resource = None
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import polars as pl  # noqa: E402
+
+KINDS = ["iso", "us", "eu", "mixed", "dirty"]
+STRATEGIES = ["auto", "vectorized", "coalesce", "python"]
+KIND_FORMATS = {
+    "iso": "%Y-%m-%d %H:%M:%S",
+    "us": "%m/%d/%Y %H:%M",
+    "eu": "%d-%m-%Y %H:%M",
+}
+# Timestamps are spread over 2000-01-01 .. ~2030 with a multiplicative hash
+# of the row index, so every run generates the same column for a seed.
+_START = int(datetime.datetime(2000, 1, 1).timestamp())
+_SPAN_SECONDS = 30 * 365 * 24 * 3600
+_HASH_MULTIPLIER = 2654435761
+# The Python fallback is far slower than the rest; skip it on big columns
+DEFAULT_PYTHON_MAX_ROWS = 1_000_000
+
+
+def generate_column(kind: str, rows: int, seed: int = 0) -> pl.Series:
+    """Return a deterministic Utf8 column of `rows` timestamps in layout `kind`."""
+    index = pl.int_range(0, rows, dtype=pl.Int64, eager=True)
+    seconds = (index * _HASH_MULTIPLIER + seed) % _SPAN_SECONDS + _START
+    timestamps = pl.from_epoch(seconds, time_unit="s")
+    frame = pl.DataFrame({"i": index, "ts": timestamps})
+
+    if kind in KIND_FORMATS:
+        expr = pl.col("ts").dt.strftime(KIND_FORMATS[kind])
+    elif kind == "mixed":
+        expr = (
+            pl.when(pl.col("i") % 3 == 0)
+            .then(pl.col("ts").dt.strftime(KIND_FORMATS["iso"]))
+            .when(pl.col("i") % 3 == 1)
+            .then(pl.col("ts").dt.strftime(KIND_FORMATS["us"]))
+            .otherwise(pl.col("ts").dt.strftime(KIND_FORMATS["eu"]))
+        )
+    elif kind == "dirty":
+        # ISO values with padding, blanks, nulls and garbage sprinkled in
+        iso = pl.col("ts").dt.strftime(KIND_FORMATS["iso"])
+        expr = (
+            pl.when(pl.col("i") % 50 == 7)
+            .then(pl.lit("n/a"))
+            .when(pl.col("i") % 50 == 19)
+            .then(pl.lit(""))
+            .when(pl.col("i") % 50 == 31)
+            .then(pl.lit(None, dtype=pl.Utf8))
+            .when(pl.col("i") % 10 == 3)
+            .then(pl.lit(" ") + iso + pl.lit(" "))
+            .otherwise(iso)
+        )
+    else:
+        raise ValueError(f"Unknown column kind: {kind}")
+    return frame.select(expr.alias(kind)).to_series()
+
+
+def run_strategy(strategy: str, series: pl.Series) -> pl.Series:
+    from logic import parsers
+
+    if strategy == "auto":
+        return parsers.convert_series_to_datetime(series)
+    if strategy == "vectorized":
+        return parsers.parse_datetime_with_report(series)[0]
+    if strategy == "coalesce":
+        return parsers._coalesce_formats_parse(series)
+    if strategy == "python":
+        return parsers._apply_python_fallback_parsing(series, None)
+    raise ValueError(f"Unknown strategy: {strategy}")
+
+
+def _max_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_case(kind: str, rows: int, strategy: str, repeat: int, path: str) -> dict:
+    """Read the column written to `path` and time `strategy` on it (best of `repeat`)."""
+    import logic.parsers  # noqa: F401  # keep import cost out of the memory figure
+
+    series = pl.read_ipc(path, memory_map=False).to_series()
+    rss_before = _max_rss_bytes()
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run_strategy(strategy, series)
+        timings.append(time.perf_counter() - start)
+    rss_after = _max_rss_bytes()
+
+    best = min(timings)
+    parsed = 0
+    if result is not None and result.dtype == pl.Datetime:
+        parsed = len(result) - result.null_count()
+    return {
+        "kind": kind,
+        "rows": rows,
+        "strategy": strategy,
+        "seconds": best,
+        "seconds_all": timings,
+        "rows_per_s": rows / best if best > 0 else None,
+        "peak_memory_bytes": (
+            rss_after - rss_before if rss_before is not None and rss_after is not None else None
+        ),
+        "peak_rss_bytes": rss_after,
+        "parsed_rows": parsed,
+    }
+
+
+def _metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=SRC_DIR.parent,
+        ).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "polars": pl.__version__,
+        "platform": platform.platform(),
+        "cpu_count": multiprocessing.cpu_count(),
+    }
+
+
+def run_benchmarks(
+    kinds: list[str],
+    rows_list: list[int],
+    strategies: list[str],
+    repeat: int = 3,
+    seed: int = 0,
+    python_max_rows: int = DEFAULT_PYTHON_MAX_ROWS,
+    isolate: bool = True,
+) -> dict:
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory(prefix="bench_parsers_") as tmp:
+        for rows in rows_list:
+            for kind in kinds:
+                path = str(Path(tmp) / f"{kind}_{rows}.arrow")
+                generate_column(kind, rows, seed).to_frame().write_ipc(path)
+                for strategy in strategies:
+                    if strategy == "python" and rows > python_max_rows:
+                        continue
+                    args = (kind, rows, strategy, repeat, path)
+                    if isolate:
+                        with concurrent.futures.ProcessPoolExecutor(
+                            max_workers=1, mp_context=context
+                        ) as pool:
+                            case = pool.submit(run_case, *args).result()
+                    else:
+                        case = run_case(*args)
+                    print(
+                        f"{kind:>6} {rows:>11,} {strategy:>10}: "
+                        f"{case['seconds']:.3f}s ({case['rows_per_s'] or 0:,.0f} rows/s)",
+                        file=sys.stderr,
+                    )
+                    results.append(case)
+                Path(path).unlink()
+    return {"meta": _metadata(), "results": results}
+
+
+def _row_count(text: str) -> int:
+    return int(float(text))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", nargs="+", type=_row_count, default=[10_000, 100_000, 1_000_000],
+        help="Column lengths, e.g. 1e4 1e6 1e8",
+    )
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=KINDS)
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=STRATEGIES)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--python-max-rows", type=_row_count, default=DEFAULT_PYTHON_MAX_ROWS,
+        help="Skip the Python fallback strategy above this many rows",
+    )
+    parser.add_argument(
+        "--no-isolate", action="store_true",
+        help="Run cases in this process (faster, but peak memory is not per case)",
+    )
+    parser.add_argument("--output", "-o", help="Write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        args.kinds,
+        args.rows,
+        args.strategies,
+        repeat=args.repeat,
+        seed=args.seed,
+        python_max_rows=args.python_max_rows,
+        isolate=not args.no_isolate,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
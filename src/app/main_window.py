@@ -16,22 +16,25 @@ from PyQt6.QtWidgets import (
     QDockWidget,
     QSizePolicy,
 )
-from PyQt6.QtGui import QAction, QFont
+from PyQt6.QtGui import QAction, QFont, QFontDatabase
 from PyQt6.QtCore import Qt, QPoint
 import importlib.util
 import polars as pl
 import os
 import time
 from logic.filters import apply_filter  # Import logic to apply filters to dataframe
-from logic.parsers import convert_series_to_datetime
+from logic.conversion import (
+    AUTO_DETECT,
+    TYPE_NAMES,
+    convert_columns_with_report,
+    failed_rows,
+    infer_conversion_targets,
+)
+from logic.parsers import FormatCache, default_format_cache_path
 from models.polars_table_model import PolarsTableModel  # Import the model class
 from app.widgets.edit_menu_gui import AddColumnDialog, MultiSortDialog
 from app.edit_menu_controller import add_column
-from logic.stats import (
-    generate_statistics,
-    get_column_statistics,
-    get_column_type_counts_string,
-)
+from logic.stats import generate_statistics
 import webbrowser
 from ai.validator import prepare_transformation_for_execution, TransformationValidationError
 from app.background_tasks import run_in_background
@@ -50,6 +53,10 @@ class MainWindow(QMainWindow):
         # Track temp files for cleanup on close
         self.temp_files = TempFileManager()
 
+        # Detected datetime formats persisted across sessions
+        self.current_file_path = None
+        self.format_cache = FormatCache(default_format_cache_path())
+
         self._createMenuBar()
 
         self.table_view = QTableView()
@@ -182,7 +189,13 @@ class MainWindow(QMainWindow):
         ml_message = "Install the '[ml]' extras to enable this feature."
         ml_available = self._optional_modules_available("numpy", "sklearn")
         self._set_action_state(self.featurize_action, ml_available, ml_message)
+        self._set_action_state(self.apply_pipeline_action, ml_available, ml_message)
         self._set_action_state(self.dim_action, ml_available, ml_message)
+        self._set_action_state(
+            self.corr_action,
+            self._optional_modules_available("numpy"),
+            "Install numpy to enable this feature.",
+        )
 
     def _createMenuBar(self):
         menu_bar = self.menuBar()
@@ -217,14 +230,30 @@ class MainWindow(QMainWindow):
         sort_columns_action.triggered.connect(self.handle_multi_sort)
         edit_menu.addAction(sort_columns_action)
 
+        # Batch type conversion action
+        convert_types_action = QAction("Convert Column Types...", self)
+        convert_types_action.triggered.connect(self.handle_batch_convert)
+        edit_menu.addAction(convert_types_action)
+
+        # Infer types of all text columns action
+        infer_types_action = QAction("Infer Types", self)
+        infer_types_action.triggered.connect(self.handle_infer_types)
+        edit_menu.addAction(infer_types_action)
+
         # Analysis menu
         analysis_menu = menu_bar.addMenu("Analysis")
         self.featurize_action = QAction("Featurize Columns...", self)
         self.featurize_action.triggered.connect(self.handle_featurize)
         analysis_menu.addAction(self.featurize_action)
+        self.apply_pipeline_action = QAction("Apply Feature Pipeline...", self)
+        self.apply_pipeline_action.triggered.connect(self.handle_apply_pipeline)
+        analysis_menu.addAction(self.apply_pipeline_action)
         self.dim_action = QAction("Dimensionality Reduction...", self)
         self.dim_action.triggered.connect(self.handle_dimensionality)
         analysis_menu.addAction(self.dim_action)
+        self.corr_action = QAction("Correlation Matrix...", self)
+        self.corr_action.triggered.connect(self.handle_correlation)
+        analysis_menu.addAction(self.corr_action)
         self.ai_action = QAction("AI Assistant...", self)
         self.ai_action.triggered.connect(self.handle_ai_assistant)
         analysis_menu.addAction(self.ai_action)
@@ -259,6 +288,7 @@ class MainWindow(QMainWindow):
                     )
                     return
 
+                self.current_file_path = os.path.abspath(file_path)
                 self.model = PolarsTableModel(df)
                 self.table_view.setModel(self.model)
                 self.table_view.resizeColumnsToContents()
@@ -400,7 +430,7 @@ class MainWindow(QMainWindow):
             self.model.drop_column(column_name)
             self.update_statistics()
         elif action == stats_col:
-            stats = get_column_statistics(self.model._data, column_name)
+            stats = self.model.get_column_statistics(column_name)
             QMessageBox.information(self, f"Statistics for {column_name}", stats)
         elif action == convert_type:
             self.handle_convert_type(column_name)
@@ -436,83 +466,35 @@ class MainWindow(QMainWindow):
         if not self.is_model_loaded():
             return
 
-        type_options = ["String", "Integer", "Float", "Boolean", "Date", "Datetime"]
         new_type, ok = QInputDialog.getItem(
             self,
             "Convert Column Type",
             f"Convert '{column_name}' to:",
-            type_options,
+            TYPE_NAMES,
             0,
             False,
         )
         if not ok:
             return
 
-        type_map = {
-            "String": pl.Utf8,
-            "Integer": pl.Int64,
-            "Float": pl.Float64,
-            "Boolean": pl.Boolean,
-            "Date": pl.Date,
-            "Datetime": pl.Datetime,
-        }
-
         try:
-            target_type = type_map[new_type]
-            column_expr = pl.col(column_name)
-            # If converting from string to date/datetime, use robust helper
-            if (
-                new_type in ["Date", "Datetime"]
-                and self.model._data.schema[column_name] == pl.Utf8
-            ):
-                start = time.perf_counter()
-                # This column was generated by the app and should parse cleanly;
-                # prefer the fast vectorized path and disable Python fallback.
-                converted_series = convert_series_to_datetime(
-                    self.model._data[column_name], allow_fallback=False
-                )
-                # If user selected Date, cast down to Date
-                if new_type == "Date":
-                    try:
-                        converted_series = converted_series.cast(pl.Date)
-                    except Exception:
-                        # best-effort: leave as-is
-                        pass
-                converted_df = self.model._data.with_columns(converted_series.alias(column_name))
-                elapsed = time.perf_counter() - start
-                logger.info(
-                    "Conversion of column '%s' to %s took %.2fs",
-                    column_name,
-                    new_type,
-                    elapsed,
-                )
-            else:
-                converted_df = self.model._data.with_columns(
-                    column_expr.cast(target_type).alias(column_name)
-                )
-            self.model.update_data(converted_df)
-            # Re-assign the model and refresh the view to re-read header data and types
-            try:
-                self.table_view.setModel(self.model)
-                # Force view refresh in case headers or displayed values are cached
-                self.table_view.reset()
-                header = self.table_view.horizontalHeader()
-                if header is not None:
-                    viewport = header.viewport()
-                    if viewport is not None:
-                        viewport.update()
-                table_viewport = self.table_view.viewport()
-                if table_viewport is not None:
-                    table_viewport.update()
-                # Adjust column sizes to reflect potential value width changes
-                self.table_view.resizeColumnsToContents()
-            except Exception:
-                logger.exception(
-                    "Failed to refresh table view after converting column '%s' to %s",
-                    column_name,
-                    new_type,
-                )
-            self.update_statistics()
+            start = time.perf_counter()
+            # Text to date/datetime goes through the vectorized parser (no Python
+            # fallback); other text casts dedupe repeated values.
+            converted_df, failures = convert_columns_with_report(
+                self.model._data,
+                {column_name: new_type},
+                format_cache=self.format_cache,
+                source=self.current_file_path,
+            )
+            self.format_cache.save()
+            logger.info(
+                "Conversion of column '%s' to %s took %.2fs",
+                column_name,
+                new_type,
+                time.perf_counter() - start,
+            )
+            self._apply_conversion(converted_df, failures)
         except Exception as e:
             QMessageBox.warning(
                 self,
@@ -520,6 +502,182 @@ class MainWindow(QMainWindow):
                 f"Could not convert '{column_name}' to {new_type}: {e}",
             )
 
+    def handle_batch_convert(self):
+        from app.widgets.convert_gui import BatchConvertDialog
+
+        if not self.is_model_loaded():
+            return
+
+        df = self.model.get_dataframe()
+        dialog = BatchConvertDialog(
+            {name: str(dtype) for name, dtype in df.schema.items()}, parent=self
+        )
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+
+        targets = dialog.get_targets()
+        auto_detect_text = dialog.get_options().get("auto_detect_text", False)
+        if not targets and not auto_detect_text:
+            QMessageBox.warning(self, "No columns", "Please select at least one column.")
+            return
+
+        format_cache = self.format_cache
+        source = self.current_file_path
+
+        def _task():
+            resolved = {
+                name: type_name
+                for name, type_name in targets.items()
+                if type_name != AUTO_DETECT
+            }
+            to_detect = [name for name, type_name in targets.items() if type_name == AUTO_DETECT]
+            if auto_detect_text:
+                to_detect += [
+                    name
+                    for name, dtype in df.schema.items()
+                    if dtype == pl.Utf8 and name not in targets
+                ]
+            resolved.update(infer_conversion_targets(df, to_detect))
+            start = time.perf_counter()
+            new_df, failures = convert_columns_with_report(
+                df, resolved, format_cache=format_cache, source=source
+            )
+            logger.info(
+                "Batch conversion of %d column(s) took %.2fs",
+                len(resolved),
+                time.perf_counter() - start,
+            )
+            return new_df, resolved, failures
+
+        self.statusBar().showMessage("Converting column types...")
+
+        def _success(result):
+            new_df, resolved, failures = result
+            self.format_cache.save()
+            if not resolved:
+                QMessageBox.information(
+                    self, "Convert Types", "No convertible columns were found."
+                )
+                return
+            # One update_data call keeps the whole batch a single undo step
+            self._apply_conversion(new_df, failures)
+
+        def _error(exc: Exception):
+            QMessageBox.warning(
+                self, "Conversion Error", f"Could not convert column types: {exc}"
+            )
+
+        run_in_background(
+            self,
+            _task,
+            _success,
+            _error,
+            lambda: self.statusBar().clearMessage(),
+        )
+
+    def handle_infer_types(self):
+        if not self.is_model_loaded():
+            return
+
+        df = self.model.get_dataframe()
+        format_cache = self.format_cache
+        source = self.current_file_path
+
+        def _task():
+            start = time.perf_counter()
+            targets = infer_conversion_targets(df)
+            new_df, failures = convert_columns_with_report(
+                df, targets, format_cache=format_cache, source=source
+            )
+            if failures:
+                # The sample looked convertible but the full column did not;
+                # keep those columns as text.
+                new_df = new_df.with_columns(df.select(list(failures)))
+                for name in failures:
+                    del targets[name]
+            logger.info(
+                "Inferred and converted %d column(s) in %.2fs (%d -> %d bytes)",
+                len(targets),
+                time.perf_counter() - start,
+                df.estimated_size(),
+                new_df.estimated_size(),
+            )
+            return new_df, targets
+
+        self.statusBar().showMessage("Inferring column types...")
+
+        def _success(result):
+            new_df, targets = result
+            self.format_cache.save()
+            if not targets:
+                QMessageBox.information(
+                    self, "Infer Types", "No text columns with a more specific type were found."
+                )
+                return
+            self.model.update_data(new_df)
+            self._refresh_table_view()
+            self.update_statistics()
+
+        def _error(exc: Exception):
+            QMessageBox.warning(self, "Infer Types Error", f"Could not infer column types: {exc}")
+
+        run_in_background(
+            self,
+            _task,
+            _success,
+            _error,
+            lambda: self.statusBar().clearMessage(),
+        )
+
+    def _apply_conversion(self, converted_df, failures):
+        """Apply a conversion, asking first when some values did not convert."""
+        if failures:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Warning)
+            box.setWindowTitle("Conversion Failures")
+            box.setText("Some values could not be converted:")
+            box.setInformativeText(
+                "\n".join(report.summary() for report in failures.values())
+            )
+            convert_button = box.addButton(
+                "Convert Anyway (failures become null)", QMessageBox.ButtonRole.AcceptRole
+            )
+            show_button = box.addButton("Show Failed Rows", QMessageBox.ButtonRole.ActionRole)
+            box.addButton(QMessageBox.StandardButton.Cancel)
+            box.exec()
+            clicked = box.clickedButton()
+            if clicked is show_button:
+                # Filter to the offending rows (undoable, like other filters)
+                self.model.update_data(failed_rows(self.model._data, failures))
+                self._refresh_table_view()
+                self.update_page_info()
+                self.update_statistics()
+                return
+            if clicked is not convert_button:
+                return
+        self.model.update_data(converted_df)
+        self._refresh_table_view()
+        self.update_statistics()
+
+    def _refresh_table_view(self):
+        # Re-assign the model and refresh the view to re-read header data and types
+        try:
+            self.table_view.setModel(self.model)
+            # Force view refresh in case headers or displayed values are cached
+            self.table_view.reset()
+            header = self.table_view.horizontalHeader()
+            if header is not None:
+                viewport = header.viewport()
+                if viewport is not None:
+                    viewport.update()
+            table_viewport = self.table_view.viewport()
+            if table_viewport is not None:
+                table_viewport.update()
+            # Adjust column sizes to reflect potential value width changes
+            self.table_view.resizeColumnsToContents()
+        except Exception:
+            logger.exception("Failed to refresh table view after converting column types")
+
     def generate_statistics(self):
         if not self.is_model_loaded():
             return
@@ -531,15 +689,19 @@ class MainWindow(QMainWindow):
             # Show the statistics in a new window
             self.show_statistics_window(stats_text)
 
-    def show_statistics_window(self, text):
+    def show_statistics_window(self, text, title="Dataset Statistics", monospace=False):
         dialog = QDialog(self)
-        dialog.setWindowTitle("Dataset Statistics")
+        dialog.setWindowTitle(title)
         dialog.setMinimumSize(600, 400)
 
         layout = QVBoxLayout(dialog)
 
         text_edit = QTextEdit()
         text_edit.setReadOnly(True)
+        if monospace:
+            # Keep matrix columns aligned
+            text_edit.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+            text_edit.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         text_edit.setPlainText(text)
         layout.addWidget(text_edit)
 
@@ -553,12 +715,11 @@ class MainWindow(QMainWindow):
         if not self.is_model_loaded():
             return None
 
-        df = self.model._data
-        row_count = df.height
-        total_columns = df.width
-        column_type_counts = get_column_type_counts_string(
-            df
-        )  # Get the string summary of column type counts
+        # Counters are maintained by the model, so this never scans the data.
+        footer = self.model.get_footer_stats()
+        row_count = footer["row_count"]
+        total_columns = footer["total_columns"]
+        column_type_counts = footer["column_types"]
 
         # Update the footer labels
         self.row_count_label.setText(f"Total Rows: {row_count}")
@@ -649,7 +810,9 @@ class MainWindow(QMainWindow):
             return
 
         df = self.model.get_dataframe()
-        numeric, categorical, text = detect_columns(df)
+        numeric, categorical, text = detect_columns(
+            df, cache=getattr(self.model, "_stats_cache", None)
+        )
 
         dialog = FeaturizeDialog(self.model.get_column_names(), numeric, categorical, text, parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -659,8 +822,50 @@ class MainWindow(QMainWindow):
             sel_categorical = [c for c in selected if c in categorical]
             sel_text = [c for c in selected if c in text]
             opts = dialog.get_options()
+            column_encodings = {
+                col: encoding
+                for col, encoding in (opts.get("column_encodings") or {}).items()
+                if col in selected
+            }
+            if "target" in column_encodings.values():
+                # The target being encoded against must not also be a feature
+                sel_numeric = [c for c in sel_numeric if c != opts.get("target_col")]
+
+            pipeline_path = None
+            if opts.get("save_pipeline"):
+                if column_encodings:
+                    QMessageBox.warning(
+                        self,
+                        "Featurize",
+                        "Saved pipelines use the default encodings only; "
+                        "reset the per-column encodings to save a pipeline.",
+                    )
+                    return
+                pipeline_path, _ = QFileDialog.getSaveFileName(
+                    self, "Save Feature Pipeline", "", "Feature Pipeline (*.json)"
+                )
+                if not pipeline_path:
+                    return
 
             def _task():
+                if pipeline_path:
+                    from ds.pipeline import FeaturePipeline
+
+                    encoding = opts.get("categorical_encoding")
+                    pipeline = FeaturePipeline(
+                        numeric_cols=sel_numeric,
+                        categorical_cols=sel_categorical if encoding else [],
+                        text_cols=sel_text,
+                        scale_numeric=opts.get("scale_numeric"),
+                        categorical_encoding=encoding or "onehot",
+                        tfidf_max_features=opts.get("tfidf_max_features", 200),
+                        text_encoding=opts.get("text_encoding", "tfidf"),
+                        hash_features=opts.get("hash_features", 1024),
+                        dtype=opts.get("dtype", "float32"),
+                    )
+                    X, feature_names = pipeline.fit_transform(df)
+                    pipeline.save(pipeline_path)
+                    return add_features_to_df(df, X, feature_names)
                 X, feature_names = generate_feature_matrix(
                     df,
                     numeric_cols=sel_numeric,
@@ -669,6 +874,13 @@ class MainWindow(QMainWindow):
                     scale_numeric=opts.get("scale_numeric"),
                     one_hot=opts.get("one_hot", True),
                     tfidf_max_features=opts.get("tfidf_max_features", 200),
+                    engine=opts.get("engine", "sklearn"),
+                    categorical_encoding=opts.get("categorical_encoding"),
+                    text_encoding=opts.get("text_encoding", "tfidf"),
+                    hash_features=opts.get("hash_features", 1024),
+                    dtype=opts.get("dtype", "float32"),
+                    column_encodings=column_encodings,
+                    target_col=opts.get("target_col"),
                 )
                 return add_features_to_df(df, X, feature_names)
 
@@ -691,11 +903,59 @@ class MainWindow(QMainWindow):
                 lambda: self.statusBar().clearMessage(),
             )
 
+    def handle_apply_pipeline(self):
+        try:
+            from ds.featurize import add_features_to_df
+            from ds.pipeline import FeaturePipeline
+        except Exception as exc:
+            QMessageBox.critical(
+                self,
+                "Missing dependency",
+                "Featurization requires the '[ml]' extras. Install them to use this feature.",
+            )
+            logger.debug("Featurize dependencies unavailable", exc_info=exc)
+            return
+
+        if not self.is_model_loaded():
+            return
+
+        file_name, _ = QFileDialog.getOpenFileName(
+            self, "Open Feature Pipeline", "", "Feature Pipeline (*.json)"
+        )
+        if not file_name:
+            return
+
+        df = self.model.get_dataframe()
+
+        def _task():
+            # Transform only: the statistics come from the saved pipeline
+            X, feature_names = FeaturePipeline.load(file_name).transform(df)
+            return add_features_to_df(df, X, feature_names)
+
+        self.statusBar().showMessage("Applying feature pipeline...")
+
+        def _success(new_df):
+            self.model.update_data(new_df)
+            self.update_statistics()
+
+        def _error(exc: Exception):
+            QMessageBox.critical(
+                self, "Featurize Error", f"Failed to apply feature pipeline: {exc}"
+            )
+
+        run_in_background(
+            self,
+            _task,
+            _success,
+            _error,
+            lambda: self.statusBar().clearMessage(),
+        )
+
     def handle_dimensionality(self):
         try:
             import numpy as np
             from app.widgets.pca_gui import PCADialog
-            from ds.dimensionality import compute_pca, compute_umap
+            from ds.dimensionality import build_input_matrix, compute_pca, compute_umap
         except Exception:
             QMessageBox.critical(self, "Missing dependency", "NumPy is required for dimensionality reduction. Install the '[ml]' extras or numpy in your environment.")
             return
@@ -725,10 +985,7 @@ class MainWindow(QMainWindow):
 
         def _task():
             # build feature matrix
-            try:
-                X = df.select(selected).to_numpy()
-            except Exception:
-                X = df.select(selected).to_pandas().values
+            X = build_input_matrix(df, selected, dtype=opts.get("dtype", "float32"))
 
             # downsample for visualization if requested
             if sample and sample > 0 and X.shape[0] > sample:
@@ -859,6 +1116,57 @@ class MainWindow(QMainWindow):
             lambda: self.statusBar().clearMessage(),
         )
 
+    def handle_correlation(self):
+        from app.widgets.correlation_gui import CorrelationDialog
+        from logic.stats import (
+            compute_correlation_matrix,
+            format_correlation_matrix,
+            numeric_columns,
+        )
+
+        if not self.is_model_loaded():
+            return
+
+        df = self.model.get_dataframe()
+        candidates = numeric_columns(df)
+        if not candidates:
+            QMessageBox.warning(self, "No numeric columns", "The dataset has no numeric columns.")
+            return
+
+        dialog = CorrelationDialog(candidates, parent=self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+
+        selected = dialog.get_selected_columns()
+        if not selected:
+            QMessageBox.warning(self, "No columns", "Please select at least one numeric column.")
+            return
+        method = dialog.get_options().get("method", "pearson")
+
+        def _task():
+            matrix = compute_correlation_matrix(df, selected, method=method)
+            return format_correlation_matrix(selected, matrix)
+
+        self.statusBar().showMessage("Computing correlation matrix...")
+
+        def _success(text):
+            self.show_statistics_window(
+                text, title=f"Correlation Matrix ({method})", monospace=True
+            )
+
+        def _error(exc: Exception):
+            QMessageBox.critical(
+                self, "Correlation Error", f"Failed to compute correlation: {exc}"
+            )
+
+        run_in_background(
+            self,
+            _task,
+            _success,
+            _error,
+            lambda: self.statusBar().clearMessage(),
+        )
+
     def _safe_execute_transformation(self, code: str):
         """Validate and safely execute a transformation code string.
 
@@ -0,0 +1,69 @@
+from PyQt6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QPushButton,
+    QComboBox,
+    QCheckBox,
+)
+from PyQt6.QtCore import Qt
+
+from logic.conversion import AUTO_DETECT, TYPE_NAMES
+
+
+class BatchConvertDialog(QDialog):
+    def __init__(self, column_types, parent=None):
+        """`column_types` maps column name to a display string of its dtype."""
+        super().__init__(parent)
+        self.setWindowTitle("Convert Column Types")
+        self.resize(520, 420)
+
+        layout = QVBoxLayout(self)
+
+        layout.addWidget(QLabel("Select columns and target types (check items):"))
+        self.table = QTableWidget(len(column_types), 3)
+        self.table.setHorizontalHeaderLabels(["Column", "Current type", "Convert to"])
+        self.table.verticalHeader().setVisible(False)
+        self.type_combos = []
+        for row, (name, dtype) in enumerate(column_types.items()):
+            item = QTableWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            item.setCheckState(Qt.CheckState.Unchecked)
+            self.table.setItem(row, 0, item)
+            current = QTableWidgetItem(dtype)
+            current.setFlags(current.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            self.table.setItem(row, 1, current)
+            combo = QComboBox()
+            combo.addItems([AUTO_DETECT] + TYPE_NAMES)
+            self.table.setCellWidget(row, 2, combo)
+            self.type_combos.append(combo)
+        self.table.resizeColumnsToContents()
+        layout.addWidget(self.table)
+
+        self.auto_text_checkbox = QCheckBox("Auto-detect types for all text (Utf8) columns")
+        layout.addWidget(self.auto_text_checkbox)
+
+        btn_layout = QHBoxLayout()
+        ok = QPushButton("Convert")
+        ok.clicked.connect(self.accept)
+        cancel = QPushButton("Cancel")
+        cancel.clicked.connect(self.reject)
+        btn_layout.addWidget(ok)
+        btn_layout.addWidget(cancel)
+        layout.addLayout(btn_layout)
+
+    def get_targets(self):
+        """Return {column: type name or AUTO_DETECT} for the checked rows."""
+        targets = {}
+        for row in range(self.table.rowCount()):
+            item = self.table.item(row, 0)
+            if item.checkState() == Qt.CheckState.Checked:
+                targets[item.text()] = self.type_combos[row].currentText()
+        return targets
+
+    def get_options(self):
+        return {"auto_detect_text": self.auto_text_checkbox.isChecked()}
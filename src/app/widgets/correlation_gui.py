@@ -0,0 +1,58 @@
+from PyQt6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+    QComboBox,
+    QWidget,
+)
+from PyQt6.QtCore import Qt
+
+
+class CorrelationDialog(QDialog):
+    def __init__(self, numeric_columns, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Correlation Matrix")
+        self.resize(420, 400)
+
+        layout = QVBoxLayout(self)
+
+        layout.addWidget(QLabel("Select numeric columns (check items):"))
+        self.list_widget = QListWidget()
+        for col in numeric_columns:
+            item = QListWidgetItem(col)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+            self.list_widget.addItem(item)
+        layout.addWidget(self.list_widget)
+
+        opts = QWidget()
+        opts_layout = QHBoxLayout(opts)
+        opts_layout.addWidget(QLabel("Method:"))
+        self.method_combo = QComboBox()
+        self.method_combo.addItems(["pearson", "spearman", "covariance"])
+        opts_layout.addWidget(self.method_combo)
+        layout.addWidget(opts)
+
+        btn_layout = QHBoxLayout()
+        ok = QPushButton("Compute")
+        ok.clicked.connect(self.accept)
+        cancel = QPushButton("Cancel")
+        cancel.clicked.connect(self.reject)
+        btn_layout.addWidget(ok)
+        btn_layout.addWidget(cancel)
+        layout.addLayout(btn_layout)
+
+    def get_selected_columns(self):
+        cols = []
+        for i in range(self.list_widget.count()):
+            item = self.list_widget.item(i)
+            if item.checkState() == Qt.CheckState.Checked:
+                cols.append(item.text())
+        return cols
+
+    def get_options(self):
+        return {"method": self.method_combo.currentText()}
@@ -9,6 +9,8 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QCheckBox,
     QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
     QWidget,
 )
 from PyQt6.QtCore import Qt
@@ -41,6 +43,34 @@ class FeaturizeDialog(QDialog):
 
         layout.addWidget(self.list_widget)
 
+        # Per-column encodings for text/categorical columns; "(default)"
+        # follows the options below (one-hot/label, text features for text)
+        layout.addWidget(QLabel("Categorical encoding per column:"))
+        encodable = [
+            col for col in column_names if col in self.categorical_cols or col in self.text_cols
+        ]
+        self.encoding_table = QTableWidget(len(encodable), 2)
+        self.encoding_table.setHorizontalHeaderLabels(["Column", "Encoding"])
+        self.encoding_table.verticalHeader().setVisible(False)
+        for row, col in enumerate(encodable):
+            item = QTableWidgetItem(col)
+            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            self.encoding_table.setItem(row, 0, item)
+            combo = QComboBox()
+            combo.addItems(["(default)", "onehot", "label", "frequency", "target", "hash"])
+            self.encoding_table.setCellWidget(row, 1, combo)
+        self.encoding_table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.encoding_table)
+
+        target_row = QHBoxLayout()
+        target_row.addWidget(QLabel("Target column (for target encoding):"))
+        self.target_combo = QComboBox()
+        self.target_combo.addItem("(None)")
+        self.target_combo.addItems([col for col in column_names if col in self.numeric_cols])
+        target_row.addWidget(self.target_combo)
+        target_row.addStretch(1)
+        layout.addLayout(target_row)
+
         # Options
         opts = QWidget()
         opts_layout = QHBoxLayout(opts)
@@ -50,10 +80,14 @@ class FeaturizeDialog(QDialog):
         self.scale_combo.addItems(["standard", "minmax", "none"])
         opts_layout.addWidget(self.scale_combo)
 
-        self.one_hot_checkbox = QCheckBox("One-hot encode categorical")
+        self.one_hot_checkbox = QCheckBox("Encode categorical")
         self.one_hot_checkbox.setChecked(True)
         opts_layout.addWidget(self.one_hot_checkbox)
 
+        self.encoding_combo = QComboBox()
+        self.encoding_combo.addItems(["onehot", "label"])
+        opts_layout.addWidget(self.encoding_combo)
+
         opts_layout.addWidget(QLabel("TF-IDF max features:"))
         self.tfidf_spin = QSpinBox()
         self.tfidf_spin.setRange(10, 5000)
@@ -62,6 +96,45 @@ class FeaturizeDialog(QDialog):
 
         layout.addWidget(opts)
 
+        text_opts = QWidget()
+        text_layout = QHBoxLayout(text_opts)
+        text_layout.addWidget(QLabel("Text features:"))
+        self.text_combo = QComboBox()
+        self.text_combo.addItems(["tfidf", "hashing"])
+        self.text_combo.setToolTip(
+            "hashing maps word n-grams to a fixed number of columns without fitting a vocabulary"
+        )
+        text_layout.addWidget(self.text_combo)
+        text_layout.addWidget(QLabel("Hash features:"))
+        self.hash_spin = QSpinBox()
+        self.hash_spin.setRange(16, 1 << 20)
+        self.hash_spin.setValue(1024)
+        text_layout.addWidget(self.hash_spin)
+        text_layout.addStretch(1)
+        layout.addWidget(text_opts)
+
+        engine_opts = QWidget()
+        engine_layout = QHBoxLayout(engine_opts)
+        engine_layout.addWidget(QLabel("Engine:"))
+        self.engine_combo = QComboBox()
+        self.engine_combo.addItems(["sklearn", "polars"])
+        self.engine_combo.setToolTip(
+            "polars computes numeric and categorical features with Polars expressions"
+        )
+        engine_layout.addWidget(self.engine_combo)
+        engine_layout.addWidget(QLabel("Precision:"))
+        self.dtype_combo = QComboBox()
+        self.dtype_combo.addItems(["float32", "float64"])
+        self.dtype_combo.setToolTip("float32 halves the memory of the feature columns")
+        engine_layout.addWidget(self.dtype_combo)
+        self.save_pipeline_checkbox = QCheckBox("Save fitted pipeline...")
+        self.save_pipeline_checkbox.setToolTip(
+            "Save the fitted statistics so new files can be featurized without refitting"
+        )
+        engine_layout.addWidget(self.save_pipeline_checkbox)
+        engine_layout.addStretch(1)
+        layout.addWidget(engine_opts)
+
         # Buttons
         btns = QHBoxLayout()
         ok = QPushButton("Featurize and Add")
@@ -80,14 +153,31 @@ class FeaturizeDialog(QDialog):
                 cols.append(item.text())
         return cols
 
+    def get_column_encodings(self):
+        encodings = {}
+        for row in range(self.encoding_table.rowCount()):
+            encoding = self.encoding_table.cellWidget(row, 1).currentText()
+            if encoding != "(default)":
+                encodings[self.encoding_table.item(row, 0).text()] = encoding
+        return encodings
+
     def get_options(self):
         scale = self.scale_combo.currentText()
         if scale == "none":
             scale = None
         one_hot = self.one_hot_checkbox.isChecked()
         tfidf_max = int(self.tfidf_spin.value())
+        target = self.target_combo.currentText()
         return {
             "scale_numeric": scale,
             "one_hot": one_hot,
+            "categorical_encoding": self.encoding_combo.currentText() if one_hot else None,
             "tfidf_max_features": tfidf_max,
+            "text_encoding": self.text_combo.currentText(),
+            "hash_features": int(self.hash_spin.value()),
+            "engine": self.engine_combo.currentText(),
+            "dtype": self.dtype_combo.currentText(),
+            "column_encodings": self.get_column_encodings(),
+            "target_col": None if target == "(None)" else target,
+            "save_pipeline": self.save_pipeline_checkbox.isChecked(),
         }
@@ -55,6 +55,11 @@ class PCADialog(QDialog):
         self.sample_spin.setValue(10000)
         opts_layout.addWidget(self.sample_spin)
 
+        opts_layout.addWidget(QLabel("Precision:"))
+        self.dtype_combo = QComboBox()
+        self.dtype_combo.addItems(["float32", "float64"])
+        opts_layout.addWidget(self.dtype_combo)
+
         layout.addWidget(opts)
 
         btn_layout = QHBoxLayout()
@@ -92,4 +97,5 @@ class PCADialog(QDialog):
             "n_components": n_components,
             "color_by": color_by,
             "sample": sample,
+            "dtype": self.dtype_combo.currentText(),
         }
@@ -3,6 +3,7 @@
 Commands:
 - featurize: run the featurizer and optionally write out a parquet
 - pca: compute PCA and save embedding CSV/HTML
+- corr: compute a correlation/covariance matrix for numeric columns
 - assistant: run assistant query (uses dummy or configured backend)
 """
 from __future__ import annotations
@@ -13,12 +14,41 @@ import polars as pl
 
 def cmd_featurize(args):
     try:
-        from ds.featurize import generate_feature_matrix, add_features_to_df
+        from ds.featurize import add_features_to_df, generate_feature_matrix, save_feature_matrix
     except ImportError as exc:  # pragma: no cover - optional extra
         raise SystemExit("Install with 'pip install parqcel[ml]' to use featurize") from exc
 
+    if args.streaming:
+        _featurize_streaming(args)
+        return
+
     df = pl.read_parquet(args.input) if args.input.endswith('.parquet') else pl.read_csv(args.input)
-    X, names = generate_feature_matrix(df)
+    if args.pipeline or args.save_pipeline:
+        from ds.pipeline import FeaturePipeline
+
+        if args.pipeline:
+            # Transform only, with the statistics fitted earlier
+            X, names = FeaturePipeline.load(args.pipeline).transform(df)
+        else:
+            pipeline = FeaturePipeline(**_pipeline_options(args))
+            X, names = pipeline.fit_transform(df)
+            pipeline.save(args.save_pipeline)
+    else:
+        X, names = generate_feature_matrix(
+            df,
+            engine=args.engine,
+            categorical_encoding=args.categorical_encoding,
+            text_encoding=args.text_encoding,
+            hash_features=args.hash_features,
+            dtype=args.dtype,
+            column_encodings=dict(args.encode or []),
+            target_col=args.target,
+        )
+    if args.matrix:
+        # Keep the sparse matrix as-is instead of expanding it into columns
+        save_feature_matrix(args.matrix, X, names)
+        if not args.output:
+            return
     new_df = add_features_to_df(df, X, names)
     if args.output:
         new_df.write_parquet(args.output)
@@ -26,6 +56,63 @@ def cmd_featurize(args):
         print(new_df)
 
 
+def _column_encoding(text):
+    column, sep, encoding = text.rpartition('=')
+    if not sep or not column:
+        raise argparse.ArgumentTypeError(f"expected COLUMN=ENCODING, got '{text}'")
+    return column, encoding
+
+
+def _check_featurize_args(parser, args):
+    """Reject options the pipeline and streaming paths cannot honour.
+
+    `FeaturePipeline` only stores one-hot and label levels, so per-column,
+    frequency, target and hashed category encodings need the in-memory path.
+    """
+    if args.streaming:
+        mode = '--streaming'
+    elif args.pipeline:
+        mode = '--pipeline'
+    elif args.save_pipeline:
+        mode = '--save-pipeline'
+    else:
+        return
+    if args.categorical_encoding not in (None, 'onehot', 'label'):
+        parser.error(f'--categorical-encoding {args.categorical_encoding} is not supported with {mode}')
+    if args.encode:
+        parser.error(f'--encode is not supported with {mode}')
+    if args.target:
+        parser.error(f'--target is not supported with {mode}')
+
+
+def _pipeline_options(args):
+    return {
+        'categorical_encoding': args.categorical_encoding or 'onehot',
+        'text_encoding': args.text_encoding,
+        'hash_features': args.hash_features,
+        'dtype': args.dtype,
+    }
+
+
+def _featurize_streaming(args):
+    """Two passes over a scan: fit statistics, then transform batch by batch."""
+    from ds.pipeline import FeaturePipeline
+
+    if not args.output:
+        raise SystemExit('--streaming needs --output (a .parquet file)')
+    if args.matrix:
+        raise SystemExit('--matrix is not supported with --streaming')
+    lf = pl.scan_parquet(args.input) if args.input.endswith('.parquet') else pl.scan_csv(args.input)
+    if args.pipeline:
+        pipeline = FeaturePipeline.load(args.pipeline)
+    else:
+        pipeline = FeaturePipeline(**_pipeline_options(args))
+        pipeline.fit_lazy(lf)
+        if args.save_pipeline:
+            pipeline.save(args.save_pipeline)
+    pipeline.transform_to_parquet(lf, args.output)
+
+
 def cmd_pca(args):
     try:
         from ds.featurize import generate_feature_matrix
@@ -34,7 +121,7 @@ def cmd_pca(args):
         raise SystemExit("Install with 'pip install parqcel[ml]' to use pca") from exc
 
     df = pl.read_parquet(args.input) if args.input.endswith('.parquet') else pl.read_csv(args.input)
-    X, names = generate_feature_matrix(df)
+    X, names = generate_feature_matrix(df, dense=True, dtype=args.dtype)
     emb, var = compute_pca(X, n_components=args.components)
     out = pl.DataFrame({f'pca_{i+1}': emb[:, i] for i in range(emb.shape[1])})
     if args.output:
@@ -43,6 +130,22 @@ def cmd_pca(args):
         print(out)
 
 
+def cmd_corr(args):
+    from logic.stats import compute_correlation_matrix, correlation_to_frame, numeric_columns
+
+    df = pl.read_parquet(args.input) if args.input.endswith('.parquet') else pl.read_csv(args.input)
+    columns = args.columns or numeric_columns(df)
+    try:
+        matrix = compute_correlation_matrix(df, columns, method=args.method)
+    except ValueError as exc:
+        raise SystemExit(f"corr: {exc}") from exc
+    out = correlation_to_frame(columns, matrix)
+    if args.output:
+        out.write_csv(args.output)
+    else:
+        print(out)
+
+
 def cmd_assistant(args):
     from ai.assistant import assistant_from_config
     a = assistant_from_config()
@@ -57,20 +160,57 @@ def main(argv=None):
     p = sub.add_parser('featurize')
     p.add_argument('input')
     p.add_argument('--output', '-o')
+    p.add_argument('--matrix', help='write the sparse feature matrix to this .npz file')
+    p.add_argument('--engine', choices=['sklearn', 'polars'], default='sklearn')
+    p.add_argument('--categorical-encoding', choices=['onehot', 'label', 'frequency', 'target', 'hash'])
+    p.add_argument(
+        '--encode',
+        action='append',
+        type=_column_encoding,
+        metavar='COLUMN=ENCODING',
+        help='encode one column as onehot/label/frequency/target/hash (repeatable)',
+    )
+    p.add_argument('--target', help='numeric target column for target encoding')
+    p.add_argument(
+        '--text-encoding',
+        choices=['tfidf', 'hashing'],
+        default='tfidf',
+        help='hashing: fixed-width hashed word n-grams, no vocabulary to fit',
+    )
+    p.add_argument('--hash-features', type=int, default=1024, help='columns per text column with --text-encoding hashing')
+    p.add_argument('--dtype', choices=['float32', 'float64'], default='float32', help='feature column precision')
+    p.add_argument(
+        '--streaming',
+        action='store_true',
+        help='fit and transform in batches from a scan, writing the output incrementally',
+    )
+    pipeline_opts = p.add_mutually_exclusive_group()
+    pipeline_opts.add_argument('--pipeline', help='apply a saved feature pipeline (JSON) without refitting')
+    pipeline_opts.add_argument('--save-pipeline', help='fit a feature pipeline and save it to this JSON file')
 
     p2 = sub.add_parser('pca')
     p2.add_argument('input')
     p2.add_argument('--components', '-k', type=int, default=2)
+    p2.add_argument('--dtype', choices=['float32', 'float64'], default='float32')
     p2.add_argument('--output', '-o')
 
+    p4 = sub.add_parser('corr')
+    p4.add_argument('input')
+    p4.add_argument('--columns', '-c', nargs='+')
+    p4.add_argument('--method', '-m', choices=['pearson', 'spearman', 'covariance'], default='pearson')
+    p4.add_argument('--output', '-o')
+
     p3 = sub.add_parser('assistant')
     p3.add_argument('query')
 
     ns = parser.parse_args(argv)
     if ns.cmd == 'featurize':
+        _check_featurize_args(p, ns)
         cmd_featurize(ns)
     elif ns.cmd == 'pca':
         cmd_pca(ns)
+    elif ns.cmd == 'corr':
+        cmd_corr(ns)
     elif ns.cmd == 'assistant':
         cmd_assistant(ns)
     else:
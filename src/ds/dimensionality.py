@@ -2,8 +2,11 @@
 
 Provides PCA (via scikit-learn) and optional UMAP integration (if installed).
 """
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 import numpy as np
+import polars as pl
+
+from .featurize import polars_float_type
 
 try:
     from sklearn.decomposition import PCA
@@ -16,6 +19,19 @@ except Exception:
     _umap = None
 
 
+def build_input_matrix(df: pl.DataFrame, columns: List[str], dtype="float32") -> np.ndarray:
+    """Return `columns` of `df` as a 2D float array for PCA/UMAP.
+
+    Columns are cast in Polars so the array is built once in `dtype`;
+    float32 halves the memory of float64 and both PCA and UMAP keep it.
+    """
+    float_type = polars_float_type(dtype)
+    try:
+        return df.select(pl.col(columns).cast(float_type)).to_numpy()
+    except Exception:
+        return df.select(columns).to_pandas().values.astype(dtype)
+
+
 def compute_pca(
     X: np.ndarray, n_components: int = 2, random_state: Optional[int] = 0
 ) -> Tuple[np.ndarray, np.ndarray]:
@@ -1,24 +1,40 @@
 """Column featurization utilities for Polars DataFrame.
 
-Provides functions to generate numeric, categorical (one-hot), and text (TF-IDF)
-features and return a combined feature matrix plus feature names. Also includes
+Provides functions to generate numeric, categorical (one-hot), and text (TF-IDF
+or hashed n-gram) features and return a combined feature matrix plus feature names. Also includes
 helper to add generated feature columns back into a Polars DataFrame.
 
+The feature matrix is a `scipy.sparse` CSR matrix from end to end (one-hot
+and TF-IDF blocks are mostly zeros); pass `dense=True` or call `to_dense` only
+where a dense array is really needed.
+
 This module uses scikit-learn for transformations. If scikit-learn is not
-installed the functions will raise an informative ImportError.
+installed the functions will raise an informative ImportError. The "polars"
+engine (`featurize_frame`) scales and encodes with Polars expressions and
+only needs scikit-learn for TF-IDF.
 """
-from typing import List, Optional, Tuple
+import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple, Type, Union
 import polars as pl
 import numpy as np
 
 try:
+    from scipy import sparse
     from sklearn.preprocessing import StandardScaler, MinMaxScaler, OneHotEncoder
-    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
 except Exception as e:  # pragma: no cover - runtime dependency
+    sparse = None
     _SKLEARN_AVAILABLE = False
 else:
     _SKLEARN_AVAILABLE = True
 
+logger = logging.getLogger(__name__)
+
 
 def _ensure_sklearn():
     if not _SKLEARN_AVAILABLE:
@@ -28,19 +44,88 @@ def _ensure_sklearn():
         )
 
 
-def detect_columns(df: pl.DataFrame) -> Tuple[List[str], List[str], List[str]]:
+# A text column with at most this many distinct values is categorical
+CATEGORICAL_MAX_UNIQUE = 50
+# Leading rows whose distinct count can already rule a column out as categorical
+DETECT_SAMPLE_ROWS = 10_000
+_KIND_CACHE_KEY = "featurize_kind"
+
+
+def _string_column_kinds(df: pl.DataFrame, cols: List[str]) -> dict:
+    """Classify text columns as "categorical" or "text" by distinct count.
+
+    Distinct values are counted for every column at once on the first
+    `DETECT_SAMPLE_ROWS` rows; a column with more than
+    `CATEGORICAL_MAX_UNIQUE` there is text without looking further. Only
+    the remaining columns are counted exactly over all rows, again in one
+    query, so the result matches an exact `n_unique` per column.
+    """
+    sample = df.head(DETECT_SAMPLE_ROWS)
+    counts = sample.select([pl.col(col).n_unique().alias(col) for col in cols]).row(
+        0, named=True
+    )
+    pending = [col for col in cols if counts[col] <= CATEGORICAL_MAX_UNIQUE]
+    if pending and df.height > sample.height:
+        counts.update(
+            df.select([pl.col(col).n_unique().alias(col) for col in pending]).row(
+                0, named=True
+            )
+        )
+    return {
+        col: "categorical" if counts[col] <= CATEGORICAL_MAX_UNIQUE else "text" for col in cols
+    }
+
+
+def _high_cardinality_columns(lf: pl.LazyFrame, cols: List[str]) -> List[str]:
+    """Columns of `cols` with more than `CATEGORICAL_MAX_UNIQUE` values in all of `lf`.
+
+    Counts with HyperLogLog on the streaming engine, so memory stays
+    bounded however many distinct values a column holds.
+    """
+    if not cols:
+        return []
+    counts = (
+        lf.select([pl.col(col).approx_n_unique().alias(col) for col in cols])
+        .collect(engine="streaming")
+        .row(0, named=True)
+    )
+    return [col for col in cols if counts[col] > CATEGORICAL_MAX_UNIQUE]
+
+
+def detect_columns(
+    df: pl.DataFrame, cache=None
+) -> Tuple[List[str], List[str], List[str]]:
     """Detect numeric, categorical and text-like columns.
 
     Simple heuristics are used:
     - numeric: Int/Float polars dtypes
-    - categorical: Utf8 with relatively small unique count (< 50)
+    - categorical: Utf8 with relatively small unique count (<= 50)
     - text: Utf8 with larger unique count
 
+    `cache` is an optional `logic.stats.StatsCache` for `df` (a table
+    model's); text column kinds are stored in it and dropped whenever the
+    model invalidates that column.
+
     Returns (numeric_cols, categorical_cols, text_cols)
     """
     schema = df.schema
     numeric_types = (pl.Int64, pl.Int32, pl.Float64, pl.Float32)
 
+    string_cols = [col for col, dtype in schema.items() if dtype in (pl.Utf8, pl.Categorical)]
+    kinds = {}
+    if cache is not None:
+        for col in string_cols:
+            kind = cache.get_derived(col, _KIND_CACHE_KEY)
+            if kind is not None:
+                kinds[col] = kind
+    missing = [col for col in string_cols if col not in kinds]
+    if missing:
+        computed = _string_column_kinds(df, missing)
+        kinds.update(computed)
+        if cache is not None:
+            for col, kind in computed.items():
+                cache.put_derived(col, _KIND_CACHE_KEY, kind)
+
     numeric: List[str] = []
     categorical: List[str] = []
     text: List[str] = []
@@ -48,16 +133,8 @@ def detect_columns(df: pl.DataFrame) -> Tuple[List[str], List[str], List[str]]:
     for col, dtype in schema.items():
         if dtype in numeric_types:
             numeric.append(col)
-        elif dtype in (pl.Utf8, pl.Categorical):
-            # choose categorical vs text based on unique count
-            try:
-                n_unique = df[col].n_unique()
-            except Exception:
-                n_unique = 0
-            if n_unique <= 50:
-                categorical.append(col)
-            else:
-                text.append(col)
+        elif col in kinds:
+            (categorical if kinds[col] == "categorical" else text).append(col)
 
     return numeric, categorical, text
 
@@ -72,6 +149,447 @@ def _to_numpy(df: pl.DataFrame, cols: List[str]) -> np.ndarray:
         return df.select(cols).to_pandas().values
 
 
+def is_sparse(X) -> bool:
+    return sparse is not None and sparse.issparse(X)
+
+
+def to_dense(X) -> np.ndarray:
+    """Return `X` as a dense array, densifying sparse matrices."""
+    return X.toarray() if is_sparse(X) else np.asarray(X)
+
+
+ENGINES = ("sklearn", "polars")
+CATEGORICAL_ENCODINGS = ("onehot", "label", "frequency", "target", "hash")
+# Encodings built from fitted category levels (`featurize_frame`, `FeaturePipeline`)
+LEVEL_ENCODINGS = ("onehot", "label")
+TEXT_ENCODINGS = ("tfidf", "hashing")
+
+# Feature matrices default to float32: half the memory of float64 and
+# faster BLAS, with ample precision for scaled and TF-IDF features.
+FEATURE_DTYPES = ("float32", "float64")
+DEFAULT_FEATURE_DTYPE = "float32"
+_POLARS_FLOAT_TYPES = {"float32": pl.Float32, "float64": pl.Float64}
+
+# Hashed text features: fixed width, word unigrams and bigrams
+HASH_N_FEATURES = 1024
+HASH_NGRAM_RANGE = (1, 2)
+# Rows converted to Python strings at a time while hashing
+HASH_CHUNK_ROWS = 100_000
+
+# Target encoding: folds for the out-of-fold means and the weight (in rows)
+# of the global mean that each category's mean is shrunk towards
+TARGET_FOLDS = 5
+TARGET_SMOOTHING = 10.0
+# Hashed categorical encoding: one-hot over this many hash buckets
+CATEGORY_HASH_BUCKETS = 32
+
+# Worker processes only pay off once there are several columns of real size
+# to encode: each worker has to start and import scikit-learn first.
+PARALLEL_FEATURIZE_MIN_COLUMNS = 4
+PARALLEL_FEATURIZE_MIN_ROWS = 50_000
+
+
+def feature_dtype(dtype) -> str:
+    """Normalize a dtype (name, NumPy type or None for the default) to a `FEATURE_DTYPES` name."""
+    name = DEFAULT_FEATURE_DTYPE if dtype is None else np.dtype(dtype).name
+    if name not in FEATURE_DTYPES:
+        raise ValueError(f"Unsupported feature dtype: {dtype}")
+    return name
+
+
+def polars_float_type(dtype) -> Type[pl.DataType]:
+    return _POLARS_FLOAT_TYPES[feature_dtype(dtype)]
+
+
+def _fit_polars_stats(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    numeric_cols: List[str],
+    categorical_cols: List[str],
+    streaming: bool = False,
+) -> dict:
+    """Scaling statistics and sorted category levels, computed in one lazy query.
+
+    `df` may be a LazyFrame (e.g. a Parquet scan); with `streaming` the
+    query runs on Polars' streaming engine so memory stays bounded.
+    """
+    exprs = []
+    for i, col in enumerate(numeric_cols):
+        values = pl.col(col).cast(pl.Float64)
+        exprs += [
+            values.mean().alias(f"n{i}_mean"),
+            values.std(ddof=0).alias(f"n{i}_std"),
+            values.min().alias(f"n{i}_min"),
+            values.max().alias(f"n{i}_max"),
+        ]
+    for i, col in enumerate(categorical_cols):
+        exprs += [
+            pl.col(col).cast(pl.Utf8).drop_nulls().unique().sort().implode().alias(f"c{i}"),
+            pl.col(col).null_count().alias(f"c{i}_nulls"),
+        ]
+    row = {}
+    if exprs:
+        query = df.lazy().select(exprs)
+        stats = query.collect(engine="streaming") if streaming else query.collect()
+        row = stats.row(0, named=True)
+
+    numeric = {
+        col: {stat: row[f"n{i}_{stat}"] for stat in ("mean", "std", "min", "max")}
+        for i, col in enumerate(numeric_cols)
+    }
+    levels = {col: list(row[f"c{i}"]) for i, col in enumerate(categorical_cols)}
+    nulls = {col: row[f"c{i}_nulls"] > 0 for i, col in enumerate(categorical_cols)}
+    return {"numeric": numeric, "levels": levels, "nulls": nulls}
+
+
+def _numeric_feature_expr(col: str, stats: dict, scale_numeric: Optional[str]) -> pl.Expr:
+    values = pl.col(col).cast(pl.Float64)
+    if scale_numeric == "standard":
+        # like StandardScaler: population std, constant columns are only centred
+        std = stats["std"] or 1.0
+        values = (values - (stats["mean"] or 0.0)) / std
+    elif scale_numeric == "minmax":
+        low, high = stats["min"], stats["max"]
+        low = low if low is not None else 0.0
+        span = (high - low) if high is not None and high != low else 1.0
+        values = (values - low) / span
+    return values.alias(col)
+
+
+def _categorical_feature_exprs(
+    col: str, levels: List[str], encoding: str, has_nulls: bool
+) -> List[pl.Expr]:
+    text = pl.col(col).cast(pl.Utf8)
+    if encoding == "label":
+        # Codes are positions in the sorted levels; unseen values become null
+        codes = text.cast(pl.Enum(levels), strict=False).to_physical()
+        return [codes.cast(pl.Float64).alias(f"{col}__label")]
+    # One indicator per level, named like OneHotEncoder's output; like
+    # OneHotEncoder, nulls seen while fitting get a last "None" indicator
+    exprs = [
+        (text == level).fill_null(False).cast(pl.Float64).alias(f"{col}_{level}")
+        for level in levels
+    ]
+    if has_nulls:
+        exprs.append(text.is_null().cast(pl.Float64).alias(f"{col}_None"))
+    return exprs
+
+
+def _frame_feature_exprs(
+    stats: dict,
+    numeric_cols: List[str],
+    categorical_cols: List[str],
+    scale_numeric: Optional[str],
+    categorical_encoding: str,
+) -> List[pl.Expr]:
+    """Feature expressions for fitted `stats` (see `_fit_polars_stats`)."""
+    exprs = [
+        _numeric_feature_expr(col, stats["numeric"][col], scale_numeric) for col in numeric_cols
+    ]
+    for col in categorical_cols:
+        exprs += _categorical_feature_exprs(
+            col, stats["levels"][col], categorical_encoding, stats["nulls"][col]
+        )
+    return exprs
+
+
+def featurize_frame(
+    df: pl.DataFrame,
+    numeric_cols: List[str],
+    categorical_cols: List[str],
+    scale_numeric: Optional[str] = "standard",
+    categorical_encoding: str = "onehot",
+    dtype="float64",
+) -> pl.DataFrame:
+    """Numeric and categorical features computed with Polars expressions.
+
+    Statistics and category levels are fitted in one lazy query and every
+    feature column is then built in a second one, which Polars runs
+    multi-threaded; no NumPy, pandas or scikit-learn is involved. Features
+    are computed in float64 and stored as `dtype`.
+    """
+    if categorical_encoding not in LEVEL_ENCODINGS:
+        raise ValueError(f"Unsupported categorical encoding: {categorical_encoding}")
+    stats = _fit_polars_stats(df, numeric_cols, categorical_cols)
+    exprs = _frame_feature_exprs(
+        stats, numeric_cols, categorical_cols, scale_numeric, categorical_encoding
+    )
+    if not exprs:
+        return pl.DataFrame()
+    float_type = polars_float_type(dtype)
+    return df.lazy().select([expr.cast(float_type) for expr in exprs]).collect()
+
+
+def frequency_encode(df: pl.DataFrame, col: str) -> pl.Series:
+    """Share of rows holding each row's value of `col` (nulls count as a value)."""
+    counts = df.group_by(col).agg((pl.len() / df.height).alias("__freq"))
+    joined = df.select(col).join(
+        counts, on=col, how="left", nulls_equal=True, maintain_order="left"
+    )
+    return joined["__freq"].alias(f"{col}__freq")
+
+
+def target_encode(
+    df: pl.DataFrame,
+    col: str,
+    target_col: str,
+    folds: int = TARGET_FOLDS,
+    smoothing: float = TARGET_SMOOTHING,
+    seed: int = 0,
+) -> pl.Series:
+    """Out-of-fold, smoothed mean of `target_col` per value of `col`.
+
+    Rows are split into `folds` folds by a hash of their position; each row
+    gets the mean target of its category over the *other* folds, shrunk
+    towards the global mean with a weight of `smoothing` rows, so a row's own
+    target never leaks into its feature. Category totals and per-fold totals
+    come from two group-bys joined back onto the rows in one lazy query.
+    """
+    if smoothing <= 0:
+        raise ValueError("Target encoding smoothing must be positive")
+    if df[target_col].null_count() == df.height:
+        raise ValueError(f"Target column '{target_col}' has no values")
+    rows = df.lazy().select(
+        pl.col(col).alias("key"),
+        pl.col(target_col).cast(pl.Float64).alias("y"),
+        (pl.int_range(pl.len(), dtype=pl.UInt64).hash(seed) % folds).alias("fold"),
+    )
+    totals = rows.group_by("key").agg(
+        pl.col("y").sum().alias("total_sum"), pl.col("y").count().alias("total_n")
+    )
+    per_fold = rows.group_by("key", "fold").agg(
+        pl.col("y").sum().alias("fold_sum"), pl.col("y").count().alias("fold_n")
+    )
+    prior = pl.col("y").mean()
+    encoded = (
+        rows.join(totals, on="key", how="left", nulls_equal=True, maintain_order="left")
+        .join(
+            per_fold,
+            on=["key", "fold"],
+            how="left",
+            nulls_equal=True,
+            maintain_order="left",
+        )
+        .select(
+            (
+                (pl.col("total_sum") - pl.col("fold_sum") + smoothing * prior)
+                / (pl.col("total_n") - pl.col("fold_n") + smoothing)
+            ).alias(f"{col}__target")
+        )
+        .collect()
+    )
+    return encoded.to_series()
+
+
+def hash_encode(
+    series: pl.Series, n_buckets: int = CATEGORY_HASH_BUCKETS, seed: int = 0
+) -> "sparse.csr_matrix":
+    """One-hot over `n_buckets` hash buckets of the values; nothing to fit.
+
+    Bucket assignments follow Polars' hash, which is stable within a Polars
+    version but not guaranteed across versions.
+    """
+    _ensure_sklearn()
+    buckets = (series.cast(pl.Utf8).hash(seed) % n_buckets).to_numpy().astype(np.int64)
+    n = len(series)
+    return sparse.csr_matrix(
+        (np.ones(n), buckets, np.arange(n + 1)), shape=(n, n_buckets)
+    )
+
+
+def _category_block(
+    df: pl.DataFrame, col: str, encoding: str, target_col: Optional[str], hash_buckets: int
+) -> Tuple["sparse.csr_matrix", List[str]]:
+    if encoding == "hash":
+        names = [f"{col}__bucket__{i}" for i in range(hash_buckets)]
+        return hash_encode(df[col], hash_buckets), names
+    if encoding == "target":
+        if target_col is None:
+            raise ValueError("Target encoding needs a target column")
+        values = target_encode(df, col, target_col)
+    else:
+        values = frequency_encode(df, col)
+    return sparse.csr_matrix(values.to_numpy().reshape(-1, 1)), [values.name]
+
+
+def _tfidf_blocks(
+    df: pl.DataFrame, text_cols: List[str], tfidf_max_features: int
+) -> Tuple[List["sparse.csr_matrix"], List[str]]:
+    parts = []
+    feature_names: List[str] = []
+    for tcol in text_cols:
+        vec = TfidfVectorizer(max_features=tfidf_max_features)
+        # convert to python list of strings
+        series = df[tcol].fill_null("")
+        try:
+            texts = series.to_list()
+        except Exception:
+            texts = list(series)
+        parts.append(vec.fit_transform(texts).tocsr())
+        feature_names.extend(f"{tcol}__tfidf__{n}" for n in vec.get_feature_names_out())
+    return parts, feature_names
+
+
+def _onehot_block(
+    df: pl.DataFrame, categorical_cols: List[str]
+) -> Tuple["sparse.csr_matrix", List[str]]:
+    # Use pandas DataFrame as scikit-learn expects 2D array-like with columns
+    try:
+        cat_df = df.select(categorical_cols).to_pandas()
+    except Exception:
+        # last resort: convert each series to list
+        cat_df = None
+    # Construct OneHotEncoder compatibly across scikit-learn versions
+    try:
+        encoder = OneHotEncoder(sparse_output=True, handle_unknown="ignore")
+    except TypeError:
+        # Older versions used `sparse` keyword
+        encoder = OneHotEncoder(sparse=True, handle_unknown="ignore")
+
+    if cat_df is not None:
+        X_cat = encoder.fit_transform(cat_df)
+    else:
+        rows = [[df[c][i] for c in categorical_cols] for i in range(len(df))]
+        X_cat = encoder.fit_transform(rows)
+    return sparse.csr_matrix(X_cat), list(encoder.get_feature_names_out(categorical_cols))
+
+
+def hashed_text_features(
+    series: pl.Series, n_features: int = HASH_N_FEATURES, chunk_rows: int = HASH_CHUNK_ROWS
+) -> "sparse.csr_matrix":
+    """Hashed n-gram counts for a text column, L2-normalized per row.
+
+    There is no vocabulary to fit: every row maps to the same
+    `n_features` columns on its own, so any chunk (or process, or batch of
+    a stream) can be transformed independently and the results stacked.
+    Only `chunk_rows` values are held as Python strings at once.
+    """
+    _ensure_sklearn()
+    vec = HashingVectorizer(
+        n_features=n_features, ngram_range=HASH_NGRAM_RANGE, alternate_sign=False
+    )
+    texts = series.cast(pl.Utf8).fill_null("")
+    if texts.is_empty():
+        # `HashingVectorizer` cannot transform zero documents
+        return sparse.csr_matrix((0, n_features), dtype=np.float64)
+    if len(texts) <= chunk_rows:
+        return vec.transform(texts.to_list()).tocsr()
+    blocks = [
+        vec.transform(texts.slice(start, chunk_rows).to_list())
+        for start in range(0, len(texts), chunk_rows)
+    ]
+    return sparse.vstack(blocks, format="csr")
+
+
+def hashed_feature_names(col: str, n_features: int = HASH_N_FEATURES) -> List[str]:
+    return [f"{col}__hash__{i}" for i in range(n_features)]
+
+
+def _hashed_blocks(
+    df: pl.DataFrame, text_cols: List[str], n_features: int
+) -> Tuple[List["sparse.csr_matrix"], List[str]]:
+    parts = [hashed_text_features(df[col], n_features) for col in text_cols]
+    names = [name for col in text_cols for name in hashed_feature_names(col, n_features)]
+    return parts, names
+
+
+def _encode_column(df: pl.DataFrame, kind: str, col: str, options: dict):
+    if kind == "onehot":
+        return _onehot_block(df, [col])
+    if kind == "hashing":
+        parts, names = _hashed_blocks(df, [col], options["hash_features"])
+    else:
+        parts, names = _tfidf_blocks(df, [col], options["tfidf_max_features"])
+    return parts[0], names
+
+
+def _csr_to_shared(X) -> dict:
+    """Copy a CSR matrix's arrays into new shared memory blocks.
+
+    Only the block names travel back through the pool's pipe; the parent
+    attaches to them, copies the arrays out once and unlinks the blocks.
+    """
+    arrays = {}
+    for field in ("data", "indices", "indptr"):
+        values = getattr(X, field)
+        # Zero-sized shared memory is not allowed
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+        arrays[field] = (shm.name, values.dtype.str, values.shape[0])
+        shm.close()
+    return {"shape": X.shape, "arrays": arrays}
+
+
+def _csr_from_shared(desc: dict) -> "sparse.csr_matrix":
+    arrays = {}
+    for field, (name, dtype, length) in desc["arrays"].items():
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            arrays[field] = np.ndarray((length,), dtype=dtype, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+    return sparse.csr_matrix(
+        (arrays["data"], arrays["indices"], arrays["indptr"]), shape=tuple(desc["shape"])
+    )
+
+
+def _encode_column_from_ipc(payload: bytes, kind: str, options: dict) -> Tuple[dict, List[str]]:
+    """Process-pool worker: rebuild one column from Arrow IPC and encode it."""
+    df = pl.read_ipc(payload)
+    X, names = _encode_column(df, kind, df.columns[0], options)
+    return _csr_to_shared(X.tocsr()), names
+
+
+def _column_to_ipc(df: pl.DataFrame, col: str) -> bytes:
+    buf = io.BytesIO()
+    df.select(col).write_ipc(buf, compression="uncompressed")
+    return buf.getvalue()
+
+
+def encode_columns_parallel(
+    df: pl.DataFrame,
+    jobs: List[Tuple[str, str]],
+    options: dict,
+    max_workers: Optional[int] = None,
+) -> List[Tuple["sparse.csr_matrix", List[str]]]:
+    """Encode columns concurrently on a process pool, one (kind, column) job each.
+
+    `kind` is "onehot", "tfidf" or "hashing"; `options` carries
+    `tfidf_max_features` and `hash_features`. Columns are shipped to the
+    workers as Arrow IPC buffers, with at most two per worker in flight,
+    and the sparse results come back in shared memory. Blocks are returned
+    in `jobs` order.
+    """
+    _ensure_sklearn()
+    workers = max_workers or os.cpu_count() or 1
+    results: Dict[int, Tuple["sparse.csr_matrix", List[str]]] = {}
+    # Spawn instead of fork: forking a process that runs Qt and Polars thread
+    # pools is unsafe.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        in_flight: Dict[Future, int] = {}
+        queue = iter(enumerate(jobs))
+        try:
+            while True:
+                for i, (kind, col) in queue:
+                    payload = _column_to_ipc(df, col)
+                    in_flight[pool.submit(_encode_column_from_ipc, payload, kind, options)] = i
+                    if len(in_flight) >= workers * 2:
+                        break
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    desc, names = fut.result()
+                    results[in_flight.pop(fut)] = (_csr_from_shared(desc), names)
+        finally:
+            # Release the blocks of jobs that finished after a failure
+            for fut in in_flight:
+                if not fut.cancel() and fut.exception() is None:
+                    _csr_from_shared(fut.result()[0])
+    return [results[i] for i in range(len(jobs))]
+
+
 def generate_feature_matrix(
     df: pl.DataFrame,
     numeric_cols: Optional[List[str]] = None,
@@ -80,15 +598,61 @@ def generate_feature_matrix(
     scale_numeric: Optional[str] = "standard",  # 'standard'|'minmax'|None
     one_hot: bool = True,
     tfidf_max_features: int = 200,
-) -> Tuple[np.ndarray, List[str]]:
+    dense: bool = False,
+    engine: str = "sklearn",  # 'sklearn'|'polars'
+    categorical_encoding: Optional[str] = None,  # 'onehot'|'label'|'frequency'|'target'|'hash'
+    column_encodings: Optional[Dict[str, str]] = None,
+    target_col: Optional[str] = None,
+    hash_buckets: int = CATEGORY_HASH_BUCKETS,
+    text_encoding: str = "tfidf",  # 'tfidf'|'hashing'
+    hash_features: int = HASH_N_FEATURES,
+    parallel: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+    dtype=DEFAULT_FEATURE_DTYPE,  # 'float32'|'float64'
+) -> Tuple["sparse.csr_matrix", List[str]]:
     """Generate a numerical feature matrix and corresponding feature names.
 
-    Returns (X, feature_names) where X is a 2D numpy array with shape
-    (n_rows, n_features).
+    Categorical columns are encoded with `categorical_encoding`, which
+    defaults to one-hot when `one_hot` is set (and to skipping them
+    otherwise). `column_encodings` picks the encoding of individual columns
+    (any type; they are encoded as categoricals); "frequency" and "target"
+    (out-of-fold mean of `target_col`, see `target_encode`) add one column
+    each and "hash" adds `hash_buckets`. The "polars" engine computes numeric
+    and one-hot features with Polars expressions (`featurize_frame`); both engines use
+    scikit-learn for TF-IDF. With `text_encoding="hashing"` text columns
+    become `hash_features` hashed n-gram columns each (`hashed_text_features`)
+    instead of a fitted TF-IDF vocabulary.
+
+    One-hot and text columns are encoded concurrently across a process
+    pool (`encode_columns_parallel`) when `parallel` is set; with
+    `parallel=None` this happens on multi-core machines for frames with at
+    least `PARALLEL_FEATURIZE_MIN_COLUMNS` such columns and
+    `PARALLEL_FEATURIZE_MIN_ROWS` rows.
+
+    Returns (X, feature_names) where X is a CSR matrix of `dtype` with shape
+    (n_rows, n_features), or a 2D numpy array if `dense` is True.
     """
     _ensure_sklearn()
+    if engine not in ENGINES:
+        raise ValueError(f"Unsupported featurization engine: {engine}")
+    if categorical_encoding is None:
+        categorical_encoding = "onehot" if one_hot else None
+    elif categorical_encoding not in CATEGORICAL_ENCODINGS:
+        raise ValueError(f"Unsupported categorical encoding: {categorical_encoding}")
+    if text_encoding not in TEXT_ENCODINGS:
+        raise ValueError(f"Unsupported text encoding: {text_encoding}")
+    column_encodings = dict(column_encodings or {})
+    for col, encoding in column_encodings.items():
+        if encoding not in CATEGORICAL_ENCODINGS:
+            raise ValueError(f"Unsupported categorical encoding for '{col}': {encoding}")
+    dtype = feature_dtype(dtype)
 
     numeric, categorical, text = detect_columns(df)
+    if target_col is not None:
+        # Never feed the target back in as a detected feature
+        numeric, categorical, text = (
+            [col for col in cols if col != target_col] for cols in (numeric, categorical, text)
+        )
 
     if numeric_cols is None:
         numeric_cols = numeric
@@ -97,80 +661,194 @@ def generate_feature_matrix(
     if text_cols is None:
         text_cols = text
 
-    parts: List[np.ndarray] = []
+    # Columns with an explicit encoding are categorical whatever their type;
+    # the rest use `categorical_encoding` or are skipped when it is None.
+    numeric_cols = [col for col in numeric_cols if col not in column_encodings]
+    text_cols = [col for col in text_cols if col not in column_encodings]
+    categorical_cols = list(categorical_cols) + [
+        col for col in column_encodings if col not in categorical_cols
+    ]
+    encodings = {
+        col: column_encodings.get(col, categorical_encoding) for col in categorical_cols
+    }
+    categorical_cols = [col for col in categorical_cols if encodings[col] is not None]
+    if target_col is None and "target" in encodings.values():
+        raise ValueError("Target encoding needs a target column")
+
+    parts: List["sparse.csr_matrix"] = []
     feature_names: List[str] = []
 
+    onehot_cols = [col for col in categorical_cols if encodings[col] == "onehot"]
+    label_cols = [col for col in categorical_cols if encodings[col] == "label"]
+    frame_cat_cols = onehot_cols if engine == "polars" else []
+    frame_num_cols = numeric_cols if engine == "polars" else []
+
     # Numeric processing
-    if numeric_cols:
-        X_num = _to_numpy(df, numeric_cols).astype(float)
+    if numeric_cols and engine == "sklearn":
+        # The scalers keep float32 input float32 (accumulating in float64)
+        X_num = _to_numpy(df, numeric_cols).astype(dtype)
         if scale_numeric == "standard":
             scaler = StandardScaler()
             X_num = scaler.fit_transform(X_num)
         elif scale_numeric == "minmax":
             scaler = MinMaxScaler()
             X_num = scaler.fit_transform(X_num)
-        parts.append(X_num)
+        parts.append(sparse.csr_matrix(X_num))
         feature_names.extend(list(numeric_cols))
 
-    # Categorical one-hot
-    if categorical_cols and one_hot:
-        # Use pandas DataFrame as scikit-learn expects 2D array-like with columns
+    # Polars expressions (numeric and one-hot for the polars engine, label codes)
+    frames = []
+    if frame_num_cols or frame_cat_cols:
+        frames.append((frame_num_cols, frame_cat_cols, "onehot"))
+    if label_cols:
+        frames.append(([], label_cols, "label"))
+    for frame_num, frame_cat, encoding in frames:
+        frame = featurize_frame(
+            df,
+            frame_num,
+            frame_cat,
+            scale_numeric=scale_numeric,
+            categorical_encoding=encoding,
+            dtype=dtype,
+        )
+        if frame.width:
+            parts.append(sparse.csr_matrix(frame.to_numpy(order="fortran")))
+            feature_names.extend(frame.columns)
+
+    # Frequency, target and hashed encodings (group-by joins and hashes in Polars)
+    for col in categorical_cols:
+        col_encoding = encodings[col]
+        if col_encoding is None or col_encoding in LEVEL_ENCODINGS:
+            continue
+        block, names = _category_block(df, col, col_encoding, target_col, hash_buckets)
+        parts.append(block)
+        feature_names.extend(names)
+
+    if frame_cat_cols:
+        # Already one-hot encoded by the polars engine above
+        onehot_cols = []
+    if parallel is None:
+        n_columns = len(onehot_cols) + len(text_cols)
+        parallel = (
+            n_columns >= PARALLEL_FEATURIZE_MIN_COLUMNS
+            and len(df) >= PARALLEL_FEATURIZE_MIN_ROWS
+            and (os.cpu_count() or 1) > 1
+        )
+    if parallel and len(onehot_cols) + len(text_cols) > 1:
+        jobs = [("onehot", col) for col in onehot_cols]
+        jobs += [(text_encoding, col) for col in text_cols]
+        options = {"tfidf_max_features": tfidf_max_features, "hash_features": hash_features}
         try:
-            cat_df = df.select(categorical_cols).to_pandas()
+            blocks = encode_columns_parallel(df, jobs, options, max_workers=max_workers)
         except Exception:
-            # last resort: convert each series to list
-            cat_df = None
-        # Construct OneHotEncoder compatibly across scikit-learn versions
-        try:
-            encoder = OneHotEncoder(sparse_output=False, handle_unknown="ignore")
-        except TypeError:
-            # Older versions used `sparse` keyword
-            encoder = OneHotEncoder(sparse=False, handle_unknown="ignore")
-
-        if cat_df is not None:
-            X_cat = encoder.fit_transform(cat_df)
+            logger.warning(
+                "Parallel featurization failed; encoding columns serially", exc_info=True
+            )
         else:
-            rows = [[df[c][i] for c in categorical_cols] for i in range(len(df))]
-            X_cat = encoder.fit_transform(rows)
+            for block, names in blocks:
+                parts.append(block)
+                feature_names.extend(names)
+            onehot_cols = text_cols = []
+
+    # Categorical one-hot
+    if onehot_cols:
+        X_cat, names = _onehot_block(df, onehot_cols)
         parts.append(X_cat)
-        names = list(encoder.get_feature_names_out(categorical_cols))
         feature_names.extend(names)
 
-    # Text TF-IDF
+    # Text TF-IDF or hashed n-grams
     if text_cols:
-        for tcol in text_cols:
-            vec = TfidfVectorizer(max_features=tfidf_max_features)
-            # convert to python list of strings
-            series = df[tcol].fill_null("")
-            try:
-                texts = series.to_list()
-            except Exception:
-                texts = list(series)
-            X_t = vec.fit_transform(texts).toarray()
-            parts.append(X_t)
-            names = [f"{tcol}__tfidf__{n}" for n in vec.get_feature_names_out()]
-            feature_names.extend(names)
+        if text_encoding == "hashing":
+            text_parts, text_names = _hashed_blocks(df, text_cols, hash_features)
+        else:
+            text_parts, text_names = _tfidf_blocks(df, text_cols, tfidf_max_features)
+        parts.extend(text_parts)
+        feature_names.extend(text_names)
 
     if parts:
-        X = np.hstack(parts)
+        X = sparse.hstack(parts, format="csr", dtype=dtype)
     else:
-        X = np.zeros((len(df), 0))
+        X = sparse.csr_matrix((len(df), 0), dtype=dtype)
 
+    if dense:
+        # Fortran order lets add_features_to_df attach columns without copying
+        return X.toarray(order="F"), feature_names
     return X, feature_names
 
 
-def add_features_to_df(df: pl.DataFrame, X: np.ndarray, feature_names: List[str]) -> pl.DataFrame:
+def _sparse_columns(X, feature_names: List[str], dtype) -> dict:
+    # CSC stores each column contiguously, so every feature column is filled
+    # from its own nonzeros without densifying the whole matrix.
+    csc = sparse.csc_matrix(X)
+    cols = {}
+    for i, name in enumerate(feature_names):
+        start, end = csc.indptr[i], csc.indptr[i + 1]
+        values = np.zeros(csc.shape[0], dtype=dtype or csc.dtype)
+        values[csc.indices[start:end]] = csc.data[start:end]
+        cols[name] = values
+    return cols
+
+
+def _dense_columns(X, feature_names: List[str], dtype) -> dict:
+    # In Fortran order each column is a contiguous block, so the per-column
+    # views below are handed to Polars without another copy.
+    X = np.asarray(X)
+    if dtype is not None and X.dtype != dtype:
+        X = X.astype(dtype, order="F")
+    else:
+        X = np.asfortranarray(X)
+    return {name: X[:, i] for i, name in enumerate(feature_names)}
+
+
+def add_features_to_df(
+    df: pl.DataFrame, X, feature_names: List[str], dtype=None
+) -> pl.DataFrame:
     """Return a new Polars DataFrame with feature columns appended.
 
-    Feature columns will be named using the given `feature_names` list.
+    `X` may be a dense array or a sparse matrix. Feature columns will be
+    named using the given `feature_names` list, with a "__feature" suffix
+    where a name is already a column of `df` (scaled numeric features keep
+    their source column's name). Columns keep `X`'s dtype (float32 for
+    matrices from `generate_feature_matrix` by default) unless `dtype` is given.
     """
     if X.shape[1] != len(feature_names):
         raise ValueError("Number of columns in X does not match feature_names length")
+    if not feature_names:
+        return df
+    existing = set(df.columns)
+    feature_names = [f"{name}__feature" if name in existing else name for name in feature_names]
 
-    # build a dict of series
-    cols = {}
-    for i, name in enumerate(feature_names):
-        cols[name] = list(X[:, i])
+    if is_sparse(X):
+        cols = _sparse_columns(X, feature_names, dtype)
+    else:
+        cols = _dense_columns(X, feature_names, dtype)
+    return df.hstack(pl.DataFrame(cols))
 
-    feat_df = pl.DataFrame(cols)
-    return df.hstack(feat_df)
+
+def save_feature_matrix(path: str, X, feature_names: List[str]) -> None:
+    """Write `X` as a compressed CSR `.npz` together with its feature names.
+
+    The file is readable by `scipy.sparse.load_npz` as well as
+    `load_feature_matrix`, and is never densified.
+    """
+    _ensure_sklearn()
+    csr = sparse.csr_matrix(X)
+    np.savez_compressed(
+        path,
+        format=np.array(b"csr"),
+        shape=np.array(csr.shape),
+        data=csr.data,
+        indices=csr.indices,
+        indptr=csr.indptr,
+        feature_names=np.array(feature_names, dtype=str),
+    )
+
+
+def load_feature_matrix(path: str) -> Tuple["sparse.csr_matrix", List[str]]:
+    """Read a matrix written by `save_feature_matrix`."""
+    _ensure_sklearn()
+    with np.load(path) as data:
+        X = sparse.csr_matrix(
+            (data["data"], data["indices"], data["indptr"]), shape=tuple(data["shape"])
+        )
+        return X, [str(name) for name in data["feature_names"]]
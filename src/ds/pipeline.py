@@ -0,0 +1,311 @@
+"""Reusable, serializable featurization pipeline.
+
+`FeaturePipeline` fits scaling statistics, category levels and TF-IDF
+vocabularies once, saves them as JSON and applies them to new data with
+`transform` only, so repeated batches (e.g. daily scoring files) skip
+refitting and always produce the same feature columns in the same order.
+
+Numeric and categorical features are built with the Polars expressions of
+the "polars" engine in `ds.featurize`; TF-IDF is recomputed from the stored
+vocabulary and IDF weights with scikit-learn's `CountVectorizer`. Hashed
+text features (`text_encoding="hashing"`) have nothing to fit or store.
+
+`fit_lazy` and `transform_to_parquet` fit and apply a pipeline on inputs
+larger than memory by scanning them in batches.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import polars as pl
+
+from .featurize import (
+    DEFAULT_FEATURE_DTYPE,
+    DETECT_SAMPLE_ROWS,
+    HASH_N_FEATURES,
+    LEVEL_ENCODINGS,
+    TEXT_ENCODINGS,
+    _ensure_sklearn,
+    add_features_to_df,
+    _fit_polars_stats,
+    _frame_feature_exprs,
+    _high_cardinality_columns,
+    detect_columns,
+    feature_dtype,
+    hashed_feature_names,
+    hashed_text_features,
+    polars_float_type,
+    sparse,
+)
+
+try:
+    from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+    from sklearn.preprocessing import normalize
+except Exception:  # pragma: no cover - runtime dependency
+    CountVectorizer = TfidfVectorizer = normalize = None
+
+PIPELINE_FORMAT_VERSION = 1
+# Rows used to fit TF-IDF vocabularies in `fit_lazy`
+TEXT_SAMPLE_ROWS = 100_000
+
+
+class FeaturePipeline:
+    """Featurization that is fitted once and then only applied.
+
+    Columns default to `detect_columns` on the data passed to `fit`.
+    """
+
+    def __init__(
+        self,
+        numeric_cols: Optional[List[str]] = None,
+        categorical_cols: Optional[List[str]] = None,
+        text_cols: Optional[List[str]] = None,
+        scale_numeric: Optional[str] = "standard",
+        categorical_encoding: str = "onehot",
+        tfidf_max_features: int = 200,
+        text_encoding: str = "tfidf",
+        hash_features: int = HASH_N_FEATURES,
+        dtype=DEFAULT_FEATURE_DTYPE,
+    ) -> None:
+        if categorical_encoding not in LEVEL_ENCODINGS:
+            raise ValueError(f"Unsupported pipeline categorical encoding: {categorical_encoding}")
+        if text_encoding not in TEXT_ENCODINGS:
+            raise ValueError(f"Unsupported text encoding: {text_encoding}")
+        self.numeric_cols = numeric_cols
+        self.categorical_cols = categorical_cols
+        self.text_cols = text_cols
+        self.scale_numeric = scale_numeric
+        self.categorical_encoding = categorical_encoding
+        self.tfidf_max_features = tfidf_max_features
+        self.text_encoding = text_encoding
+        self.hash_features = hash_features
+        self.dtype = feature_dtype(dtype)
+        self.stats: Optional[Dict[str, Any]] = None
+        self.text_vocabularies: Dict[str, Dict[str, Any]] = {}
+        self.feature_names: List[str] = []
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.stats is not None
+
+    @property
+    def input_columns(self) -> List[str]:
+        return list(self.numeric_cols or []) + list(self.categorical_cols or []) + list(
+            self.text_cols or []
+        )
+
+    def fit(self, df: pl.DataFrame) -> "FeaturePipeline":
+        _ensure_sklearn()
+        numeric, categorical, _ = self._resolve_columns(df)
+        self._check_columns(df)
+        self.stats = _fit_polars_stats(df, numeric, categorical)
+        self._fit_text(df)
+        return self
+
+    def fit_lazy(
+        self, lf: pl.LazyFrame, text_sample_rows: int = TEXT_SAMPLE_ROWS
+    ) -> "FeaturePipeline":
+        """Fit from a LazyFrame (e.g. `pl.scan_parquet`) without loading it whole.
+
+        Statistics and category levels come from one query on the streaming
+        engine; column types are detected on the first rows and TF-IDF
+        vocabularies are fitted on about `text_sample_rows` rows taken evenly
+        across the input. Detected categorical columns whose distinct values
+        exceed the categorical limit over the whole input are treated as
+        text, so no level list grows without bound.
+        """
+        _ensure_sklearn()
+        head = lf.head(DETECT_SAMPLE_ROWS).collect()
+        detected = self.categorical_cols is None
+        numeric, categorical, text = self._resolve_columns(head)
+        wide = _high_cardinality_columns(lf, categorical) if detected else []
+        if wide:
+            categorical = [col for col in categorical if col not in wide]
+            text = [col for col in head.columns if col in text or col in wide]
+            self.categorical_cols, self.text_cols = categorical, text
+        self._check_columns(lf)
+        self.stats = _fit_polars_stats(lf, numeric, categorical, streaming=True)
+        sample = pl.DataFrame()
+        if text and self.text_encoding == "tfidf":
+            total = lf.select(pl.len()).collect(engine="streaming").item()
+            step = max(1, -(-total // text_sample_rows))
+            sample = lf.select(text).gather_every(step).collect(engine="streaming")
+        self._fit_text(sample)
+        return self
+
+    def _resolve_columns(
+        self, df: pl.DataFrame
+    ) -> Tuple[List[str], List[str], List[str]]:
+        if None in (self.numeric_cols, self.categorical_cols, self.text_cols):
+            numeric, categorical, text = detect_columns(df)
+            self.numeric_cols = numeric if self.numeric_cols is None else self.numeric_cols
+            if self.categorical_cols is None:
+                self.categorical_cols = categorical
+            self.text_cols = text if self.text_cols is None else self.text_cols
+        return self._columns()
+
+    def _columns(self) -> Tuple[List[str], List[str], List[str]]:
+        """(numeric, categorical, text) columns, once `fit` or `load` has set them."""
+        numeric, categorical, text = self.numeric_cols, self.categorical_cols, self.text_cols
+        if numeric is None or categorical is None or text is None:
+            raise ValueError("FeaturePipeline columns are unset; fit the pipeline first")
+        return numeric, categorical, text
+
+    def _fit_text(self, df: pl.DataFrame) -> None:
+        # Hashed text features are stateless; only TF-IDF learns a vocabulary
+        self.text_vocabularies = {}
+        text_cols = self._columns()[2]
+        for col in text_cols if self.text_encoding == "tfidf" else []:
+            vec = TfidfVectorizer(max_features=self.tfidf_max_features)
+            vec.fit(_texts(df, col))
+            self.text_vocabularies[col] = {
+                "terms": [str(term) for term in vec.get_feature_names_out()],
+                "idf": [float(w) for w in vec.idf_],
+            }
+        self.feature_names = self._frame_exprs_names()
+        for col in text_cols:
+            if self.text_encoding == "hashing":
+                self.feature_names += hashed_feature_names(col, self.hash_features)
+            else:
+                terms = self.text_vocabularies[col]["terms"]
+                self.feature_names += [f"{col}__tfidf__{term}" for term in terms]
+
+    def transform(self, df: pl.DataFrame, dense: bool = False) -> Tuple[Any, List[str]]:
+        """Apply the fitted pipeline; returns (X, feature_names) like `generate_feature_matrix`."""
+        if not self.is_fitted:
+            raise ValueError("FeaturePipeline must be fitted (or loaded) before transform")
+        self._check_columns(df)
+
+        parts = []
+        frame = self.transform_frame(df)
+        if frame.width:
+            parts.append(sparse.csr_matrix(frame.to_numpy(order="fortran")))
+        for col in self._columns()[2]:
+            if self.text_encoding == "hashing":
+                parts.append(hashed_text_features(df[col], self.hash_features))
+            else:
+                parts.append(self._tfidf(df, col))
+
+        if parts:
+            X = sparse.hstack(parts, format="csr", dtype=self.dtype)
+        else:
+            X = sparse.csr_matrix((len(df), 0), dtype=self.dtype)
+        if dense:
+            return X.toarray(order="F"), list(self.feature_names)
+        return X, list(self.feature_names)
+
+    def fit_transform(self, df: pl.DataFrame, dense: bool = False) -> Tuple[Any, List[str]]:
+        return self.fit(df).transform(df, dense=dense)
+
+    def transform_frame(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Numeric and categorical features only, as a Polars DataFrame."""
+        exprs = self._frame_exprs()
+        if not exprs:
+            return pl.DataFrame()
+        float_type = polars_float_type(self.dtype)
+        return df.lazy().select([expr.cast(float_type) for expr in exprs]).collect()
+
+    def _frame_exprs(self) -> List[pl.Expr]:
+        if self.stats is None:
+            raise ValueError("FeaturePipeline must be fitted (or loaded) before transform")
+        numeric, categorical, _ = self._columns()
+        return _frame_feature_exprs(
+            self.stats,
+            numeric,
+            categorical,
+            self.scale_numeric,
+            self.categorical_encoding,
+        )
+
+    def _frame_exprs_names(self) -> List[str]:
+        return [expr.meta.output_name() for expr in self._frame_exprs()]
+
+    def transform_to_parquet(self, lf: pl.LazyFrame, path: str, dtype=None) -> None:
+        """Stream `lf` through the pipeline into a Parquet file at `path`.
+
+        Each batch of the scan (a row group for Parquet input) is transformed
+        and written as it arrives, so memory is bounded by the batch size
+        rather than the input size. The output holds the input columns plus
+        the feature columns, as `add_features_to_df` would build them.
+        """
+        if not self.is_fitted:
+            raise ValueError("FeaturePipeline must be fitted (or loaded) before transform")
+        self._check_columns(lf)
+
+        def _batch(df: pl.DataFrame) -> pl.DataFrame:
+            X, names = self.transform(df)
+            return add_features_to_df(df, X, names, dtype=dtype)
+
+        schema = _batch(lf.head(0).collect()).schema
+        lf.map_batches(_batch, schema=schema, streamable=True).sink_parquet(path)
+
+    def _tfidf(self, df: pl.DataFrame, col: str):
+        # Same weighting as TfidfVectorizer's defaults: raw counts times the
+        # stored IDF, then L2-normalized rows.
+        vocab = self.text_vocabularies[col]
+        counter = CountVectorizer(vocabulary=vocab["terms"])
+        counts = counter.transform(_texts(df, col)).astype(np.float64)
+        weighted = counts.multiply(np.asarray(vocab["idf"])).tocsr()
+        if weighted.shape[0] == 0:
+            return weighted
+        return normalize(weighted, norm="l2", copy=False)
+
+    def _check_columns(self, df) -> None:
+        columns = df.collect_schema().names()
+        missing = [col for col in self.input_columns if col not in columns]
+        if missing:
+            raise ValueError(f"Input is missing pipeline columns: {', '.join(missing)}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": PIPELINE_FORMAT_VERSION,
+            "numeric_cols": self.numeric_cols,
+            "categorical_cols": self.categorical_cols,
+            "text_cols": self.text_cols,
+            "scale_numeric": self.scale_numeric,
+            "categorical_encoding": self.categorical_encoding,
+            "tfidf_max_features": self.tfidf_max_features,
+            "text_encoding": self.text_encoding,
+            "hash_features": self.hash_features,
+            "dtype": self.dtype,
+            "stats": self.stats,
+            "text_vocabularies": self.text_vocabularies,
+            "feature_names": self.feature_names,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeaturePipeline":
+        if data.get("version") != PIPELINE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported feature pipeline version: {data.get('version')}")
+        pipeline = cls(
+            numeric_cols=data["numeric_cols"],
+            categorical_cols=data["categorical_cols"],
+            text_cols=data["text_cols"],
+            scale_numeric=data["scale_numeric"],
+            categorical_encoding=data["categorical_encoding"],
+            tfidf_max_features=data["tfidf_max_features"],
+            text_encoding=data["text_encoding"],
+            hash_features=data["hash_features"],
+            dtype=data["dtype"],
+        )
+        pipeline.stats = data["stats"]
+        pipeline.text_vocabularies = data["text_vocabularies"]
+        pipeline.feature_names = data["feature_names"]
+        return pipeline
+
+    def save(self, path: str) -> None:
+        if not self.is_fitted:
+            raise ValueError("Only a fitted FeaturePipeline can be saved")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "FeaturePipeline":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def _texts(df: pl.DataFrame, col: str) -> List[str]:
+    return df[col].cast(pl.Utf8).fill_null("").to_list()
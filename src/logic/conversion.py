@@ -0,0 +1,250 @@
+"""Column type conversion helpers shared by the single and batch convert actions.
+
+Conversions are built as one list of converted series so a whole batch is
+applied with a single `with_columns` call (and therefore a single undo entry).
+Values that do not convert are reported per column (`ParseFailureReport`)
+rather than failing the conversion with a bare error.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import polars as pl
+
+from .parsers import (
+    ISO_OFFSET_PATTERN,
+    FormatCache,
+    ParseFailureReport,
+    build_failure_report,
+    convert_unique_values,
+    detect_datetime_format,
+    is_epoch_series,
+    parse_datetime_with_report,
+)
+
+TYPE_MAP = {
+    "String": pl.Utf8,
+    "Integer": pl.Int64,
+    "Float": pl.Float64,
+    "Boolean": pl.Boolean,
+    "Date": pl.Date,
+    "Datetime": pl.Datetime,
+}
+TYPE_NAMES = list(TYPE_MAP)
+AUTO_DETECT = "Auto-detect"
+
+# Rows sampled per column when inferring types
+INFER_SAMPLE_ROWS = 1000
+
+_BOOLEAN_STRINGS = ["true", "false"]
+_INTEGER_PATTERN = r"^[+-]?\d+$"
+_FLOAT_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+# Zip codes, account IDs etc.; converting them to numbers drops the zeros
+_LEADING_ZERO_PATTERN = r"^[+-]?0\d"
+
+
+class ConversionError(ValueError):
+    """Raised by strict conversions; `reports` maps column name to its failures."""
+
+    def __init__(self, reports: Dict[str, ParseFailureReport]) -> None:
+        self.reports = reports
+        super().__init__("\n".join(report.summary() for report in reports.values()))
+
+
+def convert_column(
+    df: pl.DataFrame,
+    column_name: str,
+    type_name: str,
+    format_cache: Optional[FormatCache] = None,
+    source: Optional[str] = None,
+) -> Tuple[pl.Series, ParseFailureReport]:
+    """Convert one column, leaving values that do not convert null.
+
+    Text and epoch-sized numeric columns converted to Date/Datetime go through
+    the vectorized datetime parser; other numbers are cast as before and
+    other text conversions cast each distinct value once.
+    Returns the converted series and a report of the failed rows.
+    """
+    if column_name not in df.columns:
+        raise ValueError(f"Column '{column_name}' not found.")
+    if type_name not in TYPE_MAP:
+        raise ValueError(f"Unsupported target type: {type_name}")
+
+    target_type = TYPE_MAP[type_name]
+    series = df[column_name]
+    if type_name in ("Date", "Datetime") and (
+        series.dtype == pl.Utf8 or (series.dtype.is_numeric() and is_epoch_series(series))
+    ):
+        converted, report = parse_datetime_with_report(series, format_cache, source)
+        if type_name == "Date":
+            converted = converted.cast(pl.Date)
+        return converted.alias(column_name), report
+    if series.dtype != pl.Utf8:
+        converted = series.cast(target_type, strict=False)
+    elif type_name == "Boolean":
+        converted = convert_unique_values(
+            series,
+            lambda values: values.str.strip_chars().str.to_lowercase().replace_strict(
+                _BOOLEAN_STRINGS, [True, False], default=None, return_dtype=pl.Boolean
+            ),
+        )
+    else:
+        converted = convert_unique_values(
+            series, lambda values: values.cast(target_type, strict=False)
+        )
+    return converted.alias(column_name), build_failure_report(series, converted)
+
+
+def _convert_all(
+    df: pl.DataFrame,
+    targets: Dict[str, str],
+    format_cache: Optional[FormatCache],
+    source: Optional[str],
+) -> Tuple[List[pl.Series], Dict[str, ParseFailureReport]]:
+    converted = []
+    failures = {}
+    for name, type_name in targets.items():
+        series, report = convert_column(df, name, type_name, format_cache, source)
+        converted.append(series)
+        if not report.ok:
+            failures[name] = report
+    return converted, failures
+
+
+def convert_columns_with_report(
+    df: pl.DataFrame,
+    targets: Dict[str, str],
+    format_cache: Optional[FormatCache] = None,
+    source: Optional[str] = None,
+) -> Tuple[pl.DataFrame, Dict[str, ParseFailureReport]]:
+    """Convert several columns in one `with_columns` call and report failures.
+
+    Values that do not convert become null; the returned dict only holds
+    the columns that had failures.
+    """
+    if not targets:
+        return df, {}
+    converted, failures = _convert_all(df, targets, format_cache, source)
+    return df.with_columns(converted), failures
+
+
+def convert_columns(
+    df: pl.DataFrame,
+    targets: Dict[str, str],
+    format_cache: Optional[FormatCache] = None,
+    source: Optional[str] = None,
+    strict: bool = True,
+) -> pl.DataFrame:
+    """Convert several columns at once with a single `with_columns` call."""
+    new_df, failures = convert_columns_with_report(df, targets, format_cache, source)
+    if strict and failures:
+        raise ConversionError(failures)
+    return new_df
+
+
+def failed_rows(df: pl.DataFrame, reports: Dict[str, ParseFailureReport]) -> pl.DataFrame:
+    """Return the rows of `df` that failed in any of `reports`, in row order."""
+    if not reports:
+        return df.clear()
+    indices = pl.concat([report.row_indices for report in reports.values()]).unique().sort()
+    return df.select(pl.all().gather(indices))
+
+
+def _classification_exprs(name: str, key: str) -> List[pl.Expr]:
+    """Aggregates telling whether every non-null value of `name` fits a type.
+
+    Regexes screen the layout and strict casts confirm the value (e.g. that
+    an integer fits in Int64); all flags reduce to one boolean per column.
+    """
+    col = pl.col(name)
+    present = col.is_not_null()
+
+    def every(matches: pl.Expr) -> pl.Expr:
+        return (matches.fill_null(False) | ~present).all()
+
+    lowered = col.str.strip_chars().str.to_lowercase()
+    keeps_zeros = ~col.str.contains(_LEADING_ZERO_PATTERN)
+    return [
+        present.any().alias(f"{key}_any"),
+        every(
+            col.str.contains(_INTEGER_PATTERN)
+            & keeps_zeros
+            & col.cast(pl.Int64, strict=False).is_not_null()
+        ).alias(f"{key}_int"),
+        every(
+            col.str.contains(_FLOAT_PATTERN)
+            & keeps_zeros
+            & col.cast(pl.Float64, strict=False).is_not_null()
+        ).alias(f"{key}_float"),
+        every(lowered.is_in(_BOOLEAN_STRINGS)).alias(f"{key}_bool"),
+        every(col.str.strip_chars().str.contains(ISO_OFFSET_PATTERN)).alias(f"{key}_iso"),
+    ]
+
+
+def infer_conversion_targets(
+    df: pl.DataFrame,
+    columns: Optional[List[str]] = None,
+    sample_size: int = INFER_SAMPLE_ROWS,
+    max_workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """Map each convertible text column (of `columns`, default all) to a type name.
+
+    The first `sample_size` rows of every text column are classified as
+    integer/float/boolean in a single query that Polars evaluates in parallel
+    across columns; columns left over are checked for date/datetime layouts
+    on a thread pool.
+    """
+    names = [
+        name
+        for name in (columns if columns is not None else df.columns)
+        if df.schema[name] == pl.Utf8
+    ]
+    if not names:
+        return {}
+
+    sample = df.select(names).head(sample_size)
+    exprs = []
+    for i, name in enumerate(names):
+        exprs.extend(_classification_exprs(name, f"c{i}"))
+    flags = sample.select(exprs).row(0, named=True)
+
+    targets: Dict[str, str] = {}
+    undecided = []
+    for i, name in enumerate(names):
+        key = f"c{i}"
+        if not flags[f"{key}_any"]:
+            continue
+        if flags[f"{key}_int"]:
+            targets[name] = "Integer"
+        elif flags[f"{key}_float"]:
+            targets[name] = "Float"
+        elif flags[f"{key}_bool"]:
+            targets[name] = "Boolean"
+        elif flags[f"{key}_iso"]:
+            targets[name] = "Datetime"
+        else:
+            undecided.append(name)
+
+    if undecided:
+        workers = max_workers or min(len(undecided), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            detections = pool.map(
+                lambda name: detect_datetime_format(sample[name], sample_size), undecided
+            )
+            for name, detected in zip(undecided, detections):
+                if detected is not None:
+                    targets[name] = "Datetime" if detected[0] == pl.Datetime else "Date"
+
+    # Keep the caller's column order
+    return {name: targets[name] for name in names if name in targets}
+
+
+def infer_column_type(series: pl.Series, sample_size: int = INFER_SAMPLE_ROWS) -> Optional[str]:
+    """Guess the type name a text column converts to cleanly, or None."""
+    name = series.name or "__col"
+    return infer_conversion_targets(series.alias(name).to_frame(), sample_size=sample_size).get(
+        name
+    )
@@ -63,9 +63,31 @@ DATE_REGEX_HINTS = [
     r"^\d{4}-\d{2}-\d{2}$",  # 2024-01-31
     r"^\d{1,2}/\d{1,2}/\d{2,4}$",  # 1/31/24 or 01/31/2024
     r"^\d{1,2}-\d{1,2}-\d{2,4}$",  # 31-01-2024
+    r"^\d{4}/\d{2}/\d{2}$",  # 2024/01/31
 ]
 
 DATETIME_REGEX_HINTS = [
     r"^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(:\d{2})?(\.\d+)?$",
-    r"^\d{1,2}/\d{1,2}/\d{2,4} \d{2}:\d{2}(:\d{2})?$",
+    r"^\d{1,2}/\d{1,2}/\d{2,4} \d{2}:\d{2}(:\d{2})?(\.\d+)?$",
+    r"^\d{1,2}-\d{1,2}-\d{2,4} \d{2}:\d{2}(:\d{2})?(\.\d+)?$",
+    r"^\d{4}/\d{2}/\d{2} \d{2}:\d{2}(:\d{2})?(\.\d+)?$",
 ]
+
+# Format prefixes that each hint above can correspond to, index-aligned with
+# both hint lists. Used to shortlist candidate formats before validating them.
+_HINT_FORMAT_PREFIXES = [
+    ("%Y-%m-%d",),
+    ("%m/%d/", "%d/%m/"),
+    ("%d-%m-",),
+    ("%Y/%m/%d",),
+]
+
+DATE_HINT_FORMATS = {
+    hint: [f for f in DATE_FORMATS if f.startswith(prefixes)]
+    for hint, prefixes in zip(DATE_REGEX_HINTS, _HINT_FORMAT_PREFIXES)
+}
+
+DATETIME_HINT_FORMATS = {
+    hint: [f for f in DATETIME_FORMATS if f.startswith(prefixes)]
+    for hint, prefixes in zip(DATETIME_REGEX_HINTS, _HINT_FORMAT_PREFIXES)
+}
@@ -5,20 +5,47 @@ These functions are pure and small so they can be unit-tested without GUI.
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, cast
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import datetime
+import hashlib
+import json
 import logging
+import os
+import re
 
 import polars as pl
 
 from .date_formats import (
+    DATE_FORMATS,
+    DATE_HINT_FORMATS,
     DATETIME_FORMATS,
+    DATETIME_HINT_FORMATS,
     PY_DATETIME_FORMATS,
     PY_DATE_FORMATS,
 )
 
 logger = logging.getLogger(__name__)
 
+FORMAT_CACHE_ENV = "PARQCEL_FORMAT_CACHE_FILE"
+
+_DTYPE_NAMES = {pl.Datetime: "datetime", pl.Date: "date"}
+_DTYPES_BY_NAME = {name: dtype for dtype, name in _DTYPE_NAMES.items()}
+
+# Regex for each chrono directive used in `date_formats`, used to pre-screen
+# values before `str.strptime`.
+_FORMAT_TOKEN_PATTERNS = {
+    "%Y": r"\d{4}",
+    "%y": r"\d{2}",
+    "%m": r"\d{1,2}",
+    "%d": r"\d{1,2}",
+    "%H": r"\d{1,2}",
+    "%M": r"\d{1,2}",
+    "%S": r"\d{1,2}",
+    "%.f": r"(\.\d+)?",
+}
+
 
 def detect_format_for_samples(
     values: Iterable[Any], formats: Iterable[str], sample_size: int = 500
@@ -110,43 +137,187 @@ def parse_list_of_datetimes(values: Iterable[Any]) -> List[Optional[datetime.dat
     return [parse_single_datetime(v) for v in values]
 
 
-def _extract_sample_values(series: "pl.Series", sample_size: int = 500) -> List[str]:
-    """Extract a sample of non-empty string values from a series for format detection.
+@lru_cache(maxsize=None)
+def _format_regex(fmt: str) -> str:
+    """Translate a chrono format into an anchored regex of its shape."""
+    parts = []
+    for token in re.split(r"(%\.f|%.)", fmt):
+        if not token:
+            continue
+        parts.append(_FORMAT_TOKEN_PATTERNS.get(token, re.escape(token)))
+    return "^" + "".join(parts) + "$"
+
+
+def _strptime_expr(
+    expr: "pl.Expr", dtype: Any, fmt: str, strict: bool = False
+) -> "pl.Expr":
+    """`str.strptime` that only sees values shaped like `fmt`.
+
+    Polars' fixed-width fast path can panic (rather than return null) on
+    values of the right length but the wrong layout, e.g. "12/31/2023" with
+    "%Y-%m-%d". Masking non-matching values to null first avoids that and
+    skips work on values that cannot parse anyway. Surrounding whitespace is
+    stripped first, as format detection does.
+    """
+    expr = expr.str.strip_chars()
+    shaped = pl.when(expr.str.contains(_format_regex(fmt))).then(expr)
+    return shaped.str.strptime(dtype, fmt, strict=strict)
+
+
+def _sample_strings(series: "pl.Series", sample_size: int = 500) -> "pl.Series":
+    """Return the non-empty, stripped string values among the first rows.
 
     Args:
         series: The Polars series to sample from
-        sample_size: Maximum number of samples to collect
+        sample_size: Number of leading rows to sample
 
     Returns:
-        List of non-empty string values
+        Utf8 series with at most `sample_size` values
     """
-    sample_vals: List[str] = []
-    try:
-        sampled = series.head(sample_size)
-        for v in sampled.to_list():
-            if v is None:
-                continue
-            s = str(v).strip()
-            if s:
-                sample_vals.append(s)
-            if len(sample_vals) >= sample_size:
-                break
-    except Exception:
-        # Fallback iterator: try iterating the series if head()/to_list() failed
-        logger.debug(
-            "Head-based sampling failed; falling back to iterator sampling",
-            exc_info=True,
-        )
-        for v in series:
-            if v is None:
-                continue
-            s = str(v).strip()
-            if s:
-                sample_vals.append(s)
-            if len(sample_vals) >= sample_size:
-                break
+    sample = series.head(sample_size).cast(pl.Utf8).str.strip_chars().drop_nulls()
+    return sample.filter(sample != "")
+
+
+def _candidate_formats(sample: "pl.Series") -> List[Tuple[Any, str]]:
+    """Shortlist (dtype, format) candidates whose regex hint matches every sample.
+
+    All hints are evaluated in a single vectorized query. If no hint covers the
+    whole sample (mixed or unusual layouts) every known format is a candidate.
+    """
+    hint_groups = [
+        (pl.Datetime, DATETIME_HINT_FORMATS),
+        (pl.Date, DATE_HINT_FORMATS),
+    ]
+    exprs = []
+    for dtype_index, (_, hints) in enumerate(hint_groups):
+        for hint_index, hint in enumerate(hints):
+            exprs.append(
+                pl.col("s").str.contains(hint).all().alias(f"{dtype_index}_{hint_index}")
+            )
+    matched = sample.to_frame("s").select(exprs).row(0)
+
+    candidates: List[Tuple[Any, str]] = []
+    flags = iter(matched)
+    for dtype, hints in hint_groups:
+        for formats in hints.values():
+            if next(flags):
+                candidates.extend((dtype, fmt) for fmt in formats)
+
+    if not candidates:
+        candidates = [(pl.Datetime, fmt) for fmt in DATETIME_FORMATS]
+        candidates += [(pl.Date, fmt) for fmt in DATE_FORMATS]
+    return candidates
+
+
+def _detect_from_sample(sample: "pl.Series") -> Optional[Tuple[Any, str]]:
+    if sample.is_empty():
+        return None
+
+    frame = sample.to_frame("s")
+    for dtype, fmt in _candidate_formats(sample):
+        try:
+            parsed = frame.select(_strptime_expr(pl.col("s"), dtype, fmt)).to_series()
+        except Exception:
+            continue
+        if parsed.null_count() == 0:
+            return dtype, fmt
+    return None
+
+
+def detect_datetime_format(
+    series: "pl.Series", sample_size: int = 500
+) -> Optional[Tuple[Any, str]]:
+    """Detect a Polars (dtype, format) pair that parses a sample of `series`.
+
+    Candidate formats are shortlisted with the regex hints from
+    `date_formats` and validated with vectorized `str.strptime`; datetime
+    formats are preferred over date-only ones. Returns None if no format
+    parses every sampled value.
+    """
+    return _detect_from_sample(_sample_strings(series, sample_size))
+
+
+def default_format_cache_path() -> str:
+    return os.environ.get(FORMAT_CACHE_ENV) or os.path.join(
+        os.path.expanduser("~"), ".parqcel", "format_cache.json"
+    )
 
-    return sample_vals
+
+class FormatCache:
+    """Persistent memo of detected datetime formats.
+
+    Entries are keyed by (source file, column name, sample fingerprint) and
+    record the detected format plus whether it parsed the whole column, so a
+    repeated conversion of the same data can skip detection (and a known
+    failing fast path) entirely. Stored as JSON next to the user config.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 1000) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if path:
+            self.load()
+
+    @staticmethod
+    def make_key(source: Optional[str], column: str, sample: "pl.Series") -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for value in sample.to_list():
+            digest.update(value.encode("utf-8", "surrogatepass"))
+            digest.update(b"\x1f")
+        return json.dumps([source or "", column, digest.hexdigest()])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(key)
+
+    def put(
+        self,
+        key: str,
+        detected: Optional[Tuple[Any, str]],
+        fast_path_ok: bool,
+    ) -> None:
+        dtype_name, fmt = None, None
+        if detected is not None:
+            dtype_name, fmt = _DTYPE_NAMES.get(detected[0]), detected[1]
+        # Re-insert so the dict stays ordered from least to most recent.
+        self._entries.pop(key, None)
+        self._entries[key] = {
+            "dtype": dtype_name,
+            "format": fmt,
+            "fast_path_ok": fast_path_ok,
+        }
+        while len(self._entries) > self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = data
+        except Exception:
+            logger.warning("Ignoring unreadable format cache %s", self.path, exc_info=True)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+        except Exception:
+            logger.warning("Failed to save format cache %s", self.path, exc_info=True)
+
+
+def _cached_detection(entry: Dict[str, Any]) -> Optional[Tuple[Any, str]]:
+    dtype_name = entry.get("dtype")
+    dtype = _DTYPES_BY_NAME.get(dtype_name) if isinstance(dtype_name, str) else None
+    fmt = entry.get("format")
+    if dtype is None or not fmt:
+        return None
+    return dtype, fmt
 
 
 def _try_vectorized_datetime_parse(
@@ -165,8 +336,8 @@ def _try_vectorized_datetime_parse(
     try:
         # Convert Python format to Polars format if needed
         polars_fmt = fmt.replace(".%f", "%.f") if "%.f" not in fmt else fmt
-        out = series.str.strptime(pl.Datetime, polars_fmt, strict=strict)
-        return out
+        expr = _strptime_expr(pl.col("s"), pl.Datetime, polars_fmt, strict=strict)
+        return series.to_frame("s").select(expr).to_series().alias(series.name)
     except Exception:
         logger.debug("Vectorized parse failed for format: %s", fmt, exc_info=False)
         return None
@@ -186,7 +357,8 @@ def _try_vectorized_date_parse(
         Parsed series (as Datetime) if successful, None otherwise
     """
     try:
-        date_out = series.str.strptime(pl.Date, fmt, strict=strict)
+        expr = _strptime_expr(pl.col("s"), pl.Date, fmt, strict=strict)
+        date_out = series.to_frame("s").select(expr).to_series().alias(series.name)
         # Cast Date -> Datetime (midnight)
         return date_out.cast(pl.Datetime)
     except Exception:
@@ -194,51 +366,430 @@ def _try_vectorized_date_parse(
         return None
 
 
+def _unparsed_mask(series: "pl.Series", parsed: "pl.Series") -> "pl.Series":
+    """Mask of values that have text but did not parse.
+
+    Null and blank inputs are expected to stay null and do not count.
+    """
+    has_text = series.str.strip_chars().ne("").fill_null(False)
+    return parsed.is_null() & has_text
+
+
+# Fast-path parses of longer columns validate the first chunk, then parse the
+# remaining chunks on a thread pool.
+PARSE_CHUNK_ROWS = 500_000
+
+
+def _parse_validated_chunk(
+    chunk: "pl.Series", parse: Callable[["pl.Series"], Optional["pl.Series"]]
+) -> Optional["pl.Series"]:
+    out = parse(chunk)
+    if out is None or _unparsed_mask(chunk, out).any():
+        return None
+    return out
+
+
+def _parse_chunked(
+    series: "pl.Series",
+    parse: Callable[["pl.Series"], Optional["pl.Series"]],
+    chunk_rows: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> Optional["pl.Series"]:
+    """Parse `series` chunk by chunk, or return None if any value does not parse.
+
+    The first chunk is parsed alone so a wrong format fails after
+    `chunk_rows` values instead of the whole column; the remaining chunks
+    run in parallel and the first one to fail, in whatever order they
+    finish, cancels those not yet started.
+    """
+    chunk_rows = chunk_rows or PARSE_CHUNK_ROWS
+    first = _parse_validated_chunk(series.slice(0, chunk_rows), parse)
+    if first is None or len(series) <= chunk_rows:
+        return first
+
+    offsets = range(chunk_rows, len(series), chunk_rows)
+    parts: List[Optional["pl.Series"]] = [first] + [None] * len(offsets)
+    pool = ThreadPoolExecutor(max_workers=max_workers or min(len(offsets), os.cpu_count() or 1))
+    try:
+        futures = {
+            pool.submit(_parse_validated_chunk, series.slice(offset, chunk_rows), parse): i
+            for i, offset in enumerate(offsets, start=1)
+        }
+        for future in as_completed(futures):
+            part = future.result()
+            if part is None:
+                for pending in futures:
+                    pending.cancel()
+                return None
+            parts[futures[future]] = part
+    finally:
+        # Chunks still running after a failure finish in the background
+        pool.shutdown(wait=False, cancel_futures=True)
+    return pl.concat(cast(List["pl.Series"], parts), rechunk=True)
+
+
+# ISO-8601 / RFC 3339 timestamps with a UTC offset ("Z", "+02:00", "+0200")
+ISO_OFFSET_PATTERN = (
+    r"^\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}(:\d{2}(\.\d{1,9})?)?([Zz]|[+-]\d{2}:?\d{2})$"
+)
+_ISO_OFFSET_FORMAT = "%Y-%m-%dT%H:%M:%S%.f%z"
+# Integer/float epochs; 9+ integer digits keeps %Y%m%d-style values out
+_EPOCH_STRING_PATTERN = r"^[+-]?\d{9,19}(\.\d+)?$"
+# The same 9-19 integer digit range for numeric columns
+_EPOCH_MIN_ABS = 1e8
+_EPOCH_MAX_ABS = 1e19
+# Upper bounds on |value| per epoch unit (seconds reach 1e11 in year 5138)
+_EPOCH_UNIT_LIMITS = (("s", 1e11), ("ms", 1e14), ("us", 1e17))
+_EPOCH_TO_MICROSECONDS = {"s": 1_000_000, "ms": 1_000, "us": 1, "ns": 0.001}
+
+
+def _iso_offset_expr(expr: "pl.Expr") -> "pl.Expr":
+    """Parse ISO-8601/RFC 3339 strings with offsets to naive UTC datetimes.
+
+    Variants ("Z", a space separator, "+0200", missing seconds) are
+    normalized to one layout first so a single strptime handles them all;
+    values that are not shaped like an offset timestamp stay null.
+    """
+    text = expr.str.strip_chars()
+    shaped = pl.when(text.str.contains(ISO_OFFSET_PATTERN)).then(text)
+    normalized = (
+        shaped.str.replace(r"[Zz]$", "+00:00")
+        .str.replace(r"^(\d{4}-\d{2}-\d{2})[Tt ]", "${1}T")
+        .str.replace(r"([+-]\d{2})(\d{2})$", "${1}:${2}")
+        .str.replace(r"T(\d{2}:\d{2})([+-])", "T${1}:00${2}")
+    )
+    return (
+        normalized.str.strptime(pl.Datetime("us", "UTC"), _ISO_OFFSET_FORMAT, strict=False)
+        .dt.replace_time_zone(None)
+    )
+
+
+def epoch_time_unit(max_abs: float) -> str:
+    """Guess the unit ("s", "ms", "us" or "ns") of epoch values from their magnitude."""
+    for unit, limit in _EPOCH_UNIT_LIMITS:
+        if max_abs < limit:
+            return unit
+    return "ns"
+
+
+def is_epoch_series(series: "pl.Series") -> bool:
+    """True if every non-null value of a numeric series is sized like an epoch.
+
+    Applies the 9-19 integer digit rule of `_EPOCH_STRING_PATTERN`, so day
+    counts and %Y%m%d-style integers are not read as epochs.
+    """
+    magnitude = series.drop_nulls().abs().cast(pl.Float64)
+    if magnitude.is_empty():
+        return False
+    return bool(((magnitude >= _EPOCH_MIN_ABS) & (magnitude < _EPOCH_MAX_ABS)).all())
+
+
+def parse_epoch_series(series: "pl.Series") -> "pl.Series":
+    """Convert numeric epoch values to naive UTC `pl.Datetime` ("us").
+
+    The unit is chosen from the largest magnitude in the column, so a column
+    mixing units is not supported.
+    """
+    max_abs = series.abs().cast(pl.Float64).max()
+    if max_abs is None:
+        return pl.Series(series.name, [None] * len(series), dtype=pl.Datetime)
+    factor = _EPOCH_TO_MICROSECONDS[epoch_time_unit(cast(float, max_abs))]
+    if series.dtype.is_integer() and factor >= 1:
+        micros = series.cast(pl.Int64) * int(factor)
+    else:
+        micros = (series.cast(pl.Float64) * factor).round(0).cast(pl.Int64)
+    return micros.cast(pl.Datetime("us")).alias(series.name)
+
+
+def _try_special_datetime_parse(
+    series: "pl.Series", sample: "pl.Series"
+) -> Optional["pl.Series"]:
+    """Fast paths for offset timestamps and epoch strings, ahead of the format loop.
+
+    Chosen only when every sampled value has the shape; returns None otherwise.
+    """
+    if sample.is_empty():
+        return None
+    if sample.str.contains(ISO_OFFSET_PATTERN).all():
+        parsed = series.to_frame("s").select(_iso_offset_expr(pl.col("s"))).to_series()
+        return parsed.alias(series.name)
+    if sample.str.contains(_EPOCH_STRING_PATTERN).all():
+        dtype = pl.Float64 if sample.str.contains(".", literal=True).any() else pl.Int64
+        col = pl.col("s").str.strip_chars()
+        numeric = (
+            series.to_frame("s")
+            .select(pl.when(col.str.contains(_EPOCH_STRING_PATTERN)).then(col).cast(dtype))
+            .to_series()
+        )
+        return parse_epoch_series(numeric.alias(series.name))
+    return None
+
+
+def _coalesce_formats_parse(series: "pl.Series") -> Optional["pl.Series"]:
+    """Parse with every known format in one query, keeping the first match.
+
+    Offset timestamps (normalized to UTC) come first, safe (4-digit year)
+    datetime formats win over ambiguous `%y` ones, and date-only formats (cast to midnight) come last. Polars evaluates the
+    candidate expressions in parallel in a single pass over the data.
+    """
+    col = pl.col("s")
+    safe = [f for f in DATETIME_FORMATS if "%y" not in f]
+    ambiguous = [f for f in DATETIME_FORMATS if "%y" in f]
+    exprs = [_iso_offset_expr(col)]
+    exprs += [_strptime_expr(col, pl.Datetime, f) for f in safe + ambiguous]
+    exprs += [_strptime_expr(col, pl.Date, f).cast(pl.Datetime) for f in DATE_FORMATS]
+    try:
+        return series.to_frame("s").select(pl.coalesce(exprs)).to_series()
+    except Exception:
+        logger.debug("Coalesced multi-format parse failed", exc_info=True)
+        return None
+
+
 def _apply_python_fallback_parsing(
     series: "pl.Series", partially_parsed: Optional["pl.Series"]
-) -> List[Optional[datetime.datetime]]:
-    """Apply Python-based per-value parsing for remaining nulls.
+) -> "pl.Series":
+    """Apply Python-based parsing to the values vectorized parsing missed.
+
+    Only the distinct unparsed strings are parsed in Python; the results are
+    mapped back onto the column with a vectorized lookup.
 
     Args:
-        series: Original series
+        series: Original Utf8 series
         partially_parsed: Series with some values already parsed (or None)
 
     Returns:
-        List of parsed datetime values
+        Datetime series aligned with `series`
     """
     if partially_parsed is None:
-        # Parse all values
-        return [parse_single_datetime(v) for v in series.to_list()]
-
-    # Parse only the null values
-    parsed_vals = partially_parsed.to_list()
-    null_mask = partially_parsed.is_null().to_list()
-    for i, is_null in enumerate(null_mask):
-        if is_null:
-            try:
-                parsed_vals[i] = parse_single_datetime(series[i])
-            except Exception:
-                logger.debug(
-                    "Python fallback parsing failed for index %d", i, exc_info=True
-                )
+        partially_parsed = pl.Series(
+            series.name, [None] * len(series), dtype=pl.Datetime
+        )
+
+    unparsed = series.filter(_unparsed_mask(series, partially_parsed)).unique()
+    if unparsed.is_empty():
+        return partially_parsed
+
+    mapped = pl.Series(
+        [parse_single_datetime(v) for v in unparsed.to_list()], dtype=pl.Datetime
+    )
+    fill = series.replace_strict(
+        unparsed, mapped, default=None, return_dtype=pl.Datetime
+    )
+    return partially_parsed.fill_null(fill)
+
+
+# Conversions of columns whose head repeats values this much (distinct/rows)
+# parse only the distinct strings and map the results back.
+LOW_CARDINALITY_RATIO = 0.5
+_CARDINALITY_SAMPLE_ROWS = 10_000
+
+
+def is_low_cardinality(
+    series: "pl.Series",
+    ratio: float = LOW_CARDINALITY_RATIO,
+    sample_rows: int = _CARDINALITY_SAMPLE_ROWS,
+) -> bool:
+    """Whether `series` repeats enough values to be worth deduplicating.
+
+    Only the first `sample_rows` values are counted, so the check stays cheap
+    on large columns.
+    """
+    head = series.head(sample_rows)
+    if head.len() < 2:
+        return False
+    return head.n_unique() <= ratio * head.len()
+
+
+def map_unique_values(
+    series: "pl.Series", uniques: "pl.Series", converted: "pl.Series"
+) -> "pl.Series":
+    """Map `converted` (aligned with `uniques`) back onto every row of `series`."""
+    return series.replace_strict(
+        uniques, converted, default=None, return_dtype=converted.dtype
+    ).alias(series.name)
+
 
-    return parsed_vals
+def convert_unique_values(
+    series: "pl.Series", convert: Callable[["pl.Series"], "pl.Series"]
+) -> "pl.Series":
+    """Apply `convert` once per distinct value of a low-cardinality series.
+
+    High-cardinality series are converted directly. `convert` must return a
+    series aligned with its input.
+    """
+    if not is_low_cardinality(series):
+        return convert(series).alias(series.name)
+    uniques = series.unique()
+    return map_unique_values(series, uniques, convert(uniques))
+
+
+class ParseFailureReport:
+    """Compact summary of the values a conversion could not parse.
+
+    `row_indices` is a UInt32 series of the failing row positions and
+    `sample_values` holds up to `FAILURE_SAMPLE_SIZE` distinct offending
+    values, in order of first appearance. Null and blank inputs are not
+    failures.
+    """
+
+    def __init__(
+        self, column: str, count: int, sample_values: List[Any], row_indices: "pl.Series"
+    ) -> None:
+        self.column = column
+        self.count = count
+        self.sample_values = sample_values
+        self.row_indices = row_indices
+
+    @property
+    def ok(self) -> bool:
+        return self.count == 0
+
+    def summary(self, max_rows: int = 5) -> str:
+        if self.ok:
+            return f"'{self.column}': all values converted"
+        values = ", ".join(repr(v) for v in self.sample_values)
+        rows = ", ".join(str(i) for i in self.row_indices.head(max_rows).to_list())
+        if self.count > max_rows:
+            rows += ", ..."
+        return (
+            f"'{self.column}': {self.count} value(s) could not be converted, "
+            f"e.g. {values} (rows {rows})"
+        )
+
+
+FAILURE_SAMPLE_SIZE = 10
+
+
+def build_failure_report(
+    original: "pl.Series",
+    converted: "pl.Series",
+    sample_size: int = FAILURE_SAMPLE_SIZE,
+) -> ParseFailureReport:
+    """Compare a conversion with its input and report the rows that became null."""
+    if original.dtype == pl.Utf8:
+        has_value = original.str.strip_chars().ne("").fill_null(False)
+    else:
+        has_value = original.is_not_null()
+    failed = has_value & converted.is_null()
+    row_indices = failed.arg_true().cast(pl.UInt32).alias("row_index")
+    sample_values = (
+        original.filter(failed).unique(maintain_order=True).head(sample_size).to_list()
+    )
+    return ParseFailureReport(original.name, len(row_indices), sample_values, row_indices)
+
+
+def _parse_datetime_vectorized(
+    series: "pl.Series",
+    format_cache: Optional[FormatCache] = None,
+    source: Optional[str] = None,
+) -> "pl.Series":
+    """Run the vectorized parsing steps over a Utf8 series.
+
+    Values no step could parse are left null; the result is aligned with and
+    named like `series`.
+    """
+    name = series.name if series.name else "__col"
+    sample = _sample_strings(series)
+
+    # 0) Offset timestamps and epoch strings have dedicated fast paths
+    special = _try_special_datetime_parse(series, sample)
+    if special is not None and not _unparsed_mask(series, special).any():
+        return special.alias(name)
+
+    # Detect a single (dtype, format) from a sample; one pass covers both
+    # datetime and date-only layouts. A cache hit skips detection.
+    cache_key = None
+    cached = None
+    if format_cache is not None:
+        cache_key = format_cache.make_key(source, name, sample)
+        cached = format_cache.get(cache_key)
+    if cached is not None:
+        detected = _cached_detection(cached)
+        try_fast_path = bool(cached.get("fast_path_ok"))
+    else:
+        detected = _detect_from_sample(sample)
+        try_fast_path = True
+
+    # Low-cardinality columns parse only their distinct strings
+    values = series.unique() if is_low_cardinality(series) else series
+
+    # 1) Try the detected format (fast path if successful)
+    parsed = None
+    if detected is not None and try_fast_path:
+        dtype, fmt = detected
+        try_parse = (
+            _try_vectorized_datetime_parse if dtype == pl.Datetime else _try_vectorized_date_parse
+        )
+        out = _parse_chunked(values, lambda chunk: try_parse(chunk, fmt, strict=False))
+        if format_cache is not None and cache_key is not None:
+            format_cache.put(cache_key, detected, out is not None)
+        if out is not None:
+            parsed = out.cast(pl.Datetime)
+    elif format_cache is not None and cache_key is not None and cached is None:
+        format_cache.put(cache_key, detected, False)
+
+    # 2) Parse with all known formats at once; safe (4-digit year)
+    # formats take precedence to avoid ambiguous %y parsing
+    if parsed is None:
+        parsed = _coalesce_formats_parse(values)
+    if parsed is None:
+        parsed = pl.Series(name, [None] * len(values), dtype=pl.Datetime)
+
+    if values is not series:
+        parsed = map_unique_values(series, values, parsed)
+    return parsed.alias(name)
+
+
+def parse_datetime_with_report(
+    series: "pl.Series",
+    format_cache: Optional[FormatCache] = None,
+    source: Optional[str] = None,
+) -> Tuple["pl.Series", ParseFailureReport]:
+    """Parse `series` to `pl.Datetime` without the Python fallback.
+
+    Returns the parsed series (null where a value did not parse) together
+    with a `ParseFailureReport` of those values, so callers can show or
+    filter the bad rows instead of retrying the whole conversion.
+    """
+    if series.dtype == pl.Datetime:
+        return series, build_failure_report(series, series)
+    if series.dtype.is_numeric():
+        if is_epoch_series(series):
+            parsed = parse_epoch_series(series)
+        else:
+            parsed = series.cast(pl.Datetime, strict=False)
+        return parsed, build_failure_report(series, parsed)
+    text = series if series.dtype == pl.Utf8 else series.cast(pl.Utf8)
+    parsed = _parse_datetime_vectorized(text, format_cache, source)
+    return parsed, build_failure_report(text, parsed)
 
 
 def convert_series_to_datetime(
-    series: "pl.Series", allow_fallback: bool = True
+    series: "pl.Series",
+    allow_fallback: bool = True,
+    format_cache: Optional[FormatCache] = None,
+    source: Optional[str] = None,
 ) -> "pl.Series":
     """Robustly convert a Utf8/text `pl.Series` to `pl.Datetime`.
 
     Strategy:
-    - If already datetime, return as-is.
-    - Attempt vectorized parsing using detected datetime formats.
-    - If vectorized parse leaves some nulls, fall back to pure-Python per-value parsing for those entries.
+    - If already datetime, return as-is; numbers with 9-19 integer digits are read as
+      epoch s/ms/us/ns by magnitude, other numbers are cast.
+    - ISO-8601/RFC 3339 strings with offsets (normalized to UTC) and epoch strings
+      take dedicated fast paths.
+    - Low-cardinality columns parse only their distinct values, mapped back at the end.
+    - Attempt vectorized parsing using the detected datetime format.
+    - Otherwise parse with all known formats in one coalesced vectorized pass.
+    - If values remain unparsed, parse only their distinct strings in Python and map them back.
     - Return a `pl.Series` with `pl.Datetime` dtype (or the best-effort series if casting fails).
 
+    Use `parse_datetime_with_report` to find out which rows failed.
+
     Args:
         series: Series to convert
         allow_fallback: Whether to allow Python fallback for unparseable values
+        format_cache: Optional cache of previously detected formats
+        source: Source file the series came from (part of the cache key)
 
     Returns:
         Series with Datetime dtype
@@ -251,86 +802,29 @@ def convert_series_to_datetime(
         if series.dtype == pl.Datetime:
             return series
 
-        name = series.name if series.name else "__col"
-
-        # Extract sample for format detection
-        sample_vals = _extract_sample_values(series)
+        # Epoch-sized numbers are timestamps whose unit follows from their
+        # magnitude; other numbers keep the plain cast
+        if series.dtype.is_numeric():
+            if is_epoch_series(series):
+                return parse_epoch_series(series)
+            return series.cast(pl.Datetime, strict=False)
 
-        # Detect best formats from samples
-        best_dt_fmt = (
-            detect_format_for_samples(sample_vals, PY_DATETIME_FORMATS)
-            if sample_vals
-            else None
-        )
-        best_date_fmt = (
-            detect_format_for_samples(sample_vals, PY_DATE_FORMATS)
-            if sample_vals
-            else None
-        )
+        name = series.name if series.name else "__col"
+        if series.dtype != pl.Utf8:
+            series = series.cast(pl.Utf8)
 
-        # 1) Try detected datetime format (fast path if successful)
-        if best_dt_fmt:
-            out = _try_vectorized_datetime_parse(series, best_dt_fmt, strict=False)
-            if out is not None and int(out.is_null().sum()) == 0:
-                return out.cast(pl.Datetime)
-            if not allow_fallback:
-                raise ValueError(
-                    "Vectorized parse produced nulls and fallback is disabled"
-                )
-
-        # 2) Try detected date-only format
-        if best_date_fmt:
-            out = _try_vectorized_date_parse(series, best_date_fmt, strict=False)
-            if out is not None and int(out.is_null().sum()) == 0:
-                return out
-            if not allow_fallback:
-                raise ValueError(
-                    "Date-format vectorized parse produced nulls and fallback is disabled"
-                )
-
-        # 3) Try safe formats (4-digit year) first to avoid ambiguous %y parsing
-        safe_formats = [f for f in DATETIME_FORMATS if "%y" not in f]
-        formats_to_try = safe_formats if safe_formats else DATETIME_FORMATS
-
-        parsed = None
-        for fmt in formats_to_try:
-            piece = _try_vectorized_datetime_parse(series, fmt, strict=False)
-            if piece is not None:
-                parsed = piece if parsed is None else parsed.fill_null(piece)
-                if int(parsed.is_null().sum()) == 0:
-                    return parsed.cast(pl.Datetime)
-
-        # 4) Try remaining formats (including %y) if not tried yet
-        if safe_formats and len(safe_formats) != len(DATETIME_FORMATS):
-            for fmt in DATETIME_FORMATS:
-                if fmt in safe_formats:
-                    continue
-                piece = _try_vectorized_datetime_parse(series, fmt, strict=False)
-                if piece is not None:
-                    parsed = piece if parsed is None else parsed.fill_null(piece)
-                    if int(parsed.is_null().sum()) == 0:
-                        return parsed.cast(pl.Datetime)
+        parsed = _parse_datetime_vectorized(series, format_cache, source)
+        if not _unparsed_mask(series, parsed).any():
+            return parsed
 
         # If fallback is disabled, signal failure
         if not allow_fallback:
-            if parsed is None or int(parsed.is_null().sum()) != 0:
-                raise ValueError(
-                    "Could not fully parse series with vectorized attempts and fallback is disabled"
-                )
-
-        # 5) Python fallback for remaining nulls
-        parsed_vals = _apply_python_fallback_parsing(series, parsed)
-
-        try:
-            new_col = pl.Series(name=name, values=parsed_vals).cast(pl.Datetime)
-        except Exception:
-            logger.debug(
-                "Failed to cast parsed values to pl.Datetime for column %s, returning best-effort series",
-                name,
-                exc_info=True,
+            raise ValueError(
+                "Could not fully parse series with vectorized attempts and fallback is disabled"
             )
-            new_col = pl.Series(name=name, values=parsed_vals)
-        return new_col
+
+        # 3) Python fallback for the distinct values that are still unparsed
+        return _apply_python_fallback_parsing(series, parsed).alias(name)
     except Exception:
         logger.exception(
             "convert_series_to_datetime failed unexpectedly; returning original series"
@@ -1,5 +1,113 @@
 import polars as pl
-from typing import Any, List, Dict, cast
+from typing import Any, List, Dict, Iterable, Mapping, Optional, Sequence, Tuple, cast
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import io
+import logging
+import multiprocessing
+import os
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Fixed bin count and quantile probabilities precomputed for numeric columns so
+# distribution previews never need to rescan the data.
+HISTOGRAM_BINS = 20
+QUANTILE_PROBS = (0.0, 0.05, 0.25, 0.5, 0.75, 0.95, 1.0)
+# Top values are not listed when more than this share of the rows are
+# distinct values: no count can then exceed a small fraction of the rows, and
+# grouping an ID-like column only to show a handful of 1s and 2s is wasted work.
+TOP_VALUES_MAX_UNIQUE_RATIO = 0.9
+
+_SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+# Spawning worker processes costs far more than profiling a handful of
+# columns, so the process pool is only used for wide frames.
+PARALLEL_STATS_MIN_COLUMNS = 64
+
+_NUMERIC_DTYPES = [
+    pl.Int8,
+    pl.Int16,
+    pl.Int32,
+    pl.Int64,
+    pl.UInt8,
+    pl.UInt16,
+    pl.UInt32,
+    pl.UInt64,
+    pl.Float32,
+    pl.Float64,
+]
+
+
+class ColumnStats:
+    """Display lines for a column plus compact distribution arrays.
+
+    `histogram` holds per-bin counts and `bin_breaks` the upper edge of each
+    bin; `quantiles` is aligned with `QUANTILE_PROBS`. The arrays are NumPy
+    arrays when NumPy is installed (tuples otherwise) and are None for
+    non-numeric columns.
+    """
+
+    def __init__(
+        self,
+        lines: List[str],
+        histogram: Optional[Any] = None,
+        bin_breaks: Optional[Any] = None,
+        quantiles: Optional[Any] = None,
+    ) -> None:
+        self.lines = lines
+        self.histogram = histogram
+        self.bin_breaks = bin_breaks
+        self.quantiles = quantiles
+
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+class StatsCache:
+    """Per-column `ColumnStats` cache owned by a table model.
+
+    The owner is responsible for calling `invalidate` whenever the underlying
+    data changes; reads never trigger a recomputation of cached columns.
+    Small values derived from a column elsewhere (e.g. the featurizer's
+    column kind) can be stored with `put_derived` and share that invalidation.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, ColumnStats] = {}
+        self._derived: Dict[Tuple[str, str], Any] = {}
+
+    def peek(self, column_name: str) -> Optional[ColumnStats]:
+        """Return cached stats for a column without computing anything."""
+        return self._entries.get(column_name)
+
+    def get(self, df: pl.DataFrame, column_name: str) -> ColumnStats:
+        entry = self._entries.get(column_name)
+        if entry is None:
+            entry = compute_column_stats(df[column_name])
+            self._entries[column_name] = entry
+        return entry
+
+    def put(self, column_name: str, stats: ColumnStats) -> None:
+        self._entries[column_name] = stats
+
+    def get_derived(self, column_name: str, key: str) -> Any:
+        return self._derived.get((column_name, key))
+
+    def put_derived(self, column_name: str, key: str, value: Any) -> None:
+        self._derived[(column_name, key)] = value
+
+    def invalidate(self, column_name: Optional[str] = None) -> None:
+        if column_name is None:
+            self._entries.clear()
+            self._derived.clear()
+        else:
+            self._entries.pop(column_name, None)
+            for entry in [entry for entry in self._derived if entry[0] == column_name]:
+                del self._derived[entry]
 
 
 def _format_for_display(value: Any) -> str:
@@ -33,117 +141,212 @@ def _safe_range(min_val: Any, max_val: Any) -> Any:
         return None
 
 
-def _value_count_summary(series: pl.Series, max_items: int = 5) -> List[str]:
-    """
-    Return top value counts and percentages for a series,
-    dynamically detecting the counts column.
+def _top_value_counts(
+    series: pl.Series,
+    k: int,
+    n_unique: Optional[int] = None,
+    max_unique_ratio: float = 1.0,
+) -> Optional[pl.DataFrame]:
+    """Return up to `k` (value, count) rows with the highest counts.
+
+    Uses group counts with `top_k` instead of sorting a full `value_counts`
+    frame. Returns None without grouping when distinct values make up more
+    than `max_unique_ratio` of the rows (by default: when every value is
+    distinct), as for ID-like columns where a top-K is meaningless.
     """
-    vc_df = series.value_counts()
-
-    cols = vc_df.columns
-    if len(cols) != 2:
-        return ["Value counts unavailable due to unexpected output format."]
-
-    # Use helper function to detect numeric dtype
-    def _is_numeric_dtype(dtype) -> bool:
-        numeric_types = {
-            pl.Int8,
-            pl.Int16,
-            pl.Int32,
-            pl.Int64,
-            pl.UInt8,
-            pl.UInt16,
-            pl.UInt32,
-            pl.UInt64,
-            pl.Float32,
-            pl.Float64,
-        }
-        return dtype in numeric_types
-
-    if _is_numeric_dtype(vc_df[cols[0]].dtype):
-        count_col = cols[0]
-        value_col = cols[1]
-    elif _is_numeric_dtype(vc_df[cols[1]].dtype):
-        count_col = cols[1]
-        value_col = cols[0]
-    else:
-        return ["Value counts unavailable due to no numeric counts column."]
+    if n_unique is None:
+        n_unique = series.n_unique()
+    if n_unique >= len(series) or n_unique > max_unique_ratio * len(series):
+        return None
+    return (
+        series.to_frame("value")
+        .group_by("value")
+        .len(name="count")
+        # Break count ties by value so the report is deterministic.
+        .top_k(k, by=["count", "value"], reverse=[False, True])
+        .sort(["count", "value"], descending=[True, False], nulls_last=True)
+    )
+
+
+def _mode_value(
+    series: pl.Series, n_unique: Optional[int] = None, null_count: int = 0
+) -> Any:
+    """Return one most frequent non-null value, or None for an all-null series."""
+    non_null = series.drop_nulls() if null_count else series
+    if non_null.is_empty():
+        return None
+    if n_unique is not None and null_count:
+        n_unique -= 1
+    top = _top_value_counts(non_null, 1, n_unique)
+    # All values distinct: every value is a mode, so any one will do.
+    return non_null[0] if top is None else top["value"][0]
 
+
+def _value_count_summary(
+    series: pl.Series, max_items: int = 5, n_unique: Optional[int] = None
+) -> List[str]:
+    """Return top value counts and percentages for a series."""
     total = len(series)
+    if n_unique is None:
+        n_unique = series.n_unique()
+    top = _top_value_counts(series, max_items, n_unique, TOP_VALUES_MAX_UNIQUE_RATIO)
+    if top is None:
+        if total == 0:
+            return []
+        if n_unique >= total:
+            return ["All values are unique."]
+        return [f"Mostly unique values ({n_unique} distinct in {total} rows)."]
+
     lines: List[str] = []
-    for row in (
-        vc_df.sort(count_col, descending=True).head(max_items).iter_rows(named=True)
-    ):
-        value = row[value_col]
-        count = row[count_col]
+    for value, count in top.iter_rows():
         percentage = (count / total) * 100 if total > 0 else 0
         lines.append(f"{_format_for_display(value)}: {count} ({percentage:.2f}%)")
 
     return lines
 
 
-def get_numeric_stats(series: pl.Series) -> List[str]:
-    mean_val = series.mean()
-    std_val = series.std()
-    var_val = series.var()
-    return [
-        f"Non-Nulls: {series.drop_nulls().len()}",
-        f"Nulls: {series.is_null().sum()}",
-        f"Unique: {series.n_unique()}",
-        f"Min: {_format_for_display(series.min())}",
-        f"Max: {_format_for_display(series.max())}",
-        f"Mean: {_format_number(mean_val)}",
-        f"Median: {_format_for_display(series.median())}",
-        f"Std Dev: {_format_number(std_val)}",
-        f"Variance: {_format_number(var_val)}",
-        f"Mode: {_format_for_display(series.mode()[0]) if series.mode().len() > 0 else 'N/A'}",
+def _as_array(values: Sequence[Any], dtype: str) -> Any:
+    """Pack a list of numbers into a NumPy array, or a tuple without NumPy."""
+    if np is None:
+        return tuple(values)
+    return np.asarray(values, dtype=dtype)
+
+
+def render_sparkline(histogram: Optional[Sequence[Any]]) -> str:
+    """Render histogram counts as a compact unicode block sparkline."""
+    if histogram is None or len(histogram) == 0:
+        return ""
+    counts = [int(c) for c in histogram]
+    peak = max(counts)
+    if peak <= 0:
+        return _SPARK_CHARS[0] * len(counts)
+    top = len(_SPARK_CHARS) - 1
+    return "".join(_SPARK_CHARS[round(c / peak * top)] for c in counts)
+
+
+def _numeric_aggregates(
+    series: pl.Series,
+    bins: int = HISTOGRAM_BINS,
+    quantile_probs: Sequence[float] = QUANTILE_PROBS,
+) -> Dict[str, Any]:
+    """Compute all numeric aggregates, histogram and quantiles in one query."""
+    col = pl.col("v")
+    exprs = [
+        col.count().alias("non_null"),
+        col.null_count().alias("nulls"),
+        col.n_unique().alias("unique"),
+        col.min().alias("min"),
+        col.max().alias("max"),
+        col.mean().alias("mean"),
+        col.median().alias("median"),
+        col.std().alias("std"),
+        col.var().alias("var"),
+        pl.concat_list(
+            [col.quantile(q, interpolation="linear") for q in quantile_probs]
+        ).alias("quantiles"),
+        col.hist(bin_count=bins, include_breakpoint=True).implode().alias("hist"),
     ]
+    return series.to_frame("v").select(exprs).row(0, named=True)
+
+
+def compute_numeric_stats(series: pl.Series) -> ColumnStats:
+    agg = _numeric_aggregates(series)
+    mode_val = _mode_value(series, agg["unique"], agg["nulls"])
+    lines = [
+        f"Non-Nulls: {agg['non_null']}",
+        f"Nulls: {agg['nulls']}",
+        f"Unique: {agg['unique']}",
+        f"Min: {_format_for_display(agg['min'])}",
+        f"Max: {_format_for_display(agg['max'])}",
+        f"Mean: {_format_number(agg['mean'])}",
+        f"Median: {_format_for_display(agg['median'])}",
+        f"Std Dev: {_format_number(agg['std'])}",
+        f"Variance: {_format_number(agg['var'])}",
+        f"Mode: {_format_for_display(mode_val) if mode_val is not None else 'N/A'}",
+    ]
+
+    if not agg["non_null"]:
+        return ColumnStats(lines)
+
+    hist = agg["hist"] or []
+    quantiles = [float("nan") if q is None else q for q in agg["quantiles"]]
+    return ColumnStats(
+        lines,
+        histogram=_as_array([b["count"] for b in hist], "uint32"),
+        bin_breaks=_as_array([b["breakpoint"] for b in hist], "float64"),
+        quantiles=_as_array(quantiles, "float64"),
+    )
+
+
+def get_numeric_stats(series: pl.Series) -> List[str]:
+    return compute_numeric_stats(series).lines
 
 
 def get_string_stats(series: pl.Series) -> List[str]:
-    non_null = series.drop_nulls().cast(str)
-    lengths = non_null.str.len_chars()
+    col = pl.col("v")
+    lengths = col.drop_nulls().cast(pl.Utf8).str.len_chars()
+    agg = (
+        series.to_frame("v")
+        .select(
+            col.count().alias("non_null"),
+            col.null_count().alias("nulls"),
+            (col.cast(pl.Utf8) == "").sum().alias("blanks"),
+            col.n_unique().alias("unique"),
+            lengths.min().alias("len_min"),
+            lengths.max().alias("len_max"),
+            lengths.median().alias("len_median"),
+            lengths.mean().alias("len_mean"),
+        )
+        .row(0, named=True)
+    )
 
     stats = [
-        f"Non-Nulls: {non_null.len()}",
-        f"Nulls: {series.is_null().sum()}",
-        f"Blanks: {(series == '').sum()}",
-        f"Unique: {series.n_unique()}",
-        f"Min Length: {_format_for_display(lengths.min())}",
-        f"Max Length: {_format_for_display(lengths.max())}",
-        f"Median Length: {_format_for_display(lengths.median())}",
-        f"Mean Length: {_format_number(lengths.mean())}",
+        f"Non-Nulls: {agg['non_null']}",
+        f"Nulls: {agg['nulls']}",
+        f"Blanks: {agg['blanks']}",
+        f"Unique: {agg['unique']}",
+        f"Min Length: {_format_for_display(agg['len_min'])}",
+        f"Max Length: {_format_for_display(agg['len_max'])}",
+        f"Median Length: {_format_for_display(agg['len_median'])}",
+        f"Mean Length: {_format_number(agg['len_mean'])}",
     ]
 
     stats.append("Top Values:")
-    stats.extend(_value_count_summary(series))
+    stats.extend(_value_count_summary(series, n_unique=agg["unique"]))
     return stats
 
 
 def get_boolean_stats(series: pl.Series) -> List[str]:
-    non_null_count = series.drop_nulls().len()
-    # Count True values by summing the boolean series after dropping nulls.
-    true_count = int(series.drop_nulls().sum() or 0)
+    null_count = series.null_count()
+    non_null_count = series.len() - null_count
+    # Count True values by summing the boolean series (nulls are ignored).
+    true_count = int(series.sum() or 0)
     false_count = non_null_count - true_count
+    if non_null_count == 0:
+        mode_val = None
+    else:
+        mode_val = true_count >= false_count
 
     return [
         f"Non-Nulls: {non_null_count}",
-        f"Nulls: {series.is_null().sum()}",
+        f"Nulls: {null_count}",
         f"True: {true_count}",
         f"False: {false_count}",
-        f"Mode: {_format_for_display(series.mode()[0]) if series.mode().len() > 0 else 'N/A'}",
+        f"Mode: {_format_for_display(mode_val) if mode_val is not None else 'N/A'}",
     ]
 
 
 def get_date_stats(series: pl.Series) -> List[str]:
     min_val = series.min()
     max_val = series.max()
-    mode_val = series.mode()[0] if series.mode().len() > 0 else None
+    null_count = series.null_count()
+    n_unique = series.n_unique()
+    mode_val = _mode_value(series, n_unique, null_count)
 
     return [
-        f"Non-Nulls: {series.drop_nulls().len()}",
-        f"Nulls: {series.is_null().sum()}",
-        f"Unique: {series.n_unique()}",
+        f"Non-Nulls: {series.len() - null_count}",
+        f"Nulls: {null_count}",
+        f"Unique: {n_unique}",
         f"Earliest: {_format_for_display(min_val)}",
         f"Latest: {_format_for_display(max_val)}",
         f"Median: {_format_for_display(series.median())}",
@@ -155,12 +358,14 @@ def get_datetime_stats(series: pl.Series) -> List[str]:
     min_val = series.min()
     max_val = series.max()
     range_val = _safe_range(min_val, max_val)
-    mode_val = series.mode()[0] if series.mode().len() > 0 else None
+    null_count = series.null_count()
+    n_unique = series.n_unique()
+    mode_val = _mode_value(series, n_unique, null_count)
 
     return [
-        f"Non-Nulls: {series.drop_nulls().len()}",
-        f"Nulls: {series.is_null().sum()}",
-        f"Unique: {series.n_unique()}",
+        f"Non-Nulls: {series.len() - null_count}",
+        f"Nulls: {null_count}",
+        f"Unique: {n_unique}",
         f"Min: {_format_for_display(min_val)}",
         f"Max: {_format_for_display(max_val)}",
         f"Range: {_format_for_display(range_val) if range_val is not None else 'N/A'}",
@@ -178,35 +383,80 @@ def get_fallback_stats(series: pl.Series) -> List[str]:
     ]
 
 
-def get_stats_for_column(series: pl.Series) -> List[str]:
+def compute_column_stats(series: pl.Series) -> ColumnStats:
     dtype = series.dtype
 
-    if dtype in [
-        pl.Int8,
-        pl.Int16,
-        pl.Int32,
-        pl.Int64,
-        pl.UInt8,
-        pl.UInt16,
-        pl.UInt32,
-        pl.UInt64,
-        pl.Float32,
-        pl.Float64,
-    ]:
-        return get_numeric_stats(series)
+    if dtype in _NUMERIC_DTYPES:
+        return compute_numeric_stats(series)
     elif dtype in [pl.Utf8, pl.Categorical]:
-        return get_string_stats(series)
+        return ColumnStats(get_string_stats(series))
     elif dtype == pl.Boolean:
-        return get_boolean_stats(series)
+        return ColumnStats(get_boolean_stats(series))
     elif dtype == pl.Date:
-        return get_date_stats(series)
+        return ColumnStats(get_date_stats(series))
     elif dtype == pl.Datetime or dtype == pl.Time:
-        return get_datetime_stats(series)
+        return ColumnStats(get_datetime_stats(series))
     else:
-        return get_fallback_stats(series)
+        return ColumnStats(get_fallback_stats(series))
+
+
+def get_stats_for_column(series: pl.Series) -> List[str]:
+    return compute_column_stats(series).lines
 
 
-def generate_statistics(model) -> str:
+def _series_to_ipc(series: pl.Series) -> bytes:
+    """Serialize a column as an uncompressed Arrow IPC buffer."""
+    buf = io.BytesIO()
+    series.to_frame().write_ipc(buf, compression="uncompressed")
+    return buf.getvalue()
+
+
+def _column_stats_from_ipc(payload: bytes) -> ColumnStats:
+    """Process-pool worker: rebuild a column from Arrow IPC and profile it."""
+    return compute_column_stats(pl.read_ipc(payload).to_series())
+
+
+def compute_stats_parallel(
+    df: pl.DataFrame,
+    columns: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, ColumnStats]:
+    """Compute `ColumnStats` for many columns across a process pool.
+
+    Columns are shipped to workers as Arrow IPC buffers. Only a bounded number
+    of columns are serialized ahead of the workers so peak memory stays close
+    to one extra column per worker.
+    """
+    names = list(df.columns if columns is None else columns)
+    workers = max_workers or os.cpu_count() or 1
+    results: Dict[str, ColumnStats] = {}
+    # Spawn instead of fork: forking a process that runs Qt and Polars thread
+    # pools is unsafe.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        in_flight: Dict[Future, str] = {}
+        queue = iter(names)
+        while True:
+            for name in queue:
+                in_flight[pool.submit(_column_stats_from_ipc, _series_to_ipc(df[name]))] = name
+                if len(in_flight) >= workers * 2:
+                    break
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                results[in_flight.pop(fut)] = fut.result()
+    return results
+
+
+def generate_statistics(
+    model, parallel: Optional[bool] = None, max_workers: Optional[int] = None
+) -> str:
+    """Return the statistics report for every column of the model's data.
+
+    With `parallel=None` the process pool is used automatically once at least
+    `PARALLEL_STATS_MIN_COLUMNS` columns need computing.
+    """
     if not hasattr(model, "_data") or model._data is None:
         raise ValueError("Model does not contain a valid DataFrame.")
 
@@ -214,12 +464,35 @@ def generate_statistics(model) -> str:
     if df.is_empty():
         return "No data available."
 
+    cache: Optional[StatsCache] = getattr(model, "_stats_cache", None)
+    pending = [c for c in df.columns if cache is None or cache.peek(c) is None]
+    if parallel is None:
+        parallel = len(pending) >= PARALLEL_STATS_MIN_COLUMNS
+
+    computed: Dict[str, ColumnStats] = {}
+    if parallel and len(pending) > 1:
+        try:
+            computed = compute_stats_parallel(df, pending, max_workers=max_workers)
+        except Exception:
+            logger.warning(
+                "Parallel statistics failed; computing columns serially",
+                exc_info=True,
+            )
+        if cache is not None:
+            for name, column_stats in computed.items():
+                cache.put(name, column_stats)
+
     stats = []
 
     for col_name in df.columns:
         col_series = df[col_name]
         col_header = f"📊 Column: {_format_for_display(col_name)} ({_format_for_display(col_series.dtype)})"
-        col_stats = get_stats_for_column(col_series)
+        if col_name in computed:
+            col_stats = computed[col_name].lines
+        elif cache is not None:
+            col_stats = cache.get(df, col_name).lines
+        else:
+            col_stats = get_stats_for_column(col_series)
         stats.append("\n".join([col_header] + col_stats))
 
     return "\n\n".join(stats)
@@ -229,20 +502,26 @@ def get_column_types(df: pl.DataFrame) -> Dict[str, str]:
     return {col: str(dtype) for col, dtype in df.schema.items()}
 
 
+def format_type_counts(type_counts: Mapping[str, int]) -> str:
+    return ", ".join(f"{dtype}: {count}" for dtype, count in type_counts.items())
+
+
 def get_column_type_counts_string(df: pl.DataFrame) -> str:
     from collections import Counter
 
     type_counts = Counter(str(dtype) for dtype in df.schema.values())
-    return ", ".join(f"{dtype}: {count}" for dtype, count in type_counts.items())
+    return format_type_counts(type_counts)
 
 
 def update_statistics(self) -> None:
     if hasattr(self, "model") and self.model is not None:
-        df = self.model._data
-        self.row_count_label.setText(f"Total Rows: {df.height}")
-        self.total_column_count_label.setText(f"Total Columns: {df.width}")
+        footer = self.model.get_footer_stats()
+        self.row_count_label.setText(f"Total Rows: {footer['row_count']}")
+        self.total_column_count_label.setText(
+            f"Total Columns: {footer['total_columns']}"
+        )
         self.column_type_count_label.setText(
-            f"Column Type Count: {get_column_type_counts_string(df)}"
+            f"Column Type Count: {footer['column_types']}"
         )
 
 
@@ -254,8 +533,118 @@ def calculate_max_pages(row_count: int, chunk_size: int) -> int:
     return (row_count + chunk_size - 1) // chunk_size
 
 
-def get_column_statistics(df: pl.DataFrame, column_name: str) -> str:
+def get_column_statistics(
+    df: pl.DataFrame, column_name: str, cache: Optional[StatsCache] = None
+) -> str:
     if column_name not in df.columns:
         return "Column not found."
+    if cache is not None:
+        return cache.get(df, column_name).text()
     stats = get_stats_for_column(df[column_name])
     return "\n".join(stats)
+
+
+# Rows per block when accumulating correlation moments; frames smaller than
+# this are handled with a single matrix product.
+CORRELATION_CHUNK_ROWS = 1_000_000
+CORRELATION_METHODS = ("pearson", "spearman", "covariance")
+
+
+def numeric_columns(df: pl.DataFrame) -> List[str]:
+    return [col for col, dtype in df.schema.items() if dtype in _NUMERIC_DTYPES]
+
+
+def _accumulate_covariance(
+    df: pl.DataFrame, chunk_rows: int = CORRELATION_CHUNK_ROWS
+) -> Any:
+    """Return the sample covariance matrix of all columns in `df`.
+
+    Rows with any null are dropped. Each block (only one is converted at a
+    time) is cast to a float32 matrix, shifted by the first block's mean to
+    keep the float32 products well conditioned, and reduced with one
+    `X.T @ X` BLAS call; the per-block moments are summed in float64.
+    """
+    df = df.drop_nulls()
+    width = df.width
+    n = 0
+    shift = None
+    total = np.zeros(width, dtype=np.float64)
+    cross = np.zeros((width, width), dtype=np.float64)
+
+    for block in df.iter_slices(n_rows=chunk_rows):
+        X = block.to_numpy(order="c").astype(np.float32, copy=False)
+        if shift is None:
+            shift = X.mean(axis=0, dtype=np.float64).astype(np.float32)
+        X = X - shift
+        n += X.shape[0]
+        total += X.sum(axis=0, dtype=np.float64)
+        cross += X.T @ X
+
+    if n < 2:
+        return np.full((width, width), np.nan)
+    mean = total / n
+    return (cross - n * np.outer(mean, mean)) / (n - 1)
+
+
+def compute_correlation_matrix(
+    df: pl.DataFrame,
+    columns: Optional[List[str]] = None,
+    method: str = "pearson",
+    chunk_rows: int = CORRELATION_CHUNK_ROWS,
+) -> Any:
+    """Compute a Pearson, Spearman or covariance matrix for numeric columns.
+
+    Spearman is Pearson over average ranks, taken on the original values so
+    large integers do not collapse into ties. `df` is held in memory; columns
+    are converted to float32 one block of `chunk_rows` at a time rather than
+    copied whole. Returns a float64 NumPy array of shape
+    (len(columns), len(columns)) aligned with `columns`.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for correlation. Install numpy.")
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"Unknown correlation method: {method}")
+    if columns is None:
+        columns = numeric_columns(df)
+    if not columns:
+        raise ValueError("Select at least one numeric column.")
+    missing = [c for c in columns if c not in df.schema]
+    if missing:
+        raise ValueError(f"Columns not found: {', '.join(missing)}")
+    non_numeric = [c for c in columns if df.schema[c] not in _NUMERIC_DTYPES]
+    if non_numeric:
+        raise ValueError(f"Columns are not numeric: {', '.join(non_numeric)}")
+
+    frame = df.select(columns)
+    if method == "spearman":
+        # Rank after dropping rows with nulls so ranks match the rows used.
+        frame = frame.drop_nulls().select(pl.all().rank("average"))
+
+    cov = _accumulate_covariance(frame, chunk_rows)
+    if method == "covariance":
+        return cov
+
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.outer(std, std)
+    return np.clip(corr, -1.0, 1.0)
+
+
+def correlation_to_frame(columns: List[str], matrix: Any) -> pl.DataFrame:
+    """Return a matrix as a DataFrame with a leading `column` label column."""
+    data: Dict[str, Any] = {"column": list(columns)}
+    for i, name in enumerate(columns):
+        data[name] = matrix[:, i]
+    return pl.DataFrame(data)
+
+
+def format_correlation_matrix(
+    columns: List[str], matrix: Any, precision: int = 3
+) -> str:
+    labels = [_format_for_display(c) for c in columns]
+    width = max([len(label) for label in labels] + [precision + 4])
+    lines = [" " * width + " " + " ".join(label.rjust(width) for label in labels)]
+    for label, row in zip(labels, matrix):
+        cells = " ".join(_format_number(float(v), precision).rjust(width) for v in row)
+        lines.append(f"{label.ljust(width)} {cells}")
+    return "\n".join(lines)
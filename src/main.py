@@ -4,6 +4,7 @@ from app.main_window import MainWindow
 from logging_config import configure_logging
 import importlib.resources as resources
 import logging
+import multiprocessing
 
 
 def main():
@@ -33,4 +34,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for process pools (e.g. parallel column stats) in frozen builds
+    multiprocessing.freeze_support()
     main()
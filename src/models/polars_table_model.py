@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List, Dict
+from collections import Counter
+from typing import Any, List, Dict
 
 from PyQt6.QtCore import QAbstractTableModel, Qt, QModelIndex
 import polars as pl
@@ -9,6 +10,9 @@ from logic.stats import (
     get_page_data,
     calculate_max_pages,
     get_column_statistics,
+    format_type_counts,
+    render_sparkline,
+    StatsCache,
 )
 from datetime import datetime, date
 import logging
@@ -27,6 +31,11 @@ class PolarsTableModel(QAbstractTableModel):
             data, self._current_page, chunk_size
         )
         self._column_types: Dict[str, str] = get_column_types(data)
+        # Footer counters, kept in sync with every mutation so reading them
+        # never touches the data.
+        self._row_count: int = data.height
+        self._type_counts: Counter[str] = Counter(self._column_types.values())
+        self._stats_cache: StatsCache = StatsCache()
         self._undo_stack: List[pl.DataFrame] = []
         self._redo_stack: List[pl.DataFrame] = []
 
@@ -56,6 +65,9 @@ class PolarsTableModel(QAbstractTableModel):
             self._data, self._current_page, self.chunk_size
         )
         self._column_types = get_column_types(self._data)
+        self._row_count = new_df.height
+        self._type_counts = Counter(self._column_types.values())
+        self._stats_cache.invalidate()
 
         try:
             self.endResetModel()
@@ -74,6 +86,17 @@ class PolarsTableModel(QAbstractTableModel):
                     self.columnCount() - 1,
                 )
 
+    def _set_column_type(self, column_name: str, dtype_name: str) -> None:
+        previous = self._column_types.get(column_name)
+        if previous == dtype_name:
+            return
+        if previous is not None:
+            self._type_counts[previous] -= 1
+            if self._type_counts[previous] <= 0:
+                del self._type_counts[previous]
+        self._column_types[column_name] = dtype_name
+        self._type_counts[dtype_name] += 1
+
     def rowCount(self, parent=None) -> int:
         return self._current_data.height
 
@@ -99,6 +122,17 @@ class PolarsTableModel(QAbstractTableModel):
                 return f"{col_name}\n({col_type})"
             else:
                 return str(section)
+        if (
+            role == Qt.ItemDataRole.ToolTipRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            # Only show a distribution preview if stats were already computed;
+            # hovering a header must never trigger a scan.
+            col_name = self._data.columns[section]
+            cached = self._stats_cache.peek(col_name)
+            spark = render_sparkline(cached.histogram) if cached else ""
+            if spark:
+                return f"{col_name} ({self._column_types[col_name]})\n{spark}"
         return None
 
     def flags(self, index):
@@ -154,6 +188,8 @@ class PolarsTableModel(QAbstractTableModel):
                 new_col = pl.Series(name=col_name, values=col_values, strict=False)
 
             self._data = self._data.with_columns(new_col)
+            self._set_column_type(col_name, str(new_col.dtype))
+            self._stats_cache.invalidate(col_name)
             self._current_data = get_page_data(
                 self._data, self._current_page, self.chunk_size
             )
@@ -229,7 +265,7 @@ class PolarsTableModel(QAbstractTableModel):
         self._current_data = get_page_data(
             self._data, self._current_page, self.chunk_size
         )
-        self._column_types[column_name] = str(new_series.dtype)
+        self._set_column_type(column_name, str(new_series.dtype))
         self.layoutChanged.emit()
         try:
             self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.columnCount() - 1)
@@ -239,8 +275,16 @@ class PolarsTableModel(QAbstractTableModel):
                 self.columnCount() - 1,
             )
 
+    def get_footer_stats(self) -> Dict[str, Any]:
+        """Return footer metrics from cached counters (no data access)."""
+        return {
+            "row_count": self._row_count,
+            "total_columns": len(self._column_types),
+            "column_types": format_type_counts(self._type_counts),
+        }
+
     def get_column_statistics(self, column_name: str) -> str:
-        return get_column_statistics(self._data, column_name)
+        return get_column_statistics(self._data, column_name, cache=self._stats_cache)
 
     def undo(self) -> None:
         if self._undo_stack:
@@ -0,0 +1,116 @@
+import datetime
+
+import polars as pl
+import pytest
+
+from logic.conversion import (
+    convert_columns,
+    infer_column_type,
+    infer_conversion_targets,
+)
+
+
+def test_convert_columns_applies_every_target():
+    df = pl.DataFrame(
+        {
+            "i": ["1", "2", "3"],
+            "f": ["1.5", "2", None],
+            "b": ["true", "False", "true"],
+            "d": ["2024-01-31", "2024-02-29", "2024-03-01"],
+            "n": [1, 2, 3],
+        }
+    )
+    out = convert_columns(
+        df, {"i": "Integer", "f": "Float", "b": "Boolean", "d": "Date", "n": "String"}
+    )
+    assert out.schema["i"] == pl.Int64
+    assert out.schema["f"] == pl.Float64
+    assert out["b"].to_list() == [True, False, True]
+    assert out["d"].to_list()[0] == datetime.date(2024, 1, 31)
+    assert out["n"].to_list() == ["1", "2", "3"]
+
+
+def test_integer_to_date_casts_unless_values_are_epochs():
+    df = pl.DataFrame(
+        {
+            "days": [19723, None],
+            "ymd": [20240105, 20240106],
+            "epoch": [1704412800, None],
+        }
+    )
+    out = convert_columns(df, {"days": "Date", "ymd": "Date", "epoch": "Date"})
+    # Day counts and yyyymmdd integers keep the plain Int -> Date cast
+    assert out["days"].to_list() == [datetime.date(2024, 1, 1), None]
+    assert out["ymd"].equals(df["ymd"].cast(pl.Date))
+    assert out["ymd"].dt.year().to_list() != [1970, 1970]
+    assert out["epoch"].to_list() == [datetime.date(2024, 1, 5), None]
+
+
+def test_convert_columns_rejects_unknown_type():
+    df = pl.DataFrame({"a": ["1"]})
+    with pytest.raises(ValueError):
+        convert_columns(df, {"a": "Decimal"})
+
+
+def test_infer_column_type_classifies_text_columns():
+    assert infer_column_type(pl.Series(["1", "2", None])) == "Integer"
+    assert infer_column_type(pl.Series(["1.5", "2"])) == "Float"
+    assert infer_column_type(pl.Series(["True", "false"])) == "Boolean"
+    assert infer_column_type(pl.Series(["2024-01-31", "2024-02-01"])) == "Date"
+    assert infer_column_type(pl.Series(["2024-01-31 10:00:00"])) == "Datetime"
+    assert infer_column_type(pl.Series(["a", "1"])) is None
+    assert infer_column_type(pl.Series([None, None], dtype=pl.Utf8)) is None
+
+
+def test_infer_column_type_keeps_leading_zero_codes_as_text():
+    assert infer_column_type(pl.Series(["00501", "12345"])) is None
+    assert infer_column_type(pl.Series(["-007", "1.5"])) is None
+    assert infer_column_type(pl.Series(["0", "0.25", "10"])) == "Float"
+
+
+def test_infer_conversion_targets_skips_non_text_and_unknown():
+    df = pl.DataFrame({"a": ["1", "2"], "b": ["x", "y"], "c": [1.0, 2.0]})
+    assert infer_conversion_targets(df) == {"a": "Integer"}
+
+
+def test_infer_conversion_targets_classifies_wide_frame_in_one_pass():
+    df = pl.DataFrame(
+        {
+            "int": ["1", "-2", None],
+            "big": ["99999999999999999999", "1", "2"],
+            "float": ["1e3", ".5", "2"],
+            "bool": ["True", " false", None],
+            "date": ["31/01/2024", "29/02/2024", None],
+            "ts": ["2024-01-31T10:00:00", "2024-02-01T11:30:00", "2024-02-02T00:00:00"],
+            "text": ["a", "1", "b"],
+            "empty": pl.Series([None, None, None], dtype=pl.Utf8),
+            "num": [1, 2, 3],
+        }
+    )
+    assert infer_conversion_targets(df) == {
+        "int": "Integer",
+        "big": "Float",
+        "float": "Float",
+        "bool": "Boolean",
+        "date": "Date",
+        "ts": "Datetime",
+    }
+    converted = convert_columns(df, infer_conversion_targets(df))
+    assert converted.schema["date"] == pl.Date
+    assert converted["bool"].to_list() == [True, False, None]
+
+
+def test_strict_conversion_reports_every_failing_column():
+    from logic.conversion import ConversionError, convert_columns_with_report, failed_rows
+
+    df = pl.DataFrame({"i": ["1", "x", "3"], "b": ["true", "false", "maybe"], "ok": ["1", "2", "3"]})
+    with pytest.raises(ConversionError) as excinfo:
+        convert_columns(df, {"i": "Integer", "b": "Boolean", "ok": "Integer"})
+    reports = excinfo.value.reports
+    assert set(reports) == {"i", "b"}
+    assert reports["i"].sample_values == ["x"]
+    assert reports["b"].row_indices.to_list() == [2]
+
+    converted, failures = convert_columns_with_report(df, {"i": "Integer"})
+    assert converted["i"].to_list() == [1, None, 3]
+    assert failed_rows(df, reports)["i"].to_list() == ["x", "3"]
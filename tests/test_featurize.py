@@ -1,5 +1,6 @@
 import polars as pl
 import numpy as np
+import pytest
 
 from ds.featurize import generate_feature_matrix, add_features_to_df
 
@@ -26,3 +27,229 @@ def test_add_features_to_df():
     assert "f1" in new_df.columns
     assert "f2" in new_df.columns
     assert new_df.height == 3
+
+
+def test_feature_matrix_stays_sparse_until_requested(tmp_path):
+    from scipy import sparse
+
+    from ds.featurize import load_feature_matrix, save_feature_matrix
+
+    df = pl.DataFrame(
+        {
+            "num": [1.0, 2.0, 3.0, 4.0],
+            "cat": ["a", "b", "a", "c"],
+            "text": ["hello world", "foo bar", "hello", "baz"],
+        }
+    )
+    X, names = generate_feature_matrix(
+        df, categorical_cols=["cat"], text_cols=["text"], tfidf_max_features=10
+    )
+    assert sparse.isspmatrix_csr(X) or (sparse.issparse(X) and X.format == "csr")
+    dense, dense_names = generate_feature_matrix(
+        df, categorical_cols=["cat"], text_cols=["text"], tfidf_max_features=10, dense=True
+    )
+    assert isinstance(dense, np.ndarray)
+    assert dense_names == names
+    np.testing.assert_allclose(X.toarray(), dense)
+
+    base = pl.DataFrame({"id": [1, 2, 3, 4]})
+    from_sparse = add_features_to_df(base, X, names)
+    from_dense = add_features_to_df(base, dense, names)
+    assert from_sparse.equals(from_dense)
+
+    path = tmp_path / "features.npz"
+    save_feature_matrix(str(path), X, names)
+    loaded, loaded_names = load_feature_matrix(str(path))
+    assert loaded_names == names
+    np.testing.assert_allclose(loaded.toarray(), dense)
+    assert sparse.load_npz(str(path)).shape == X.shape
+
+
+def test_add_features_to_df_uses_column_views():
+    X = np.arange(12, dtype=np.float64).reshape(4, 3, order="F")
+    out = add_features_to_df(pl.DataFrame({"id": [1, 2, 3, 4]}), X, ["a", "b", "c"])
+    assert out["b"].to_list() == [4.0, 5.0, 6.0, 7.0]
+    assert np.shares_memory(out["b"].to_numpy(), X)
+
+    small = add_features_to_df(
+        pl.DataFrame({"id": [1, 2, 3, 4]}), X, ["a", "b", "c"], dtype=np.float32
+    )
+    assert small.schema["a"] == pl.Float32
+    assert small["c"].to_list() == [8.0, 9.0, 10.0, 11.0]
+
+
+def test_polars_engine_matches_sklearn_engine():
+    df = pl.DataFrame(
+        {
+            "x": [1.0, 2.0, 3.0, 10.0],
+            "y": [5, 5, 5, 5],
+            "cat": ["b", "a", None, "b"],
+        }
+    )
+    for scale in ("standard", "minmax", None):
+        X_sk, names_sk = generate_feature_matrix(
+            df, ["x", "y"], ["cat"], [], scale_numeric=scale, dense=True
+        )
+        X_pl, names_pl = generate_feature_matrix(
+            df, ["x", "y"], ["cat"], [], scale_numeric=scale, dense=True, engine="polars"
+        )
+        assert names_pl == ["x", "y", "cat_a", "cat_b", "cat_None"]
+        assert names_sk == names_pl
+        np.testing.assert_allclose(X_pl, X_sk)
+
+
+def test_label_encoding_uses_sorted_category_codes():
+    from ds.featurize import featurize_frame
+
+    df = pl.DataFrame({"cat": ["b", "a", None, "c", "a"]})
+    out = featurize_frame(df, [], ["cat"], categorical_encoding="label")
+    assert out.columns == ["cat__label"]
+    assert out["cat__label"].to_list() == [1.0, 0.0, None, 2.0, 0.0]
+
+
+def test_add_features_to_df_renames_clashing_names():
+    df = pl.DataFrame({"num": [1.0, 2.0]})
+    X, names = generate_feature_matrix(df, ["num"], [], [])
+    out = add_features_to_df(df, X, names)
+    assert out.columns == ["num", "num__feature"]
+
+
+def test_hashed_text_features_are_fixed_width_and_chunk_independent():
+    from ds.featurize import hashed_text_features
+
+    texts = pl.Series("text", ["hello world", "foo bar", None, "hello there world"] * 5)
+    whole = hashed_text_features(texts, n_features=64)
+    chunked = hashed_text_features(texts, n_features=64, chunk_rows=3)
+
+    assert whole.shape == (20, 64)
+    assert (whole != chunked).nnz == 0
+    assert whole[2].nnz == 0
+    np.testing.assert_allclose(np.sqrt(whole[0].multiply(whole[0]).sum()), 1.0)
+
+
+def test_hashed_text_features_of_empty_series():
+    from ds.featurize import hashed_text_features
+
+    empty = hashed_text_features(pl.Series("text", [], dtype=pl.Utf8), n_features=64)
+    assert empty.shape == (0, 64)
+
+    df = pl.DataFrame({"num": [1.0, 2.0], "text": ["hello world", "foo"]})
+    X, names = generate_feature_matrix(
+        df, categorical_cols=[], text_cols=["text"], text_encoding="hashing", hash_features=32
+    )
+    assert X.shape == (2, 33)
+    assert names[1:] == [f"text__hash__{i}" for i in range(32)]
+
+
+def test_parallel_featurization_matches_serial():
+    df = pl.DataFrame(
+        {
+            "num": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "cat": ["a", "b", "a", None, "c"],
+            "kind": ["x", "y", "x", "x", "y"],
+            "text": ["hello world", "foo bar", "hello", "baz qux", None],
+            "notes": ["red blue", "blue", "green red", "red", "blue green"],
+        }
+    )
+    kwargs = dict(categorical_cols=["cat", "kind"], text_cols=["text", "notes"])
+    X_serial, names_serial = generate_feature_matrix(df, parallel=False, **kwargs)
+    X_parallel, names_parallel = generate_feature_matrix(
+        df, parallel=True, max_workers=2, **kwargs
+    )
+
+    assert names_parallel == names_serial
+    np.testing.assert_allclose(X_parallel.toarray(), X_serial.toarray())
+
+
+def test_detect_columns_matches_exact_counts_and_uses_cache():
+    from logic.stats import StatsCache
+    from ds.featurize import DETECT_SAMPLE_ROWS, detect_columns
+
+    n = DETECT_SAMPLE_ROWS + 100
+    df = pl.DataFrame(
+        {
+            "num": np.arange(n, dtype=np.float64),
+            "few": [str(i % 3) for i in range(n)],
+            # Few values in the sample, many after it
+            "late": ["x"] * DETECT_SAMPLE_ROWS + [f"v{i}" for i in range(100)],
+            "many": [f"t{i}" for i in range(n)],
+        }
+    )
+    cache = StatsCache()
+    assert detect_columns(df, cache=cache) == (["num"], ["few"], ["late", "many"])
+    assert cache.get_derived("many", "featurize_kind") == "text"
+
+    # Cached kinds are reused until the column is invalidated
+    changed = df.with_columns(pl.lit("same").alias("many"))
+    assert detect_columns(changed, cache=cache)[2] == ["late", "many"]
+    cache.invalidate("many")
+    assert detect_columns(changed, cache=cache)[1] == ["few", "many"]
+
+
+def test_feature_dtype_defaults_to_float32_and_is_configurable():
+    from ds.dimensionality import build_input_matrix
+
+    df = pl.DataFrame(
+        {"num": [1.0, 2.0, 3.0], "cat": ["a", "b", "a"], "text": ["x y", "y z", "z"]}
+    )
+    X, names = generate_feature_matrix(df)
+    assert X.dtype == np.float32
+    assert add_features_to_df(df, X, names).select(names[1:]).dtypes == [pl.Float32] * (
+        len(names) - 1
+    )
+
+    for engine in ("sklearn", "polars"):
+        X64, names64 = generate_feature_matrix(df, dense=True, engine=engine, dtype="float64")
+        assert X64.dtype == np.float64
+        np.testing.assert_allclose(X64, X.toarray(), rtol=1e-6)
+
+    assert build_input_matrix(df, ["num"]).dtype == np.float32
+    assert build_input_matrix(df, ["num"], dtype=np.float64).dtype == np.float64
+
+
+def test_frequency_target_and_hash_encodings():
+    from ds.featurize import frequency_encode, hash_encode, target_encode
+
+    df = pl.DataFrame(
+        {
+            "city": ["a", "a", "b", None, "a", "b", None, "c"],
+            "y": [1.0, 0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 1.0],
+        }
+    )
+    assert frequency_encode(df, "city").to_list() == pytest.approx(
+        [3 / 8, 3 / 8, 2 / 8, 2 / 8, 3 / 8, 2 / 8, 2 / 8, 1 / 8]
+    )
+
+    # Every row gets its category's smoothed mean over the other folds only
+    folds = 3
+    smoothing = 2.0
+    encoded = target_encode(df, "city", "y", folds=folds, smoothing=smoothing).to_list()
+    fold = (pl.int_range(8, dtype=pl.UInt64, eager=True).hash(0) % folds).to_list()
+    prior = df["y"].mean()
+    for i, (key, value) in enumerate(zip(df["city"], encoded)):
+        others = [
+            df["y"][j]
+            for j in range(8)
+            if df["city"][j] == key and fold[j] != fold[i]
+        ]
+        assert value == pytest.approx((sum(others) + smoothing * prior) / (len(others) + smoothing))
+
+    buckets = hash_encode(df["city"], n_buckets=4)
+    assert buckets.shape == (8, 4)
+    assert buckets.sum(axis=1).tolist() == [[1.0]] * 8
+    assert (buckets[0] != buckets[1]).nnz == 0
+
+    X, names = generate_feature_matrix(
+        df,
+        numeric_cols=[],
+        categorical_cols=["city"],
+        text_cols=[],
+        column_encodings={"city": "target"},
+        target_col="y",
+        dtype="float64",
+    )
+    assert names == ["city__target"]
+    np.testing.assert_allclose(X.toarray()[:, 0], target_encode(df, "city", "y").to_numpy())
+
+    with pytest.raises(ValueError, match="target column"):
+        generate_feature_matrix(df, column_encodings={"city": "target"})
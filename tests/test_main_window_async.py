@@ -43,7 +43,7 @@ def test_handle_featurize_uses_background_runner(monkeypatch, qapp):
 
     monkeypatch.setattr(main_window_module, "run_in_background", run_sync)
     monkeypatch.setattr(featurize_gui_module, "FeaturizeDialog", FakeDialog)
-    monkeypatch.setattr(featurize_module, "detect_columns", lambda df: (["a"], [], []))
+    monkeypatch.setattr(featurize_module, "detect_columns", lambda df, cache=None: (["a"], [], []))
     monkeypatch.setattr(
         featurize_module,
         "generate_feature_matrix",
@@ -64,4 +64,61 @@ def test_handle_featurize_uses_background_runner(monkeypatch, qapp):
     mw.handle_featurize()
 
     assert called["background"] is True
-    assert "feat_a" in mw.model._data.columns
\ No newline at end of file
+    assert "feat_a" in mw.model._data.columns
+
+
+def test_handle_batch_convert_is_one_undo_step(monkeypatch, qapp, tmp_path):
+    import app.main_window as main_window_module
+    import app.widgets.convert_gui as convert_gui_module
+
+    class FakeDialog:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def exec(self):
+            from PyQt6.QtWidgets import QDialog
+
+            return QDialog.DialogCode.Accepted
+
+        def get_targets(self):
+            return {"a": "Integer"}
+
+        def get_options(self):
+            return {"auto_detect_text": True}
+
+    monkeypatch.setattr(main_window_module, "run_in_background", _run_sync)
+    monkeypatch.setattr(convert_gui_module, "BatchConvertDialog", FakeDialog)
+    monkeypatch.setenv("PARQCEL_FORMAT_CACHE_FILE", str(tmp_path / "formats.json"))
+
+    mw = MainWindow()
+    original = pl.DataFrame({"a": ["1", "2"], "b": ["1.5", "2.5"], "c": ["x", "y"]})
+    mw.model = PolarsTableModel(original, chunk_size=10)
+    mw.table_view.setModel(mw.model)
+
+    mw.handle_batch_convert()
+
+    assert mw.model._data.schema["a"] == pl.Int64
+    assert mw.model._data.schema["b"] == pl.Float64
+    assert mw.model._data.schema["c"] == pl.Utf8
+    mw.model.undo()
+    assert mw.model._data.equals(original)
+
+
+def test_handle_infer_types_converts_all_text_columns(monkeypatch, qapp, tmp_path):
+    import app.main_window as main_window_module
+
+    monkeypatch.setattr(main_window_module, "run_in_background", _run_sync)
+    monkeypatch.setenv("PARQCEL_FORMAT_CACHE_FILE", str(tmp_path / "formats.json"))
+
+    mw = MainWindow()
+    mw.model = PolarsTableModel(
+        pl.DataFrame({"a": ["1", "2"], "d": ["2024-01-31", "2024-02-01"], "c": ["x", "y"]}),
+        chunk_size=10,
+    )
+    mw.table_view.setModel(mw.model)
+
+    mw.handle_infer_types()
+
+    assert mw.model._data.schema["a"] == pl.Int64
+    assert mw.model._data.schema["d"] == pl.Date
+    assert mw.model._data.schema["c"] == pl.Utf8
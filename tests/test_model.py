@@ -92,3 +92,40 @@ def test_set_data_parses_date(qapp):
     index = model.index(0, 0)
     assert model.setData(index, "2024-01-31", role=2) is True
     assert model._data["d"][0] == datetime.date(2024, 1, 31)
+
+
+def test_header_tooltip_shows_cached_sparkline_only(qapp):
+    from PyQt6.QtCore import Qt
+
+    df = pl.DataFrame({"a": [1.0, 2.0, 2.0, 3.0]})
+    model = PolarsTableModel(df, chunk_size=10)
+    tooltip = Qt.ItemDataRole.ToolTipRole
+
+    assert model.headerData(0, Qt.Orientation.Horizontal, tooltip) is None
+
+    model.get_column_statistics("a")
+    assert "█" in model.headerData(0, Qt.Orientation.Horizontal, tooltip)
+
+    model.update_data(df.with_columns(pl.col("a") * 2))
+    assert model.headerData(0, Qt.Orientation.Horizontal, tooltip) is None
+
+
+def test_footer_stats_track_mutations_without_data_access(qapp):
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    model = PolarsTableModel(df, chunk_size=10)
+    assert model.get_footer_stats() == {
+        "row_count": 3,
+        "total_columns": 2,
+        "column_types": "Int64: 1, String: 1",
+    }
+
+    model.add_column("c", 1.5)
+    footer = model.get_footer_stats()
+    assert footer["total_columns"] == 3
+    assert "Float64: 1" in footer["column_types"]
+
+    model.drop_column("a")
+    model.update_data(model.get_dataframe().head(1))
+    footer = model.get_footer_stats()
+    assert footer["row_count"] == 1
+    assert "Int64" not in footer["column_types"]
@@ -21,3 +21,283 @@ def test_parse_single_date_and_datetime():
     dt = parse_single_datetime("2024-01-31T13:45:00")
     assert isinstance(dt, datetime.datetime)
     assert dt.year == 2024 and dt.hour == 13
+
+
+def test_detect_datetime_format_uses_hints_and_prefers_datetime():
+    import polars as pl
+
+    from logic.parsers import detect_datetime_format
+
+    dt = pl.Series(["2024-01-31 10:15:00.250", " 2024-02-01 08:00:00.5 ", None, ""])
+    assert detect_datetime_format(dt) == (pl.Datetime, "%Y-%m-%d %H:%M:%S%.f")
+
+    d = pl.Series(["31-01-2024", "01-02-2024"])
+    assert detect_datetime_format(d) == (pl.Date, "%d-%m-%Y")
+
+    assert detect_datetime_format(pl.Series(["hello", "world"])) is None
+    assert detect_datetime_format(pl.Series([None, None], dtype=pl.Utf8)) is None
+
+
+def test_convert_series_to_datetime_detected_date_format():
+    import polars as pl
+
+    from logic.parsers import convert_series_to_datetime
+
+    out = convert_series_to_datetime(pl.Series("d", ["2024/01/31", "2024/02/29"]))
+    assert out.dtype == pl.Datetime
+    assert out.to_list() == [
+        datetime.datetime(2024, 1, 31),
+        datetime.datetime(2024, 2, 29),
+    ]
+
+
+def test_format_cache_skips_detection_and_persists(tmp_path, monkeypatch):
+    import polars as pl
+
+    import logic.parsers as parsers
+
+    path = str(tmp_path / "formats.json")
+    cache = parsers.FormatCache(path)
+    series = pl.Series("d", ["31/01/2024", "29/02/2024"])
+
+    first = parsers.convert_series_to_datetime(series, format_cache=cache, source="f.csv")
+    cache.save()
+
+    def _fail(sample):
+        raise AssertionError("detection should be skipped on cache hit")
+
+    monkeypatch.setattr(parsers, "_detect_from_sample", _fail)
+    reloaded = parsers.FormatCache(path)
+    second = parsers.convert_series_to_datetime(series, format_cache=reloaded, source="f.csv")
+    assert second.to_list() == first.to_list()
+    assert second[0] == datetime.datetime(2024, 1, 31)
+
+
+def test_convert_mixed_formats_in_one_pass_without_fallback():
+    import polars as pl
+
+    from logic.parsers import convert_series_to_datetime
+
+    series = pl.Series(
+        "d", ["2024-01-31", "12/31/2023", "2024-03-01T12:00:00", None, "31-12-2023"]
+    )
+    out = convert_series_to_datetime(series, allow_fallback=False)
+    assert out.dtype == pl.Datetime
+    assert out.to_list() == [
+        datetime.datetime(2024, 1, 31),
+        datetime.datetime(2023, 12, 31),
+        datetime.datetime(2024, 3, 1, 12),
+        None,
+        datetime.datetime(2023, 12, 31),
+    ]
+
+
+def test_python_fallback_parses_each_distinct_value_once(monkeypatch):
+    import polars as pl
+
+    import logic.parsers as parsers
+
+    calls = []
+    original = parsers.parse_single_datetime
+
+    def counting(value):
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(parsers, "parse_single_datetime", counting)
+    series = pl.Series("d", ["2024-01-31", "garbage", "bad", "garbage"] * 50)
+    out = parsers.convert_series_to_datetime(series)
+    assert sorted(calls) == ["bad", "garbage"]
+    assert out[0] == datetime.datetime(2024, 1, 31)
+    assert out[1] is None
+
+
+def test_low_cardinality_conversion_parses_unique_values_only(monkeypatch):
+    import polars as pl
+
+    import logic.parsers as parsers
+
+    lengths = []
+    original = parsers._try_vectorized_date_parse
+
+    def recording(series, fmt, strict=False):
+        lengths.append(len(series))
+        return original(series, fmt, strict=strict)
+
+    monkeypatch.setattr(parsers, "_try_vectorized_date_parse", recording)
+    series = pl.Series("d", ["2024-01-31", "2024-02-29", None] * 1000)
+    out = parsers.convert_series_to_datetime(series, allow_fallback=False)
+    assert lengths == [3]
+    assert out.name == "d"
+    assert out.len() == 3000
+    assert out.head(3).to_list() == [
+        datetime.datetime(2024, 1, 31),
+        datetime.datetime(2024, 2, 29),
+        None,
+    ]
+
+
+def test_convert_unique_values_maps_results_back():
+    import polars as pl
+
+    from logic.parsers import convert_unique_values, is_low_cardinality
+
+    series = pl.Series("n", ["1", "2", None, "1"] * 10)
+    assert is_low_cardinality(series)
+    out = convert_unique_values(series, lambda values: values.cast(pl.Int64))
+    assert out.dtype == pl.Int64
+    assert out.to_list() == [1, 2, None, 1] * 10
+
+    unique = pl.Series("u", [str(i) for i in range(100)])
+    assert not is_low_cardinality(unique)
+    assert convert_unique_values(unique, lambda v: v.cast(pl.Int64)).to_list() == list(
+        range(100)
+    )
+
+
+def test_parse_datetime_with_report_lists_failed_rows():
+    import polars as pl
+
+    from logic.parsers import parse_datetime_with_report
+
+    series = pl.Series("d", ["2024-01-31", "oops", None, "", "2024-02-01", "oops", "n/a"])
+    parsed, report = parse_datetime_with_report(series)
+    assert parsed.dtype == pl.Datetime
+    assert parsed[0] == datetime.datetime(2024, 1, 31)
+    assert parsed[1] is None
+    assert report.count == 3
+    assert report.sample_values == ["oops", "n/a"]
+    assert report.row_indices.dtype == pl.UInt32
+    assert report.row_indices.to_list() == [1, 5, 6]
+    assert "3 value(s)" in report.summary()
+
+
+def test_convert_offset_timestamps_to_utc():
+    import polars as pl
+
+    from logic.parsers import convert_series_to_datetime
+
+    series = pl.Series(
+        "ts",
+        [
+            "2024-01-31T10:00:00Z",
+            "2024-01-31T10:00:00.5+02:00",
+            "2024-01-31 10:00-0530",
+            None,
+        ],
+    )
+    out = convert_series_to_datetime(series, allow_fallback=False)
+    assert out.dtype == pl.Datetime
+    assert out.to_list() == [
+        datetime.datetime(2024, 1, 31, 10),
+        datetime.datetime(2024, 1, 31, 8, 0, 0, 500000),
+        datetime.datetime(2024, 1, 31, 15, 30),
+        None,
+    ]
+
+
+def test_offset_timestamps_mixed_with_plain_formats():
+    import polars as pl
+
+    from logic.parsers import convert_series_to_datetime
+
+    series = pl.Series("ts", ["2024-01-31", "2024-01-31T10:00:00+01:00"])
+    out = convert_series_to_datetime(series, allow_fallback=False)
+    assert out.to_list() == [datetime.datetime(2024, 1, 31), datetime.datetime(2024, 1, 31, 9)]
+
+
+def test_epoch_units_detected_by_magnitude():
+    import polars as pl
+
+    from logic.parsers import (
+        convert_series_to_datetime,
+        epoch_time_unit,
+        parse_datetime_with_report,
+    )
+
+    expected = datetime.datetime(2024, 1, 31, 10)
+    seconds = 1706695200
+    for values in ([seconds], [seconds * 1000], [seconds * 10**6], [seconds * 10**9]):
+        assert convert_series_to_datetime(pl.Series("e", values))[0] == expected
+    assert convert_series_to_datetime(pl.Series("e", [seconds + 0.25]))[0] == (
+        expected + datetime.timedelta(milliseconds=250)
+    )
+    assert convert_series_to_datetime(pl.Series("e", [str(seconds * 1000), None]))[0] == expected
+    assert epoch_time_unit(1.7e9) == "s"
+    assert epoch_time_unit(1.7e18) == "ns"
+    # Eight-digit numbers and strings are never read as epoch seconds
+    assert convert_series_to_datetime(pl.Series("d", [20240131]))[0] != datetime.datetime(
+        1970, 8, 23, 6, 15, 31
+    )
+    assert parse_datetime_with_report(pl.Series("d", ["20240131"]))[0][0] != datetime.datetime(
+        1970, 8, 23, 6, 15, 31
+    )
+
+
+def test_chunked_parse_validates_first_chunk_and_exits_early(monkeypatch):
+    import polars as pl
+
+    import logic.parsers as parsers
+
+    calls = []
+
+    def parse(chunk):
+        calls.append(len(chunk))
+        return parsers._try_vectorized_date_parse(chunk, "%Y-%m-%d")
+
+    good = pl.Series("d", ["2024-01-31", "2024-02-01", None] * 10)
+    out = parsers._parse_chunked(good, parse, chunk_rows=7, max_workers=2)
+    assert out.len() == 30
+    assert out.n_chunks() == 1
+    assert out.to_list() == parsers._try_vectorized_date_parse(good, "%Y-%m-%d").to_list()
+    assert sorted(calls) == [2, 7, 7, 7, 7]
+
+    calls.clear()
+    bad_first = pl.Series("d", ["31/01/2024"] + ["2024-01-31"] * 29)
+    assert parsers._parse_chunked(bad_first, parse, chunk_rows=7) is None
+    assert calls == [7]
+
+    bad_late = pl.Series("d", ["2024-01-31"] * 29 + ["oops"])
+    assert parsers._parse_chunked(bad_late, parse, chunk_rows=7) is None
+
+    monkeypatch.setattr(parsers, "PARSE_CHUNK_ROWS", 4)
+    out = parsers.convert_series_to_datetime(
+        pl.Series("d", [f"2024-01-{day:02d}" for day in range(1, 29)]), allow_fallback=False
+    )
+    assert out[27] == datetime.datetime(2024, 1, 28)
+
+
+def test_chunked_parse_fails_on_first_finished_bad_chunk():
+    import threading
+
+    import polars as pl
+
+    import logic.parsers as parsers
+
+    release = threading.Event()
+    slow_done = threading.Event()
+
+    def parse(chunk):
+        if chunk[0] == "slow":
+            release.wait(timeout=5)
+            slow_done.set()
+        return parsers._try_vectorized_date_parse(chunk, "%Y-%m-%d")
+
+    values = ["2024-01-31"] * 7 + ["slow"] * 7 + ["2024-01-31"] * 7 + ["oops"] * 7
+    try:
+        assert parsers._parse_chunked(pl.Series("d", values), parse, 7, 2) is None
+        # The failure was reported while the earlier chunk was still parsing
+        assert not slow_done.is_set()
+    finally:
+        release.set()
+
+
+def test_vectorized_parse_strips_padded_values():
+    import polars as pl
+
+    from logic.parsers import _parse_datetime_vectorized
+
+    series = pl.Series("d", [" 2023-01-05", "2023-01-06 ", "2023-01-07"] * 10)
+    parsed = _parse_datetime_vectorized(series)
+    assert parsed.null_count() == 0
+    assert parsed[0] == datetime.datetime(2023, 1, 5)
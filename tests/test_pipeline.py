@@ -0,0 +1,197 @@
+import numpy as np
+import polars as pl
+import pytest
+
+from ds.pipeline import FeaturePipeline
+
+
+def _train():
+    return pl.DataFrame(
+        {
+            "num": [1.0, 2.0, 3.0, 4.0],
+            "cat": ["a", "b", "a", "c"],
+            "text": ["hello world", "foo bar", "hello", "baz qux"],
+        }
+    )
+
+
+def test_pipeline_round_trip_gives_consistent_columns(tmp_path):
+    pipeline = FeaturePipeline(["num"], ["cat"], ["text"])
+    X_fit, names = pipeline.fit_transform(_train(), dense=True)
+
+    path = tmp_path / "pipeline.json"
+    pipeline.save(str(path))
+    loaded = FeaturePipeline.load(str(path))
+
+    batch = pl.DataFrame(
+        {"num": [10.0, None], "cat": ["c", "unseen"], "text": ["hello there", None]}
+    )
+    X_new, new_names = loaded.transform(batch, dense=True)
+    assert new_names == names
+    assert X_new.shape == (2, len(names))
+    # Scaling uses the training statistics, not the batch's
+    assert X_new[0, names.index("num")] == pytest.approx((10.0 - 2.5) / np.std([1, 2, 3, 4]))
+    assert X_new[0, names.index("cat_c")] == 1.0
+    assert X_new[1, [names.index(n) for n in names if n.startswith("cat_")]].sum() == 0.0
+
+    X_again, _ = loaded.transform(_train(), dense=True)
+    np.testing.assert_allclose(X_again, X_fit)
+
+
+def test_pipeline_tfidf_matches_tfidf_vectorizer():
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    df = _train()
+    X, names = FeaturePipeline([], [], ["text"]).fit_transform(df, dense=True)
+    expected = TfidfVectorizer(max_features=200).fit_transform(df["text"].to_list()).toarray()
+    np.testing.assert_allclose(X, expected)
+    assert names[0].startswith("text__tfidf__")
+
+
+def test_pipeline_rejects_missing_columns_and_unfitted_use():
+    pipeline = FeaturePipeline(["num"], [], [])
+    with pytest.raises(ValueError):
+        pipeline.transform(_train())
+    pipeline.fit(_train())
+    with pytest.raises(ValueError, match="num"):
+        pipeline.transform(pl.DataFrame({"other": [1]}))
+
+
+def test_cli_featurize_saves_and_applies_pipeline(tmp_path):
+    from cli import main
+
+    train_path = tmp_path / "train.parquet"
+    _train().write_parquet(train_path)
+    batch_path = tmp_path / "batch.parquet"
+    _train().head(2).write_parquet(batch_path)
+    pipeline_path = tmp_path / "pipeline.json"
+
+    main(["featurize", str(train_path), "--save-pipeline", str(pipeline_path), "-o", str(tmp_path / "a.parquet")])
+    main(["featurize", str(batch_path), "--pipeline", str(pipeline_path), "-o", str(tmp_path / "b.parquet")])
+
+    fitted = pl.read_parquet(tmp_path / "a.parquet")
+    applied = pl.read_parquet(tmp_path / "b.parquet")
+    assert applied.columns == fitted.columns
+    assert applied.equals(fitted.head(2))
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        ["--categorical-encoding", "frequency"],
+        ["--encode", "cat=hash"],
+        ["--target", "num"],
+    ],
+)
+@pytest.mark.parametrize("mode", [["--save-pipeline", "p.json"], ["--streaming"]])
+def test_cli_featurize_rejects_encodings_the_pipeline_cannot_store(tmp_path, capsys, mode, extra):
+    from cli import main
+
+    path = tmp_path / "train.parquet"
+    _train().write_parquet(path)
+    with pytest.raises(SystemExit):
+        main(["featurize", str(path), *mode, *extra, "-o", str(tmp_path / "out.parquet")])
+    assert f"not supported with {mode[0]}" in capsys.readouterr().err
+    assert not (tmp_path / "out.parquet").exists()
+
+
+def test_handle_apply_pipeline_adds_features(monkeypatch, qapp, tmp_path):
+    from PyQt6.QtWidgets import QFileDialog
+
+    import app.main_window as main_window_module
+    from app.main_window import MainWindow
+    from models.polars_table_model import PolarsTableModel
+
+    path = tmp_path / "pipeline.json"
+    FeaturePipeline(["num"], ["cat"], []).fit(_train()).save(str(path))
+
+    monkeypatch.setattr(
+        main_window_module,
+        "run_in_background",
+        lambda owner, func, on_success, on_error, on_finished=None: on_success(func()),
+    )
+    monkeypatch.setattr(
+        QFileDialog, "getOpenFileName", lambda *args, **kwargs: (str(path), "")
+    )
+
+    mw = MainWindow()
+    mw.model = PolarsTableModel(_train().head(2), chunk_size=10)
+    mw.table_view.setModel(mw.model)
+    mw.handle_apply_pipeline()
+
+    assert {"num__feature", "cat_a", "cat_b", "cat_c"} <= set(mw.model._data.columns)
+
+
+def test_fit_lazy_and_transform_to_parquet_match_in_memory_pipeline(tmp_path):
+    df = pl.concat([_train()] * 50).with_columns(
+        (pl.col("num") + pl.int_range(pl.len())).alias("num")
+    )
+    source = tmp_path / "input.parquet"
+    df.write_parquet(source, row_group_size=30)
+    output = tmp_path / "features.parquet"
+
+    streamed = FeaturePipeline(["num"], ["cat"], ["text"]).fit_lazy(pl.scan_parquet(source))
+    streamed.transform_to_parquet(pl.scan_parquet(source), str(output))
+    in_memory = FeaturePipeline(["num"], ["cat"], ["text"]).fit(df)
+
+    assert streamed.feature_names == in_memory.feature_names
+    assert streamed.stats["numeric"]["num"] == pytest.approx(in_memory.stats["numeric"]["num"])
+    from ds.featurize import add_features_to_df
+
+    expected = add_features_to_df(df, *in_memory.transform(df))
+    result = pl.read_parquet(output)
+    assert result.columns == expected.columns
+    np.testing.assert_allclose(
+        result.drop("cat", "text").to_numpy(), expected.drop("cat", "text").to_numpy()
+    )
+
+
+def test_fit_lazy_treats_columns_with_many_late_values_as_text(tmp_path):
+    from ds.featurize import DETECT_SAMPLE_ROWS
+
+    source = tmp_path / "input.parquet"
+    pl.DataFrame(
+        {
+            "few": ["a", "b"] * (DETECT_SAMPLE_ROWS // 2 + 50),
+            # Few values in the detection sample, many after it
+            "late": ["x"] * DETECT_SAMPLE_ROWS + [f"v{i}" for i in range(100)],
+        }
+    ).write_parquet(source)
+
+    pipeline = FeaturePipeline(tfidf_max_features=5).fit_lazy(pl.scan_parquet(source))
+    assert pipeline.categorical_cols == ["few"]
+    assert pipeline.text_cols == ["late"]
+    assert list(pipeline.stats["levels"]) == ["few"]
+
+
+def test_hashing_pipeline_stores_no_vocabulary(tmp_path):
+    from ds.featurize import hashed_text_features
+
+    pipeline = FeaturePipeline([], [], ["text"], text_encoding="hashing", hash_features=16)
+    X, names = pipeline.fit_transform(_train())
+    path = tmp_path / "pipeline.json"
+    pipeline.save(str(path))
+    loaded = FeaturePipeline.load(str(path))
+
+    assert loaded.text_vocabularies == {}
+    assert names == [f"text__hash__{i}" for i in range(16)]
+    X_loaded, _ = loaded.transform(_train())
+    expected = hashed_text_features(_train()["text"], 16).astype(np.float32)
+    assert (X_loaded != expected).nnz == 0
+    assert (X_loaded != X).nnz == 0
+
+
+def test_cli_streaming_featurize_with_hashing(tmp_path):
+    from cli import main
+
+    # Enough distinct values for `detect_columns` to treat "text" as text
+    texts = [f"note {i} about item {i % 7}" for i in range(80)]
+    source = tmp_path / "input.parquet"
+    pl.DataFrame({"num": range(80), "text": texts}).write_parquet(source, row_group_size=16)
+    output = tmp_path / "features.parquet"
+    args = ["--streaming", "--text-encoding", "hashing", "--hash-features", "16"]
+    main(["featurize", str(source), *args, "-o", str(output)])
+
+    result = pl.read_parquet(output)
+    assert result.height == 80
+    assert {f"text__hash__{i}" for i in range(16)} <= set(result.columns)
@@ -12,6 +12,11 @@ from logic.stats import (
     calculate_max_pages,
     get_column_statistics,
     get_column_type_counts_string,
+    compute_column_stats,
+    render_sparkline,
+    StatsCache,
+    HISTOGRAM_BINS,
+    QUANTILE_PROBS,
 )
 
 
@@ -94,3 +99,144 @@ def test_generate_statistics_and_column_helpers():
     type_counts = get_column_type_counts_string(df)
     assert "Int64" in type_counts
     assert "String" in type_counts
+
+
+def test_numeric_stats_include_histogram_and_quantiles():
+    series = pl.Series([1.0, 2.0, 3.0, 4.0, None])
+    result = compute_column_stats(series)
+    assert len(result.histogram) == HISTOGRAM_BINS
+    assert int(result.histogram.sum()) == 4
+    assert len(result.bin_breaks) == HISTOGRAM_BINS
+    assert len(result.quantiles) == len(QUANTILE_PROBS)
+    assert result.quantiles[0] == 1.0
+    assert result.quantiles[-1] == 4.0
+
+
+def test_non_numeric_stats_have_no_histogram():
+    result = compute_column_stats(pl.Series(["a", "b"]))
+    assert result.histogram is None
+    assert render_sparkline(result.histogram) == ""
+
+
+def test_render_sparkline():
+    assert render_sparkline([0, 5, 10]) == "▁▅█"
+    assert render_sparkline([0, 0]) == "▁▁"
+
+
+def test_stats_cache_reuses_and_invalidates():
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    cache = StatsCache()
+    assert cache.peek("a") is None
+
+    first = cache.get(df, "a")
+    assert cache.get(df, "a") is first
+    assert get_column_statistics(df, "a", cache=cache) == first.text()
+
+    cache.invalidate("a")
+    assert cache.peek("a") is None
+
+
+def test_string_top_values_use_top_k_counts():
+    series = pl.Series(["x", "y", "x", "z", "x", "y"])
+    stats = get_string_stats(series)
+    top = stats[stats.index("Top Values:") + 1 :]
+    assert top[0].startswith("x: 3")
+    assert top[1].startswith("y: 2")
+
+
+def test_top_values_short_circuit_for_all_unique_column():
+    series = pl.Series([f"id{i}" for i in range(100)])
+    stats = get_string_stats(series)
+    assert stats[-1] == "All values are unique."
+
+
+def test_mode_reported_once_for_all_unique_numeric_column():
+    stats = get_numeric_stats(pl.Series([3, 1, 2]))
+    assert "Mode: 3" in stats
+
+
+def test_correlation_matrix_matches_numpy_and_chunks():
+    import numpy as np
+
+    from logic.stats import compute_correlation_matrix
+
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=500)
+    b = 2 * a + rng.normal(size=500)
+    df = pl.DataFrame({"a": a, "b": b, "label": ["x"] * 500})
+
+    corr = compute_correlation_matrix(df)
+    assert corr.shape == (2, 2)
+    assert np.allclose(corr, np.corrcoef(a, b), atol=1e-4)
+
+    chunked = compute_correlation_matrix(df, ["a", "b"], chunk_rows=64)
+    assert np.allclose(corr, chunked, atol=1e-5)
+
+    cov = compute_correlation_matrix(df, ["a", "b"], method="covariance")
+    assert np.allclose(cov, np.cov(a, b), atol=1e-3)
+
+
+def test_spearman_correlation_uses_ranks():
+    from logic.stats import compute_correlation_matrix
+
+    df = pl.DataFrame({"x": [1.0, 2.0, 3.0, 4.0, None], "y": [1, 8, 27, 64, 5]})
+    corr = compute_correlation_matrix(df, ["x", "y"], method="spearman")
+    assert abs(corr[0, 1] - 1.0) < 1e-6
+
+
+def test_spearman_ranks_large_integers_exactly():
+    from logic.stats import compute_correlation_matrix
+
+    # Neighbouring values above 2**24 are equal once cast to float32
+    x = [2**25 + i for i in range(6)]
+    df = pl.DataFrame({"x": x, "y": list(reversed(range(6)))})
+    corr = compute_correlation_matrix(df, ["x", "y"], method="spearman")
+    assert abs(corr[0, 1] + 1.0) < 1e-6
+
+
+def test_correlation_rejects_non_numeric_columns(tmp_path):
+    import pytest
+
+    from cli import main
+    from logic.stats import compute_correlation_matrix
+
+    df = pl.DataFrame({"a": [1.0, 2.0], "label": ["x", "y"]})
+    with pytest.raises(ValueError, match="not numeric: label"):
+        compute_correlation_matrix(df, ["a", "label"])
+
+    path = tmp_path / "in.parquet"
+    df.write_parquet(path)
+    with pytest.raises(SystemExit, match="label"):
+        main(["corr", str(path), "-c", "a", "label"])
+
+
+def test_generate_statistics_parallel_matches_serial(caplog):
+    from logic.stats import compute_stats_parallel
+
+    df = pl.DataFrame(
+        {
+            "num": [1.5, 2.5, None, 4.0],
+            "txt": ["a", "b", "b", None],
+            "flag": [True, False, True, None],
+        }
+    )
+
+    class DummyModel:
+        def __init__(self, data):
+            self._data = data
+            self._stats_cache = StatsCache()
+
+    model = DummyModel(df)
+    parallel = generate_statistics(model, parallel=True, max_workers=2)
+    assert parallel == generate_statistics(DummyModel(df), parallel=False)
+    assert model._stats_cache.peek("num") is not None
+    assert "Parallel statistics failed" not in caplog.text
+
+    results = compute_stats_parallel(df, ["num"], max_workers=1)
+    assert len(results["num"].histogram) == HISTOGRAM_BINS
+
+
+def test_top_values_skipped_for_mostly_unique_column():
+    series = pl.Series([f"id{i}" for i in range(95)] + ["id0"] * 5)
+    stats = get_string_stats(series)
+    assert stats[-1] == "Mostly unique values (95 distinct in 100 rows)."